@@ -8,11 +8,18 @@ Shared Python libraries for Thomas's dotfiles tools.
 Modules:
     onedark: OneDark color theme with semantic color assignments
     terminal_ui: Terminal UI components (headers, progress bars, etc.)
+    terminal_ui_async: asyncio companion API (async spinner, prompts,
+                       concurrent subprocess runner); import it directly
+    link_dotfiles: single-pass symlink planner/applier behind
+                   bin/link_dotfiles.zsh; run it with --plan for a dry run
 
 Usage:
     from onedark import *
     from terminal_ui import *
 
+The package re-exports the common names lazily; importing it (or a color
+constant from it) does not load terminal_ui until a UI name is used.
+
 Author: Aria Prime
 Date: 2025-11-24
 """
@@ -20,46 +27,12 @@ Date: 2025-11-24
 __version__ = '1.0.0'
 __author__ = 'Aria Prime'
 
-# Export commonly used functions and constants
-from .onedark import (
-    # Colors
-    ONEDARK_BLUE, ONEDARK_CYAN, ONEDARK_GREEN, ONEDARK_PURPLE,
-    ONEDARK_RED, ONEDARK_YELLOW, ONEDARK_ORANGE, ONEDARK_GRAY,
-    # Semantic colors
-    UI_SUCCESS_COLOR, UI_WARNING_COLOR, UI_ERROR_COLOR, UI_INFO_COLOR,
-    UI_HEADER_COLOR, UI_ACCENT_COLOR, UI_PROGRESS_COLOR,
-    # Sister colors
-    SISTER_PRIME_COLOR, SISTER_NOVA_COLOR, SISTER_PROXIMA_COLOR,
-    THOMAS_COLOR, SYSTEM_COLOR,
-    # Formatting
-    COLOR_RESET, COLOR_BOLD, COLOR_DIM, COLOR_ITALIC, COLOR_UNDERLINE,
-    # Helper functions
-    colorize, bold, success, warning, error, info, header,
-)
-
-from .terminal_ui import (
-    # Terminal control
-    hide_cursor, show_cursor, clear_screen, clear_line,
-    move_cursor_to_line, move_cursor_to, save_cursor, restore_cursor,
-    # Messages
-    print_colored_message, print_success, print_warning, print_error, print_info,
-    # Box drawing
-    draw_header, draw_separator, draw_section_header, print_box,
-    # Progress bars
-    draw_progress_bar, update_progress, increment_progress, reset_progress_cache,
-    # Status display
-    update_status_display, show_status,
-    # Spinner
-    show_spinner,
-    # Input
-    ask_confirmation, wait_for_keypress,
-    # Layout
-    print_centered,
-    # Cleanup
-    cleanup_ui, setup_ui_cleanup,
-)
+from importlib import import_module
 
-__all__ = [
+# Commonly used functions and constants, loaded lazily (PEP 562): a submodule
+# is imported the first time one of its names is accessed, so a script that
+# only needs colors never loads terminal_ui
+_ONEDARK_EXPORTS = (
     # Colors
     'ONEDARK_BLUE', 'ONEDARK_CYAN', 'ONEDARK_GREEN', 'ONEDARK_PURPLE',
     'ONEDARK_RED', 'ONEDARK_YELLOW', 'ONEDARK_ORANGE', 'ONEDARK_GRAY',
@@ -71,25 +44,55 @@ __all__ = [
     'THOMAS_COLOR', 'SYSTEM_COLOR',
     # Formatting
     'COLOR_RESET', 'COLOR_BOLD', 'COLOR_DIM', 'COLOR_ITALIC', 'COLOR_UNDERLINE',
-    # Helper functions from onedark
+    # Helper functions
     'colorize', 'bold', 'success', 'warning', 'error', 'info', 'header',
-    # Terminal control from terminal_ui
+    # Styles and color depth
+    'Style', 'COLOR_DEPTH', 'detect_color_depth',
+)
+
+_TERMINAL_UI_EXPORTS = (
+    # Frame buffering
+    'Frame', 'begin_frame', 'end_frame',
+    # Output sinks
+    'TextSink', 'FdSink', 'BufferSink', 'set_output', 'get_output', 'capture_output',
+    'FrameRecorder',
+    # Terminal control
     'hide_cursor', 'show_cursor', 'clear_screen', 'clear_line',
     'move_cursor_to_line', 'move_cursor_to', 'save_cursor', 'restore_cursor',
-    # Messages from terminal_ui
+    # Messages
     'print_colored_message', 'print_success', 'print_warning', 'print_error', 'print_info',
-    # Box drawing from terminal_ui
+    # Text width
+    'get_display_width', 'get_visible_width',
+    # Box drawing
     'draw_header', 'draw_separator', 'draw_section_header', 'print_box',
-    # Progress bars from terminal_ui
+    # Progress bars
     'draw_progress_bar', 'update_progress', 'increment_progress', 'reset_progress_cache',
-    # Status display from terminal_ui
-    'update_status_display', 'show_status',
-    # Spinner from terminal_ui
-    'show_spinner',
-    # Input from terminal_ui
+    'flush_progress', 'ProgressGroup', 'ProgressBar', 'default_progress_bar',
+    # Status display
+    'update_status_display', 'reset_status_display', 'show_status',
+    # Spinner
+    'show_spinner', 'Spinner', 'draw_spinner_frame', 'draw_spinner_result',
+    # Input
     'ask_confirmation', 'wait_for_keypress',
-    # Layout from terminal_ui
-    'print_centered',
-    # Cleanup from terminal_ui
+    # Layout
+    'print_centered', 'Table',
+    # Cleanup
     'cleanup_ui', 'setup_ui_cleanup',
-]
+)
+
+_LAZY_EXPORTS = dict.fromkeys(_ONEDARK_EXPORTS, 'onedark')
+_LAZY_EXPORTS.update(dict.fromkeys(_TERMINAL_UI_EXPORTS, 'terminal_ui'))
+
+__all__ = list(_ONEDARK_EXPORTS + _TERMINAL_UI_EXPORTS)
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    # Cache it so later lookups don't come back through __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: ranger_devicons lookup over a large directory listing
+======================================================================
+
+Compares the IconResolver behind devicon() against the original
+lookup (exact-name dict, then file.extension dict, with os.path.basename on
+every call) over synthetic listings of 1k to 200k entries. Names mix known
+and unknown extensions, compound suffixes (archive.tar.gz), exact names and
+their case variants (makefile, LICENSE), dotfiles and directories.
+
+A ranger redraw calls devicon() once per visible file, so "first redraw" is
+the cost with empty caches and "redraw" the steady state. The resolver
+uses ranger's precomputed file.basename and file.extension and caches per
+extension, falling back to a bounded per-name cache for the names an
+extension can't answer for, so a redraw should cost no more per file than
+the original lookup at any listing size.
+
+Usage:
+    python3 lib/python/benchmarks/bench_devicons.py [--sizes 1000,100000] [--repeat N]
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)))))
+DEVICONS_PATH = os.path.join(REPO_ROOT, 'user', 'configs', 'utilities', 'ranger',
+                             'ranger.symlink_config', 'plugins', 'ranger_devicons',
+                             'devicons.py')
+
+
+def load_devicons(path: str = DEVICONS_PATH):
+    # devicons imports icon_table from its own directory on first use
+    if os.path.dirname(path) not in sys.path:
+        sys.path.insert(0, os.path.dirname(path))
+    spec = importlib.util.spec_from_file_location('devicons', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_legacy_devicon(devicons):
+    """The original lookup, for comparison"""
+    extensions, exact_matches, dir_matches = devicons.load_tables()
+    resolver = devicons.load_resolver()
+
+    def legacy_devicon(file) -> str:
+        if file.is_directory:
+            return dir_matches.get(file.relative_path, resolver.dir_default)
+        return exact_matches.get(os.path.basename(file.relative_path),
+                                 extensions.get(file.extension, resolver.file_default))
+    return legacy_devicon
+
+
+def make_listing(devicons, size: int, seed: int = 0) -> list:
+    """size ranger-like file objects with a realistic mix of names"""
+    rng = random.Random(seed)
+    extensions, exact_names, dir_names = (sorted(table) for table in devicons.load_tables())
+
+    files = []
+    for i in range(size):
+        kind = rng.random()
+        if kind < 0.10:
+            name = rng.choice(dir_names) if rng.random() < 0.2 else f"dir{i}"
+            files.append(SimpleNamespace(is_directory=True, relative_path=name, basename=name,
+                                         extension=None))
+            continue
+        if kind < 0.60:
+            name = f"file{i}.{rng.choice(extensions)}"
+        elif kind < 0.70:
+            name = f"file{i}.{rng.choice(extensions).upper()}"
+        elif kind < 0.78:
+            name = f"backup{i}.{rng.choice(('tar.gz', 'tar.xz', 'tar.bz2', 'tar.zst'))}"
+        elif kind < 0.84:
+            name = rng.choice(exact_names)
+            name = name.lower() if rng.random() < 0.5 else name
+        elif kind < 0.90:
+            name = f".config{i}rc"
+        elif kind < 0.95:
+            name = f"data{i}.unknownext"
+        else:
+            name = f"script{i}"
+        extension = name.rsplit('.', 1)[1].lower() if '.' in name else None
+        files.append(SimpleNamespace(is_directory=False, relative_path=name, basename=name,
+                                     extension=extension))
+    return files
+
+
+def _redraw_ms(func, files: list, repeat: int) -> float:
+    """Best time in ms for one pass of func over every file"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for file in files:
+            func(file)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', default='1000,10000,100000,200000',
+                        help='comma-separated listing sizes (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='redraws per measurement, best is reported (default: 5)')
+    args = parser.parse_args()
+
+    devicons = load_devicons()
+    legacy_devicon = make_legacy_devicon(devicons)
+    tables = devicons.load_tables()
+
+    print(f"{'entries':>8} {'legacy':>10} {'first redraw':>13} {'redraw':>10} "
+          f"{'legacy/file':>12} {'redraw/file':>12} {'improved':>9}")
+    for size in (int(s) for s in args.sizes.split(',')):
+        files = make_listing(devicons, size)
+        legacy_ms = _redraw_ms(legacy_devicon, files, args.repeat)
+
+        first_ms = float('inf')
+        for _ in range(args.repeat):
+            devicons.resolver = devicons.IconResolver(*tables)
+            first_ms = min(first_ms, _redraw_ms(devicons.devicon, files, 1))
+        redraw_ms = _redraw_ms(devicons.devicon, files, args.repeat)
+
+        # Files the resolver gives a specific icon that the old lookup missed
+        improved = sum(1 for f in files
+                       if legacy_devicon(f) != devicons.devicon(f))
+        print(f"{size:>8} {legacy_ms:>8.2f}ms {first_ms:>11.2f}ms {redraw_ms:>8.2f}ms "
+              f"{legacy_ms / size * 1e6:>10.0f}ns {redraw_ms / size * 1e6:>10.0f}ns "
+              f"{improved:>9}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
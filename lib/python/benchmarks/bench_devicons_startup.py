@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark: ranger_devicons plugin load, eager vs. lazy tables
+=====================================================================
+
+ranger imports every plugin at launch. The devicons plugin used to build
+its icon tables (and import re) right then; now importing devicons only
+defines functions, and icon_table is imported the first time the linemode
+renders.
+
+Each case runs in a fresh interpreter and times only its statement (Python
+startup excluded); the median of --runs is shown:
+
+    before: eager tables      import re, os and build the tables (the old
+                              module body, via icon_table.py)
+    before: tables only       the same with re and os already loaded, as
+                              they are inside ranger
+    after: plugin load        import devicons
+    after: plugin package     import ranger_devicons, everything ranger
+                              loads at launch (devicons, gitstatus, sniff
+                              and the linemodes), with re, subprocess and
+                              threading already loaded as they are in ranger
+    after: first render       import devicons + one devicon() call, with
+                              no bytecode cached (tables compiled from
+                              source) and with icon_table's .pyc cached
+
+Bytecode goes to a temporary PYTHONPYCACHEPREFIX, so the cold case never
+touches the repository's __pycache__. ranger itself isn't needed: the
+package case registers stand-ins for the two ranger modules the plugin's
+__init__.py imports, outside the timed statement.
+
+Usage:
+    python3 lib/python/benchmarks/bench_devicons_startup.py [--runs N]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)))))
+PLUGIN_DIR = os.path.join(REPO_ROOT, 'user', 'configs', 'utilities', 'ranger',
+                          'ranger.symlink_config', 'plugins', 'ranger_devicons')
+
+SETUP = "import time; from types import SimpleNamespace"
+RANGER = ("import sys, types, re, subprocess, threading; "
+          "ranger = types.ModuleType('ranger'); "
+          "ranger.api = types.ModuleType('ranger.api'); ranger.api.register_linemode = lambda cls: cls; "
+          "linemode = types.ModuleType('ranger.core.linemode'); linemode.LinemodeBase = object; "
+          "sys.modules.update({'ranger': ranger, 'ranger.api': ranger.api, "
+          "'ranger.core': types.ModuleType('ranger.core'), 'ranger.core.linemode': linemode})")
+RENDER = ("devicons.devicon(SimpleNamespace(is_directory=False, relative_path='main.py', "
+          "basename='main.py', extension='py'))")
+
+# (label, untimed setup, statement, bytecode cache: None, 'cold' or 'warm')
+CASES = [
+    ('before: eager tables', '', 'import re, os, icon_table', None),
+    ('before: tables only', 'import re, os', 'import icon_table', None),
+    ('after: plugin load', '', 'import devicons', None),
+    ('after: plugin package', RANGER, 'import ranger_devicons', None),
+    ('after: first render (no .pyc)', '', f'import devicons; {RENDER}', 'cold'),
+    ('after: first render (.pyc)', '', f'import devicons; {RENDER}', 'warm'),
+]
+
+
+def time_statement(setup: str, statement: str, pycache: str) -> float:
+    """Microseconds statement takes in a fresh interpreter"""
+    code = (f"{SETUP}; {setup}\nstart = time.perf_counter()\n{statement}\n"
+            f"print((time.perf_counter() - start) * 1e6)")
+    path = os.pathsep.join((PLUGIN_DIR, os.path.dirname(PLUGIN_DIR)))
+    env = dict(os.environ, PYTHONPATH=path, PYTHONPYCACHEPREFIX=pycache)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)       # time loading, not compiling
+    result = subprocess.run([sys.executable, '-c', code], env=env,
+                            capture_output=True, text=True, check=True)
+    return float(result.stdout)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=15,
+                        help='fresh interpreters per case (default: 15)')
+    args = parser.parse_args()
+
+    pycache = tempfile.mkdtemp(prefix='devicons-bench-')
+    try:
+        print(f"{'case':<34} {'median':>10} {'min':>10}")
+        for label, setup, statement, cache in CASES:
+            time_statement(setup, statement, pycache)      # warm the bytecode cache
+            samples = []
+            for _ in range(args.runs):
+                if cache == 'cold':
+                    shutil.rmtree(pycache, ignore_errors=True)
+                samples.append(time_statement(setup, statement, pycache))
+            print(f"{label:<34} {statistics.median(samples):>8.0f}us {min(samples):>8.0f}us")
+    finally:
+        shutil.rmtree(pycache, ignore_errors=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: get_display_width() vs. the original implementation
+=====================================================================
+
+Compares get_display_width() in terminal_ui against the original
+per-character unicodedata loop, on typical UI strings, both ways a string
+can be measured:
+
+    uncached   first sight of a string (LRU miss): one memoized width
+               lookup per character, as for table cells and file names
+    cached     a string measured before (LRU hit), as for repeated UI text
+
+ASCII strings never reach the cache, so both columns time len().
+
+Usage:
+    python3 lib/python/benchmarks/bench_display_width.py [--number N]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+import unicodedata
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import terminal_ui  # noqa: E402
+
+
+def legacy_get_display_width(text: str) -> int:
+    """The original implementation (one unicodedata call per character)"""
+    width = 0
+    for char in text:
+        ea_width = unicodedata.east_asian_width(char)
+        if ea_width in ('W', 'F'):
+            width += 2
+        elif ord(char) >= 0x1F300:
+            width += 2
+        else:
+            width += 1
+    return width
+
+
+SAMPLES = {
+    'ascii header': "Terminal UI Library Demo - Python Port of ui.zsh",
+    'emoji header': "🔗 Dotfiles Symlink Manager 🔗",
+    'status line': "⚠️ Completed with 3 error(s). Check details above.",
+    'cjk': "日本語のテキストと English mixed together",
+    'zwj emoji': "👩‍💻 developer 👍🏽 🇩🇪",
+}
+
+
+def _best_of(func, text: str, number: int, repeat: int = 5) -> float:
+    """Best per-call time in nanoseconds"""
+    timer = timeit.Timer(lambda: func(text))
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--number', type=int, default=20000,
+                        help='calls per timing run (default: 20000)')
+    args = parser.parse_args()
+
+    uncached = terminal_ui._unicode_display_width.__wrapped__
+
+    print(f"{'sample':<14} {'legacy':>10} {'uncached':>10} {'speedup':>8} "
+          f"{'cached':>10} {'speedup':>8}  widths")
+    for name, text in SAMPLES.items():
+        legacy_ns = _best_of(legacy_get_display_width, text, args.number)
+        cached_ns = _best_of(terminal_ui.get_display_width, text, args.number)
+        uncached_ns = (_best_of(uncached, text, args.number)
+                       if not text.isascii() else cached_ns)
+        widths = f"{legacy_get_display_width(text)} -> {terminal_ui.get_display_width(text)}"
+        print(f"{name:<14} {legacy_ns:>8.0f}ns {uncached_ns:>8.0f}ns "
+              f"{legacy_ns / uncached_ns:>7.1f}x {cached_ns:>8.0f}ns "
+              f"{legacy_ns / cached_ns:>7.1f}x  {widths}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Import-time regression check for lib/python
+============================================
+
+Runs each import statement in a fresh interpreter under `python -X importtime`
+and compares the cost against a budget. It also checks that a statement does
+not pull in modules it shouldn't: a script that only needs a color constant
+must not load terminal_ui (the package re-exports names lazily).
+
+The cost of a statement is the cumulative time of every top-level import it
+triggers that an empty interpreter (`-c pass`) does not already load. Each
+case is run once to warm the bytecode cache, then --runs times; the median is
+reported.
+
+Usage:
+    python3 lib/python/benchmarks/check_import_time.py [--runs N] [--scale F]
+
+Exit status is 1 if any case is over budget or imports a forbidden module.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIB_DIR = os.path.dirname(PYTHON_DIR)
+PACKAGE = os.path.basename(PYTHON_DIR)
+
+# (label, sys.path entry, statement, budget in ms, modules that must not load)
+CASES = [
+    ("package", LIB_DIR, f"import {PACKAGE}", 2.0,
+     (f"{PACKAGE}.onedark", f"{PACKAGE}.terminal_ui")),
+    ("package colors", LIB_DIR, f"from {PACKAGE} import COLOR_RESET", 5.0,
+     (f"{PACKAGE}.terminal_ui", "typing")),
+    ("package ui", LIB_DIR, f"from {PACKAGE} import update_progress", 20.0,
+     ("typing", "shutil", "re")),
+    ("flat onedark", PYTHON_DIR, "import onedark", 4.0,
+     ("typing", "functools")),
+    ("flat terminal_ui", PYTHON_DIR, "import terminal_ui", 20.0,
+     ("typing", "shutil", "re")),
+]
+
+
+def run_importtime(path_entry: str, statement: str) -> dict:
+    """Run statement in a fresh interpreter; top-level import costs (us) and all imports"""
+    env = dict(os.environ, PYTHONPATH=path_entry)
+    # Let the warmup run write bytecode, or every run pays for compilation
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            env=env, capture_output=True, text=True, check=True)
+
+    top_level = {}
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue                                # column header
+        imported.add(name.strip())
+        if not name[1:].startswith(" "):
+            top_level[name.strip()] = int(cumulative)
+    return {"top_level": top_level, "imported": imported}
+
+
+def measure(path_entry: str, statement: str, baseline: set, runs: int):
+    """Median cost (ms) of statement beyond the bare interpreter, and what it imported"""
+    run_importtime(path_entry, statement)           # warmup
+    costs = []
+    imported = set()
+    for _ in range(runs):
+        sample = run_importtime(path_entry, statement)
+        costs.append(sum(us for name, us in sample["top_level"].items()
+                         if name not in baseline) / 1000)
+        imported |= sample["imported"] - baseline
+    return statistics.median(costs), imported
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--runs", type=int, default=7,
+                        help="measured runs per case (default: 7)")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="multiply all budgets, e.g. 2 on slow CI machines")
+    args = parser.parse_args()
+
+    baseline = run_importtime(LIB_DIR, "pass")["imported"]
+
+    failures = 0
+    print(f"{'case':<18} {'statement':<40} {'median':>9} {'budget':>9}")
+    for label, path_entry, statement, budget, forbidden in CASES:
+        cost, imported = measure(path_entry, statement, baseline, args.runs)
+        budget *= args.scale
+        leaked = sorted(set(forbidden) & imported)
+
+        status = "ok"
+        if cost > budget:
+            status = "OVER BUDGET"
+        if leaked:
+            status = f"imports {', '.join(leaked)}"
+        if status != "ok":
+            failures += 1
+        print(f"{label:<18} {statement:<40} {cost:>7.2f}ms {budget:>7.2f}ms  {status}")
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Stand-ins for the kitty modules tab_bar.py imports
+===================================================
+
+Lets the kitty tab bar (user/configs/terminals/kitty/kitty.symlink_config/
+tab_bar.py) be imported and driven outside of kitty, e.g. by the benchmark
+suite and the kitty_tab_bar.py harness. Only what tab_bar.py touches is
+modelled: a one-line Screen whose cursor advances by each glyph's cell width
+(and that can record the cells it is drawn into), DrawData/TabBarData/
+ExtraData with OneDark colors, and the as_rgb/color_as_int/draw_title/
+wcswidth helpers.
+
+Usage:
+    from kitty_stubs import load_tab_bar, make_screen, make_draw_data, make_tab
+
+    tab_bar = load_tab_bar()
+    pin_right_status(tab_bar)
+    screen = make_screen(columns=120)
+    tab_bar.draw_tab(make_draw_data(), screen, make_tab("zsh"), 0, 30, 1, True, None)
+    print(screen.line())
+"""
+
+import functools
+import importlib.util
+import os
+import sys
+import types
+import unicodedata
+from typing import NamedTuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)))))
+TAB_BAR_PATH = os.path.join(REPO_ROOT, 'user', 'configs', 'terminals', 'kitty',
+                            'kitty.symlink_config', 'tab_bar.py')
+
+
+class Color(NamedTuple):
+    red: int
+    green: int
+    blue: int
+
+
+class Cursor:
+    __slots__ = ('x', 'y', 'fg', 'bg', 'bold', 'italic')
+
+    def __init__(self):
+        self.x = self.y = 0
+        self.fg = self.bg = 0
+        self.bold = self.italic = False
+
+
+@functools.lru_cache(maxsize=4096)
+def wcswidth(text: str) -> int:
+    """
+    Cells kitty gives text: wide (CJK, emoji) glyphs take 2, combining marks 0
+
+    Stands in for kitty.fast_data_types.wcswidth, the only width function
+    tab_bar.py uses. kitty's is C; caching keeps the stub from dominating
+    timings.
+    """
+    if text.isascii():
+        return len(text)
+    width = 0
+    for char in text:
+        if unicodedata.category(char) in ('Mn', 'Me', 'Cf'):
+            continue
+        width += 2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1
+    return width
+
+
+class Cell(NamedTuple):
+    char: str
+    fg: int = 0
+    bg: int = 0
+    bold: bool = False
+    italic: bool = False
+
+
+BLANK = Cell(' ')
+
+
+class Screen:
+    """
+    One line of cells; the cursor advances by each glyph's cell width
+
+    Every string passed to draw() is kept in drawn. With record_cells the
+    glyphs and cursor attributes are also written into cells (the second
+    half of a wide glyph is an empty cell), so the rendered line can be
+    checked. Without it only the cursor moves, which keeps benchmark timings
+    about the tab bar rather than the stub. Glyphs that don't fit before the
+    last column are dropped and counted in clipped.
+    """
+
+    def __init__(self, columns: int = 120, record_cells: bool = True):
+        self.columns = columns
+        self.cursor = Cursor()
+        self.drawn = []
+        self.cells = [BLANK] * columns if record_cells else None
+        self.clipped = 0
+
+    def draw(self, text: str):
+        self.drawn.append(text)
+        cursor = self.cursor
+        if self.cells is None:
+            x = cursor.x + wcswidth(text)
+            if x > self.columns:
+                self.clipped += x - self.columns
+            cursor.x = min(x, self.columns)
+            return
+
+        for char in text:
+            width = wcswidth(char)
+            if width == 0:
+                continue
+            if cursor.x + width > self.columns:
+                self.clipped += width
+                continue
+            self.cells[cursor.x] = Cell(char, cursor.fg, cursor.bg, cursor.bold, cursor.italic)
+            if width == 2:
+                self.cells[cursor.x + 1] = Cell('', cursor.fg, cursor.bg,
+                                                cursor.bold, cursor.italic)
+            cursor.x += width
+
+    def line(self) -> str:
+        """The recorded cells as text"""
+        return ''.join(cell.char for cell in self.cells)
+
+
+class DrawData(NamedTuple):
+    leading_spaces: int = 1
+    sep: str = ' '
+    trailing_spaces: int = 1
+    max_tab_title_length: int = 30
+    title_template: str = '{title}'
+    active_fg: Color = Color(0xab, 0xb2, 0xbf)
+    active_bg: Color = Color(0x3c, 0x46, 0x53)
+    inactive_fg: Color = Color(0x5c, 0x63, 0x70)
+    inactive_bg: Color = Color(0x28, 0x2c, 0x34)
+    default_bg: Color = Color(0x28, 0x2c, 0x34)
+
+
+class TabBarData(NamedTuple):
+    title: str
+    is_active: bool = False
+    needs_attention: bool = False
+    tab_id: int = 1
+    num_windows: int = 1
+    layout_name: str = 'tall'
+
+
+class ExtraData(NamedTuple):
+    prev_tab: TabBarData = None
+    next_tab: TabBarData = None
+
+
+def as_rgb(x: int) -> int:
+    return (x << 8) | 2
+
+
+def color_as_int(color: Color) -> int:
+    return (color.red << 16) | (color.green << 8) | color.blue
+
+
+def draw_title(draw_data: DrawData, screen: Screen, tab: TabBarData, index: int):
+    screen.draw(draw_data.title_template.format(title=tab.title, index=index))
+
+
+def install():
+    """Register the stub kitty modules in sys.modules (idempotent)"""
+    if 'kitty.tab_bar' in sys.modules:
+        return
+    kitty = types.ModuleType('kitty')
+    fast_data_types = types.ModuleType('kitty.fast_data_types')
+    fast_data_types.Screen = Screen
+    fast_data_types.wcswidth = wcswidth
+    tab_bar = types.ModuleType('kitty.tab_bar')
+    tab_bar.DrawData = DrawData
+    tab_bar.ExtraData = ExtraData
+    tab_bar.TabBarData = TabBarData
+    tab_bar.as_rgb = as_rgb
+    tab_bar.draw_title = draw_title
+    utils = types.ModuleType('kitty.utils')
+    utils.color_as_int = color_as_int
+    rgb = types.ModuleType('kitty.rgb')
+    rgb.Color = Color
+
+    kitty.fast_data_types, kitty.tab_bar, kitty.utils, kitty.rgb = (
+        fast_data_types, tab_bar, utils, rgb)
+    sys.modules.update({
+        'kitty': kitty,
+        'kitty.fast_data_types': fast_data_types,
+        'kitty.tab_bar': tab_bar,
+        'kitty.utils': utils,
+        'kitty.rgb': rgb,
+    })
+
+
+def load_tab_bar(path: str = TAB_BAR_PATH):
+    """Import the kitty tab_bar.py config against the stubs"""
+    install()
+    spec = importlib.util.spec_from_file_location('kitty_config_tab_bar', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def pin_right_status(tab_bar, clock: str = ' 12:34', battery: str = '󰁹 87%'):
+    """Stop the segment worker and show fixed clock/battery values"""
+    registry = tab_bar.segment_registry
+    registry.stop()
+    registry.register('clock', lambda: clock, interval=3600)
+    registry.register('battery', lambda: battery, interval=3600)
+    registry.enable(('clock', 'battery'))
+    registry.refresh_due()
+
+
+def make_screen(columns: int = 120, record_cells: bool = True) -> Screen:
+    return Screen(columns, record_cells)
+
+
+def make_draw_data(**overrides) -> DrawData:
+    return DrawData(**overrides)
+
+
+def make_tab(title: str, is_active: bool = False, **fields) -> TabBarData:
+    return TabBarData(title, is_active, **fields)
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark and regression harness for the kitty tab bar
+==============================================================
+
+Drives draw_tab from user/configs/terminals/kitty/kitty.symlink_config/
+tab_bar.py against kitty_stubs, so the tab bar can be profiled and checked
+on a headless machine before it reaches anyone's kitty. Each scenario lays
+out 1 to 200 tabs the way kitty's TabBar does: one draw_tab call per tab
+with max_title_length = columns // tabs, is_last on the final tab, and an
+ellipsis once the remaining room is smaller than a title.
+
+Per scenario it reports:
+    - per-call draw_tab latency (median, p95, max), from --runs passes on a
+      screen that only tracks the cursor
+    - the strings and cells drawn, from one pass on a screen that records
+      every cell
+
+and checks the recorded line: when every tab fits, no glyph may be clipped
+at the right edge; the cursor must never move backwards between tabs; and
+the line and a hash of the cell colors/attributes must match
+kitty_tab_bar_expected.json. The clock and battery segments are pinned, so
+the output is repeatable.
+
+Usage:
+    python3 lib/python/benchmarks/kitty_tab_bar.py [--runs N] [--json]
+                                                   [--filter TEXT] [--update]
+
+--update rewrites the expected output after an intentional change. Exit
+status is 1 if any check fails.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import statistics
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PYTHON_DIR = os.path.dirname(BENCH_DIR)
+EXPECTED_PATH = os.path.join(BENCH_DIR, 'kitty_tab_bar_expected.json')
+
+sys.path.insert(0, PYTHON_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+import kitty_stubs  # noqa: E402
+import terminal_ui  # noqa: E402
+
+TITLES = ('zsh', 'nvim ~/.dotfiles', 'ranger', 'htop', 'git log --oneline',
+          'python3 -m http.server 8000', 'ssh build-01', 'man zshexpn')
+WIDE_TITLES = ('日本語のメモ', '🔋 power', 'café ☕', '한국어 문서', 'zsh')
+
+# (name, tab count, screen columns, titles)
+SCENARIOS = [
+    ('1 tab', 1, 160, TITLES),
+    ('2 tabs', 2, 160, TITLES),
+    ('5 tabs', 5, 160, TITLES),
+    ('10 tabs', 10, 160, TITLES),
+    ('25 tabs', 25, 160, TITLES),
+    ('50 tabs', 50, 160, TITLES),
+    ('100 tabs', 100, 160, TITLES),
+    ('200 tabs', 200, 160, TITLES),
+    ('5 tabs, wide titles', 5, 160, WIDE_TITLES),
+    ('3 tabs, 60 columns', 3, 60, TITLES),
+    ('200 tabs, 400 columns', 200, 400, TITLES),
+]
+
+# ============================================================================
+# Driving draw_tab
+# ============================================================================
+
+def make_tabs(count: int, titles: tuple) -> list:
+    """count tabs cycling through titles, with the middle one active"""
+    active = count // 2
+    return [kitty_stubs.make_tab(titles[i % len(titles)], is_active=(i == active), tab_id=i + 1)
+            for i in range(count)]
+
+
+def draw_tab_bar(tab_bar, draw_data, screen, tabs: list, timings: list = None) -> dict:
+    """
+    Draw every tab the way kitty's TabBar lays them out
+
+    Args:
+        timings: If given, the seconds each draw_tab call took are appended
+
+    Returns:
+        How many tabs were drawn, whether the last one was reached, and the
+        cursor position each call returned
+    """
+    columns = screen.columns
+    max_title_length = max(1, columns // max(1, len(tabs)))
+    last = len(tabs) - 1
+    ends = []
+    for i, tab in enumerate(tabs):
+        extra_data = kitty_stubs.ExtraData(prev_tab=tabs[i - 1] if i else None,
+                                           next_tab=tabs[i + 1] if i < last else None)
+        before = screen.cursor.x
+        start = time.perf_counter()
+        end = tab_bar.draw_tab(draw_data, screen, tab, before, max_title_length,
+                               i + 1, i == last, extra_data)
+        if timings is not None:
+            timings.append(time.perf_counter() - start)
+        ends.append((before, end))
+        if i < last and screen.cursor.x > columns - max_title_length:
+            screen.cursor.x = columns - 2
+            screen.cursor.bg = 0
+            screen.draw('…')
+            return {'drawn': i + 1, 'reached_last': False, 'ends': ends}
+    return {'drawn': len(tabs), 'reached_last': True, 'ends': ends}
+
+
+def cells_digest(cells: list) -> str:
+    """Short hash of every cell's glyph, colors and attributes"""
+    encoded = json.dumps([list(cell) for cell in cells], ensure_ascii=False)
+    return hashlib.sha1(encoded.encode()).hexdigest()[:16]
+
+
+def run_scenario(tab_bar, count: int, columns: int, titles: tuple, runs: int) -> dict:
+    draw_data = kitty_stubs.make_draw_data()
+    tabs = make_tabs(count, titles)
+
+    timings = []
+    for _ in range(runs):
+        draw_tab_bar(tab_bar, draw_data, kitty_stubs.make_screen(columns, record_cells=False),
+                     tabs, timings)
+    per_call = sorted(t * 1e6 for t in timings)
+
+    screen = kitty_stubs.make_screen(columns)
+    layout = draw_tab_bar(tab_bar, draw_data, screen, tabs)
+    return {
+        'tabs': count,
+        'columns': columns,
+        'tabs_drawn': layout['drawn'],
+        'reached_last': layout['reached_last'],
+        'calls': len(timings),
+        'median_us': statistics.median(per_call),
+        'p95_us': per_call[int((len(per_call) - 1) * 0.95)],
+        'max_us': per_call[-1],
+        'strings_drawn': len(screen.drawn),
+        'cells_drawn': sum(kitty_stubs.wcswidth(text) for text in screen.drawn),
+        'clipped': screen.clipped,
+        'ends': layout['ends'],
+        'line': screen.line(),
+        'digest': cells_digest(screen.cells),
+    }
+
+# ============================================================================
+# Checks
+# ============================================================================
+
+def check(result: dict, expected: dict) -> list:
+    """Problems with one scenario's recorded output (empty if it passed)"""
+    problems = []
+    # With more tabs than fit, the tab cut off by the ellipsis may clip
+    if result['reached_last'] and result['clipped']:
+        problems.append(f"{result['clipped']} cell(s) clipped at the right edge")
+    for before, end in result['ends']:
+        if end < before:
+            problems.append(f"cursor moved back from {before} to {end}")
+            break
+    if expected is None:
+        problems.append("no expected output (run with --update)")
+    elif (result['line'], result['digest']) != (expected['line'], expected['digest']):
+        problems.append("output differs from expected")
+    return problems
+
+
+def load_expected(path: str = EXPECTED_PATH) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+def save_expected(expected: dict, path: str = EXPECTED_PATH):
+    with open(path, 'w', encoding='utf-8') as handle:
+        json.dump(expected, handle, indent=2, ensure_ascii=False)
+        handle.write('\n')
+
+# ============================================================================
+# Main
+# ============================================================================
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=50,
+                        help='timed passes per scenario (default: %(default)s)')
+    parser.add_argument('--json', action='store_true',
+                        help='output results as JSON')
+    parser.add_argument('--filter', default='',
+                        help='only run scenarios whose name contains TEXT')
+    parser.add_argument('--update', action='store_true',
+                        help='rewrite the expected output from this run')
+    parser.add_argument('--tab-bar', default=kitty_stubs.TAB_BAR_PATH,
+                        help='tab_bar.py to load (default: the dotfiles config)')
+    args = parser.parse_args()
+
+    tab_bar = kitty_stubs.load_tab_bar(args.tab_bar)
+    kitty_stubs.pin_right_status(tab_bar)
+
+    results = {}
+    for name, count, columns, titles in SCENARIOS:
+        if args.filter in name:
+            results[name] = run_scenario(tab_bar, count, columns, titles, max(1, args.runs))
+
+    expected = load_expected()
+    if args.update:
+        expected.update({name: {'line': r['line'], 'digest': r['digest']}
+                         for name, r in results.items()})
+        save_expected(expected)
+
+    failures = {name: check(r, expected.get(name)) for name, r in results.items()}
+    failures = {name: problems for name, problems in failures.items() if problems}
+
+    if args.json:
+        report = {name: {k: v for k, v in r.items() if k != 'ends'} for name, r in results.items()}
+        print(json.dumps({'results': report, 'failures': failures}, indent=2, ensure_ascii=False))
+    else:
+        _print_report(results, failures, args)
+    return 1 if failures else 0
+
+
+def _print_report(results: dict, failures: dict, args):
+    terminal_ui.draw_header("Kitty Tab Bar Harness")
+    rows = []
+    for name, r in results.items():
+        rows.append((name, f"{r['tabs_drawn']}/{r['tabs']}", f"{r['median_us']:.1f} µs",
+                     f"{r['p95_us']:.1f} µs", f"{r['max_us']:.1f} µs", str(r['cells_drawn']),
+                     "FAIL" if name in failures else "ok"))
+    terminal_ui.Table(("scenario", "tabs", "median", "p95", "max", "cells", "check"),
+                      max_width=110).render(rows)
+
+    print()
+    for name, problems in failures.items():
+        terminal_ui.print_error(f"{name}: {'; '.join(problems)}")
+    if args.update:
+        terminal_ui.print_success(f"Expected output written to {EXPECTED_PATH}")
+    elif not failures:
+        terminal_ui.print_success(f"{len(results)} scenario(s) match the expected output")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
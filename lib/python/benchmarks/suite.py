@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Python benchmark suite for the dotfiles (companion to bin/benchmark.zsh)
+=========================================================================
+
+Times the Python side of the dotfiles: lib/python (width calculation,
+progress rendering, color helpers, import time), the ranger devicons lookup
+and the kitty tab bar draw path (against kitty_stubs).
+
+Each benchmark is warmed up, then calibrated: calls are batched until one
+sample takes about --sample-time, so fast functions aren't dominated by timer
+resolution and slow ones aren't repeated for minutes. Outliers outside the
+Tukey fences (1.5 IQR) are dropped before median, p95 and p99 are computed.
+
+Import benchmarks don't time the subprocess: interpreter startup alone
+varies by more than the imports cost. Each sample runs the statement under
+`python -X importtime` and sums the cumulative time of the top-level imports
+a bare interpreter (`-c pass`) doesn't load, as check_import_time.py does.
+"import: python startup" is the wall time of that bare interpreter.
+
+--json prints the same shape as `bin/benchmark.zsh --json` (timestamp,
+iterations, results as name -> milliseconds) plus a "stats" object with the
+full distribution per benchmark. A saved run can be used as a baseline:
+medians slower than the baseline by more than --threshold are flagged as
+regressions, and the exit status is 1.
+
+Usage:
+    python3 lib/python/benchmarks/suite.py [--quick] [--json] [--filter TEXT]
+                                           [--baseline FILE] [--save-baseline]
+"""
+
+import argparse
+import datetime
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PYTHON_DIR = os.path.dirname(BENCH_DIR)
+REPO_ROOT = os.path.dirname(os.path.dirname(PYTHON_DIR))
+DEVICONS_PATH = os.path.join(REPO_ROOT, 'user', 'configs', 'utilities', 'ranger',
+                             'ranger.symlink_config', 'plugins', 'ranger_devicons',
+                             'devicons.py')
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'baseline.json')
+
+sys.path.insert(0, PYTHON_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+import check_import_time  # noqa: E402
+import kitty_stubs  # noqa: E402
+import onedark  # noqa: E402
+import terminal_ui  # noqa: E402
+
+# ============================================================================
+# Measurement
+# ============================================================================
+
+def _time_batch(func, number: int) -> float:
+    """Seconds for number calls of func"""
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return time.perf_counter() - start
+
+
+def _percentile(ordered: list, fraction: float) -> float:
+    """Linear-interpolated percentile of an already sorted list"""
+    if len(ordered) == 1:
+        return ordered[0]
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def reject_outliers(samples: list) -> tuple:
+    """Drop samples outside the Tukey fences; returns (kept, rejected count)"""
+    if len(samples) < 4:
+        return list(samples), 0
+    ordered = sorted(samples)
+    q1, q3 = _percentile(ordered, 0.25), _percentile(ordered, 0.75)
+    spread = (q3 - q1) * 1.5
+    kept = [s for s in samples if q1 - spread <= s <= q3 + spread]
+    return kept, len(samples) - len(kept)
+
+
+def measure(func, samples: int = 30, sample_time: float = 0.01,
+            warmup_time: float = 0.05, max_time: float = 2.0) -> dict:
+    """
+    Time func and summarize the per-call distribution
+
+    Args:
+        func: Zero-argument callable to benchmark, or a SelfTimed whose
+            samples are taken as they are
+        samples: Target number of samples
+        sample_time: Aim for this many seconds per sample (sets calls/sample)
+        warmup_time: Run func for this long before measuring
+        max_time: Take fewer samples (at least 5) if they would exceed this
+
+    Returns:
+        Stats in milliseconds per call (median, p95, p99, mean, stdev, min,
+        max), plus calls per sample, samples kept and outliers rejected
+    """
+    if isinstance(func, SelfTimed):
+        return summarize([func.sample() for _ in range(samples)])
+
+    deadline = time.perf_counter() + warmup_time
+    while time.perf_counter() < deadline:
+        func()
+
+    # Calibrate: double the batch until one sample takes long enough
+    number = 1
+    while True:
+        elapsed = _time_batch(func, number)
+        if elapsed >= sample_time or number >= 1 << 20:
+            break
+        number *= 2
+    per_sample = max(elapsed, 1e-9)
+    samples = max(5, min(samples, int(max_time / per_sample)))
+
+    timings = [_time_batch(func, number) / number * 1000 for _ in range(samples)]
+    return summarize(timings, number)
+
+
+class SelfTimed:
+    """A benchmark that measures itself: sample() returns milliseconds"""
+
+    def __init__(self, sample):
+        self.sample = sample
+
+
+def summarize(timings: list, number: int = 1) -> dict:
+    """measure()'s stats for per-call timings in milliseconds"""
+    kept, rejected = reject_outliers(timings)
+    ordered = sorted(kept)
+    return {
+        'median_ms': statistics.median(ordered),
+        'p95_ms': _percentile(ordered, 0.95),
+        'p99_ms': _percentile(ordered, 0.99),
+        'mean_ms': statistics.fmean(ordered),
+        'stdev_ms': statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        'min_ms': ordered[0],
+        'max_ms': ordered[-1],
+        'calls_per_sample': number,
+        'samples': len(kept),
+        'outliers': rejected,
+    }
+
+# ============================================================================
+# Benchmarks
+# ============================================================================
+
+class _NullSink:
+    """Output sink that drops everything (measures formatting, not I/O)"""
+
+    def write(self, text: str):
+        pass
+
+    def flush(self):
+        pass
+
+
+def _python_subprocess(statement: str, path_entry: str = PYTHON_DIR):
+    env = dict(os.environ, PYTHONPATH=path_entry)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)       # time imports, not compilation
+    return lambda: subprocess.run([sys.executable, '-c', statement], env=env, check=True)
+
+
+def _import_cost(statement: str, path_entry: str = PYTHON_DIR) -> SelfTimed:
+    """Import time of statement beyond a bare interpreter, from -X importtime"""
+    baseline = check_import_time.run_importtime(path_entry, 'pass')['imported']
+    check_import_time.run_importtime(path_entry, statement)      # warm the bytecode cache
+
+    def sample() -> float:
+        top_level = check_import_time.run_importtime(path_entry, statement)['top_level']
+        return sum(us for name, us in top_level.items() if name not in baseline) / 1000
+    return SelfTimed(sample)
+
+
+def _progress_full_render():
+    bar = terminal_ui.ProgressBar(total=1000, max_refresh_rate=0)
+    state = {'i': 0}
+
+    def run():
+        state['i'] = i = state['i'] % 1000 + 1
+        bar.update(i)
+    return run
+
+
+def _progress_throttled():
+    bar = terminal_ui.ProgressBar(total=10 ** 9)
+    bar.update(0)
+    state = {'i': 0}
+
+    def run():
+        state['i'] += 1
+        bar.update(state['i'])
+    return run
+
+
+def _devicons():
+    # devicons imports icon_table from its own directory on first use
+    if os.path.dirname(DEVICONS_PATH) not in sys.path:
+        sys.path.insert(0, os.path.dirname(DEVICONS_PATH))
+    spec = importlib.util.spec_from_file_location('devicons', DEVICONS_PATH)
+    devicons = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(devicons)
+
+    files = [SimpleNamespace(is_directory=False, relative_path=name, basename=name,
+                             extension=name.rpartition('.')[2].lower() if '.' in name else None)
+             for name in ('main.py', 'README.md', 'Makefile', 'photo.JPG',
+                          'archive.tar.gz', 'notes', '.zshrc', 'app.tsx')]
+    files.append(SimpleNamespace(is_directory=True, relative_path='node_modules',
+                                 basename='node_modules', extension=None))
+
+    def run():
+        for file in files:
+            devicons.devicon(file)
+    return run
+
+
+def _kitty_draw_tab():
+    tab_bar = kitty_stubs.load_tab_bar()
+    # Measure drawing against a fixed snapshot, without the segment worker
+    kitty_stubs.pin_right_status(tab_bar)
+    draw_data = kitty_stubs.make_draw_data()
+    tabs = [kitty_stubs.make_tab(title, is_active=(index == 1))
+            for index, title in enumerate(('zsh', 'nvim ~/dotfiles', 'ranger', 'htop'), 1)]
+
+    def run():
+        screen = kitty_stubs.make_screen(160, record_cells=False)
+        for index, tab in enumerate(tabs, 1):
+            tab_bar.draw_tab(draw_data, screen, tab, screen.cursor.x, 30,
+                             index, index == len(tabs), None)
+    return run
+
+
+def benchmarks() -> list:
+    """(name, setup) pairs; setup returns the function to time"""
+    width = terminal_ui.get_display_width
+    uncached_width = terminal_ui._unicode_display_width.__wrapped__
+    style = onedark.Style('green', bold=True)
+    return [
+        ('display width: ascii', lambda: lambda: width("Dotfiles Symlink Manager - linking")),
+        ('display width: emoji (cached)', lambda: lambda: width("🔗 Dotfiles 👩‍💻 🇩🇪")),
+        ('display width: emoji (uncached)', lambda: lambda: uncached_width("🔗 Dotfiles 👩‍💻 🇩🇪")),
+        ('progress: full render', _progress_full_render),
+        ('progress: throttled update', _progress_throttled),
+        ('colors: success()', lambda: lambda: onedark.success("Linked 42 files")),
+        ('colors: Style()', lambda: lambda: style("Linked 42 files")),
+        ('colors: Style construction', lambda: lambda: onedark.Style('#61afef', 'bg', italic=True)),
+        ('import: python startup', lambda: _python_subprocess('pass')),
+        ('import: onedark', lambda: _import_cost('import onedark')),
+        ('import: terminal_ui', lambda: _import_cost('import terminal_ui')),
+        ('devicons: lookup (9 files)', _devicons),
+        ('kitty: draw_tab (4 tabs)', _kitty_draw_tab),
+    ]
+
+# ============================================================================
+# Baseline Comparison
+# ============================================================================
+
+def compare(stats: dict, baseline: dict, threshold: float) -> list:
+    """Names whose median regressed by more than threshold vs the baseline"""
+    regressions = []
+    for name, current in stats.items():
+        previous = baseline.get('stats', {}).get(name)
+        if previous and current['median_ms'] > previous['median_ms'] * (1 + threshold):
+            regressions.append(name)
+    return regressions
+
+# ============================================================================
+# Main
+# ============================================================================
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--quick', action='store_true',
+                        help='fewer, shorter samples (smoke test)')
+    parser.add_argument('--json', action='store_true',
+                        help='output results as JSON (benchmark.zsh --json shape)')
+    parser.add_argument('--filter', default='',
+                        help='only run benchmarks whose name contains TEXT')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help='baseline JSON to compare against (default: %(default)s)')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='write this run to the baseline file')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='allowed median slowdown vs baseline (default: 0.25)')
+    args = parser.parse_args()
+
+    samples, sample_time = (10, 0.002) if args.quick else (30, 0.01)
+
+    # Measure the interactive rendering path, without writing to the terminal
+    terminal_ui.PLAIN_MODE = False
+    previous_sink = terminal_ui.set_output(_NullSink())
+    stats = {}
+    try:
+        for name, setup in benchmarks():
+            if args.filter in name:
+                stats[name] = measure(setup(), samples=samples, sample_time=sample_time)
+    finally:
+        terminal_ui.set_output(previous_sink)
+
+    baseline = None
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as handle:
+            baseline = json.load(handle)
+    regressions = compare(stats, baseline, args.threshold) if baseline else []
+
+    report = {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'iterations': samples,
+        'results': {name: round(s['median_ms'], 6) for name, s in stats.items()},
+        'stats': stats,
+        'regressions': regressions,
+    }
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as handle:
+            json.dump(report, handle, indent=2)
+            handle.write('\n')
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(stats, baseline, regressions, args)
+
+    return 1 if regressions else 0
+
+
+def _print_report(stats: dict, baseline: dict, regressions: list, args):
+    terminal_ui.draw_header("Python Performance Benchmarks")
+    rows = []
+    for name, s in stats.items():
+        previous = (baseline or {}).get('stats', {}).get(name)
+        change = (f"{(s['median_ms'] / previous['median_ms'] - 1) * 100:+.0f}%"
+                  if previous else "")
+        if name in regressions:
+            change += " REGRESSION"
+        rows.append((name, _format_ms(s['median_ms']), _format_ms(s['p95_ms']),
+                     _format_ms(s['p99_ms']), str(s['outliers']), change))
+    terminal_ui.Table(("benchmark", "median", "p95", "p99", "outliers", "vs baseline"),
+                      max_width=110).render(rows)
+
+    print()
+    if args.save_baseline:
+        terminal_ui.print_success(f"Baseline saved to {args.baseline}")
+    elif baseline is None:
+        terminal_ui.print_info(f"No baseline at {args.baseline} (create one with --save-baseline)")
+    elif regressions:
+        terminal_ui.print_error(f"{len(regressions)} regression(s) over {args.threshold:.0%}")
+    else:
+        terminal_ui.print_success("No regressions against the baseline")
+
+
+def _format_ms(value: float) -> str:
+    if value >= 1:
+        return f"{value:.2f} ms"
+    if value >= 0.001:
+        return f"{value * 1000:.2f} µs"
+    return f"{value * 1e6:.0f} ns"
+
+
+if __name__ == '__main__':
+    sys.exit(main())
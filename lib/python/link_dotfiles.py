@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+Dotfiles Symlink Engine
+=======================
+
+Plans and creates the dotfiles symlinks for bin/link_dotfiles.zsh.
+
+The repository is walked once with os.scandir (pruning .git, and not
+descending into directories that are themselves linked). Every link
+source is matched to its target and the target is classified with a
+single lstat, giving a complete plan: directories to create, links to
+create, files to back up, stale links to replace and conflicts. The
+plan is then printed (--plan) or applied with a live status display.
+
+When two sources map to the same target, the last one in walk order
+wins (as in the shell linker) and the others are reported as overridden.
+
+Usage:
+    python3 lib/python/link_dotfiles.py [--plan] [--verbose]
+
+Symlink patterns:
+    *.symlink               → ~/.{basename}
+    *.symlink_config        → ~/.config/{basename}
+    *.symlink_local_bin.*   → ~/.local/bin/{basename}
+
+Actions (as shown by --plan):
+    +  link       target is missing, create the symlink
+    ~  backup     target exists, move it to the backup directory first
+    ~  stale      target is a broken link into an old dotfiles location
+    =  unchanged  target already links to the source
+    ?  overridden another source for the same target wins, skip this one
+    !  conflict   target is a broken foreign symlink
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import stat
+import sys
+import time
+from typing import NamedTuple
+
+# Works both as part of the lib/python package and as a flat module
+if __package__:
+    from . import terminal_ui
+    from .onedark import UI_ERROR_COLOR, UI_INFO_COLOR, UI_SUCCESS_COLOR, UI_WARNING_COLOR
+    from .terminal_ui import (
+        clear_screen, draw_header, hide_cursor, print_colored_message, print_error,
+        print_info, print_success, print_warning, show_cursor, update_status_display,
+    )
+else:
+    import terminal_ui
+    from onedark import UI_ERROR_COLOR, UI_INFO_COLOR, UI_SUCCESS_COLOR, UI_WARNING_COLOR
+    from terminal_ui import (
+        clear_screen, draw_header, hide_cursor, print_colored_message, print_error,
+        print_info, print_success, print_warning, show_cursor, update_status_display,
+    )
+
+# ============================================================================
+# Patterns and Actions
+# ============================================================================
+
+HOME = 'home'
+CONFIG = 'config'
+LOCAL_BIN = 'local_bin'
+
+HOME_SUFFIX = '.symlink'
+CONFIG_SUFFIX = '.symlink_config'
+LOCAL_BIN_MARKER = '.symlink_local_bin.'
+
+LINK = 'link'
+BACKUP = 'backup'
+STALE = 'stale'
+UNCHANGED = 'unchanged'
+CONFLICT = 'conflict'
+OVERRIDDEN = 'overridden'
+
+# Broken links into the pre-XDG checkout are replaced instead of reported
+STALE_LINK_MARKER = '/.config/dotfiles/'
+
+PRUNED_DIRS = frozenset(('.git',))
+
+def classify_name(name: str) -> tuple[str, str] | None:
+    """(kind, target name) for a link source name, None for other names"""
+    if name.endswith(HOME_SUFFIX):
+        kind, target = HOME, name[:-len(HOME_SUFFIX)]
+    elif name.endswith(CONFIG_SUFFIX):
+        kind, target = CONFIG, name[:-len(CONFIG_SUFFIX)]
+    else:
+        index = name.find(LOCAL_BIN_MARKER)
+        if index < 0:
+            return None
+        kind, target = LOCAL_BIN, name[:index]
+    return (kind, target) if target else None
+
+def scan_sources(root: str) -> list[tuple[str, str, str]]:
+    """
+    Find every link source below root in one walk
+
+    Returns (kind, source path, target name) tuples, sorted by path within
+    each directory so plans are stable. Symlinks are not followed.
+    """
+    sources = []
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            match = classify_name(entry.name)
+            if match is not None:
+                sources.append((match[0], entry.path, match[1]))
+            elif entry.name not in PRUNED_DIRS and entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+        stack.extend(reversed(subdirs))
+    return sources
+
+# ============================================================================
+# Planning
+# ============================================================================
+
+class Entry(NamedTuple):
+    kind: str
+    source: str
+    target: str
+    action: str
+    backup: str = ''        # where an existing target is moved (BACKUP)
+    detail: str = ''        # old link destination (STALE) or reason (CONFLICT, OVERRIDDEN)
+
+class Plan(NamedTuple):
+    dotfiles_dir: str
+    backup_dir: str
+    directories: list       # to create, in order
+    entries: list
+
+    def count(self, action: str) -> int:
+        return sum(1 for entry in self.entries if entry.action == action)
+
+    def operations(self) -> int:
+        """Steps apply_plan() reports progress for"""
+        backups = self.count(BACKUP) + self.count(STALE)
+        return len(self.directories) + backups + len(self.entries)
+
+def _links_to(target: str, destination: str, source: str) -> bool:
+    """Whether a symlink at target with this destination resolves to source"""
+    if not os.path.isabs(destination):
+        destination = os.path.join(os.path.dirname(target), destination)
+    if os.path.normpath(destination) == source:
+        return True
+    try:
+        return os.path.samefile(target, source)
+    except OSError:
+        return False
+
+def classify_target(source: str, target: str) -> tuple[str, str]:
+    """(action, detail) for linking target to source, from one lstat"""
+    try:
+        st = os.lstat(target)
+    except FileNotFoundError:
+        return LINK, ''
+    except OSError as error:
+        return CONFLICT, error.strerror or str(error)
+
+    if not stat.S_ISLNK(st.st_mode):
+        return BACKUP, ''
+    destination = os.readlink(target)
+    if _links_to(target, destination, source):
+        return UNCHANGED, ''
+    if os.path.exists(target):
+        return BACKUP, ''
+    if STALE_LINK_MARKER in destination:
+        return STALE, destination
+    return CONFLICT, f"broken symlink to {destination}"
+
+def build_plan(dotfiles_dir: str, install_dir: str, backup_dir: str,
+               tmp_dir: str, home: str = None) -> Plan:
+    """Walk dotfiles_dir once and decide what happens to every target"""
+    dotfiles_dir = os.path.abspath(dotfiles_dir)
+    home = home or os.path.expanduser('~')
+    target_dirs = {
+        HOME: install_dir,
+        CONFIG: os.path.join(install_dir, '.config'),
+        LOCAL_BIN: os.path.join(home, '.local', 'bin'),
+    }
+    backup_dirs = {
+        HOME: backup_dir,
+        CONFIG: os.path.join(backup_dir, '.config'),
+        LOCAL_BIN: backup_dir,
+    }
+
+    # Sources by target, in walk order
+    claims = {}
+    for kind, source, name in scan_sources(dotfiles_dir):
+        if kind == HOME:
+            name = '.' + name
+        claims.setdefault(os.path.join(target_dirs[kind], name), []).append((kind, source, name))
+
+    entries = []
+    backups = set()
+    for target, sources in claims.items():
+        # As with the original linker, the last source for a target wins
+        kind, source, name = sources[-1]
+        for other_kind, other_source, _ in sources[:-1]:
+            entries.append(Entry(other_kind, other_source, target, OVERRIDDEN,
+                                 detail=f"overridden by {_relative(source, dotfiles_dir)}"))
+
+        action, detail = classify_target(source, target)
+        backup = ''
+        if action == BACKUP:
+            backup = os.path.join(backup_dirs[kind], name)
+            suffix = 1
+            while backup in backups:
+                backup = os.path.join(backup_dirs[kind], f"{name}.{suffix}")
+                suffix += 1
+            backups.add(backup)
+        entries.append(Entry(kind, source, target, action, backup, detail))
+
+    # Only what is missing; the backup directory only if something is moved
+    wanted = [tmp_dir, target_dirs[CONFIG], target_dirs[LOCAL_BIN]]
+    wanted.extend(sorted({os.path.dirname(path) for path in backups}))
+    directories = []
+    for directory in wanted:
+        if directory not in directories and not os.path.isdir(directory):
+            directories.append(directory)
+    return Plan(dotfiles_dir, backup_dir, directories, entries)
+
+# ============================================================================
+# Plan Display (--plan)
+# ============================================================================
+
+def _relative(path: str, root: str) -> str:
+    return os.path.relpath(path, root) if path.startswith(root + os.sep) else path
+
+def _home_path(path: str) -> str:
+    home = os.path.expanduser('~')
+    return '~' + path[len(home):] if path.startswith(home + os.sep) else path
+
+def print_plan(plan: Plan, verbose: bool = False):
+    """Print the plan as a diff against the current state"""
+    for directory in plan.directories:
+        print_colored_message(UI_SUCCESS_COLOR, f"+ {_home_path(directory)}/\n")
+
+    for entry in plan.entries:
+        target = _home_path(entry.target)
+        source = _relative(entry.source, plan.dotfiles_dir)
+        if entry.action == LINK:
+            print_colored_message(UI_SUCCESS_COLOR, f"+ {target} → {source}\n")
+        elif entry.action == BACKUP:
+            print_colored_message(UI_WARNING_COLOR, f"~ {target} → {source}"
+                                  f"  (backup: {_home_path(entry.backup)})\n")
+        elif entry.action == STALE:
+            print_colored_message(UI_WARNING_COLOR, f"~ {target} → {source}"
+                                  f"  (stale link to {entry.detail})\n")
+        elif entry.action == CONFLICT:
+            print_colored_message(UI_ERROR_COLOR, f"! {target} ← {source}: {entry.detail}\n")
+        elif entry.action == OVERRIDDEN:
+            print_colored_message(UI_WARNING_COLOR, f"? {target} ← {source}: {entry.detail}\n")
+        elif verbose:
+            print_colored_message(UI_INFO_COLOR, f"= {target} → {source}\n")
+
+    print_info(f"{plan.count(LINK)} to link, {plan.count(BACKUP)} to back up, "
+               f"{plan.count(STALE)} stale, {plan.count(UNCHANGED)} unchanged, "
+               f"{plan.count(OVERRIDDEN)} overridden, {plan.count(CONFLICT)} conflicts, "
+               f"{len(plan.directories)} directories")
+
+# ============================================================================
+# Applying
+# ============================================================================
+
+class Results:
+    """Counters and result lines, worded like the zsh implementation"""
+
+    def __init__(self, total: int, line_offset: int, progress: bool = True):
+        self.total = total
+        self.line_offset = line_offset
+        self.progress = progress
+        self.completed = 0
+        self.success = 0
+        self.errors = 0
+        self.lines = []
+
+    def status(self, phase: str, operation: str):
+        if self.progress:
+            update_status_display(phase, operation, self.completed, self.total,
+                                  self.success, self.errors, self.line_offset)
+
+    def done(self, line: str, ok: bool = None):
+        self.lines.append(line)
+        if ok is True:
+            self.success += 1
+        elif ok is False:
+            self.errors += 1
+        self.completed += 1
+
+def apply_plan(plan: Plan, line_offset: int = 10, progress: bool = True) -> Results:
+    """Create directories, move backups and create links, in plan order"""
+    results = Results(plan.operations(), line_offset, progress)
+
+    for directory in plan.directories:
+        results.status("Setup", f"Creating directory: {os.path.basename(directory)}")
+        try:
+            os.makedirs(directory, exist_ok=True)
+            results.done(f"✅ Created directory: {directory}", True)
+        except OSError:
+            results.done(f"❌ Failed to create directory: {directory}", False)
+
+    for entry in plan.entries:
+        name = os.path.basename(entry.source)
+        if entry.action == BACKUP:
+            results.status("Backup", f"Backing up: {os.path.basename(entry.target)}")
+            try:
+                shutil.move(entry.target, entry.backup)
+                results.done(f"📦 Backed up: {entry.target}", True)
+            except OSError:
+                results.done(f"❌ Failed to backup: {entry.target}", False)
+        elif entry.action == STALE:
+            results.status("Backup", f"Removing stale link: {os.path.basename(entry.target)}")
+            try:
+                os.unlink(entry.target)
+                results.done(f"🔄 Removed stale symlink: {os.path.basename(entry.target)}"
+                             f" [was: {entry.detail}]", True)
+            except OSError:
+                results.done(f"❌ Failed to remove stale symlink: {entry.target}", False)
+
+        results.status("Linking", f"Linking: {name}")
+        if entry.action == UNCHANGED:
+            results.done(f"ℹ️  Already exists: {entry.target}")
+        elif entry.action == CONFLICT:
+            results.done(f"❌ Conflict: {entry.target} ({entry.detail})", False)
+        elif entry.action == OVERRIDDEN:
+            results.done(f"⚠️  Skipped: {name} → {entry.target} ({entry.detail})")
+        else:
+            try:
+                os.symlink(entry.source, entry.target)
+                results.done(f"🔗 Created symlink: {name} → {os.path.basename(entry.target)}", True)
+            except OSError:
+                results.done(f"❌ Failed to create symlink: {entry.source} → {entry.target}", False)
+
+    results.status("Done", f"{results.completed} operations")
+    return results
+
+# ============================================================================
+# Display
+# ============================================================================
+
+def _echo(text: str = "", end: str = "\n"):
+    """Uncolored line through the terminal_ui output sink"""
+    print_colored_message("", text + end)
+
+def draw_linking_header():
+    draw_header("🔗 Dotfiles Symlink Manager 🔗", "Enhanced Visual Linking Experience")
+
+def display_results(results: Results, plan: Plan, elapsed: float):
+    """Summary and details, as bin/link_dotfiles.zsh shows them"""
+    clear_screen()
+    draw_linking_header()
+
+    print_success("🎉 Dotfile Linking Complete! 🎉")
+    _echo()
+    print_info("📊 Operation Summary:")
+    _echo("   ", end="")
+    print_success(f"Successful operations: {results.success}")
+    _echo("   ", end="")
+    print_error(f"Failed operations: {results.errors}")
+    _echo("   ", end="")
+    if plan.count(BACKUP):
+        print_info(f"Backup directory: {plan.backup_dir}")
+    else:
+        print_info("Backup directory: (nothing to back up)")
+    _echo("   ", end="")
+    print_info(f"Completed in {elapsed * 1000:.1f} ms")
+    _echo()
+
+    # Detailed results (limited to screen space)
+    print_info("📋 Operation Details:")
+    lines = results.lines
+    shown = lines if len(lines) <= 15 else lines[:10]
+    for line in shown:
+        _echo(f"   {line}")
+    if len(shown) < len(lines):
+        _echo("   ", end="")
+        print_info(f"... and {len(lines) - len(shown)} more operations")
+    _echo()
+
+    if results.errors == 0:
+        print_success("🌟 All operations completed successfully!")
+    else:
+        print_warning(f"Completed with {results.errors} error(s). Check details above.")
+
+# ============================================================================
+# Main
+# ============================================================================
+
+def _default_dotfiles_dir() -> str:
+    return os.environ.get('DF_DIR') or os.path.dirname(os.path.dirname(
+        os.path.dirname(os.path.abspath(__file__))))
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--plan', action='store_true',
+                        help='print what would change and exit (dry run)')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='with --plan, also list unchanged links')
+    parser.add_argument('--dotfiles-dir', default=_default_dotfiles_dir(),
+                        help='repository to link from (default: $DF_DIR)')
+    parser.add_argument('--install-dir', default=os.environ.get('DF_INSTALL_DIR') or
+                        os.path.expanduser('~'),
+                        help='where ~/.* and ~/.config links go (default: $DF_INSTALL_DIR)')
+    parser.add_argument('--backup-dir',
+                        help='where existing targets are moved '
+                             '(default: ~/.tmp/dotfilesBackup-<timestamp>)')
+    args = parser.parse_args(argv)
+
+    home = os.path.expanduser('~')
+    backup_dir = args.backup_dir or os.path.join(
+        home, '.tmp', f"dotfilesBackup-{time.strftime('%Y%m%d-%H%M%S')}")
+    tmp_dir = os.environ.get('DF_TMP_DIR') or os.path.join(home, '.tmp')
+
+    started = time.perf_counter()
+    plan = build_plan(args.dotfiles_dir, args.install_dir, backup_dir, tmp_dir, home)
+
+    if args.plan:
+        print_plan(plan, args.verbose)
+        return 1 if plan.count(CONFLICT) else 0
+
+    hide_cursor()
+    try:
+        clear_screen()
+        draw_linking_header()
+        print_info(f"📁 Dotfiles Directory: {plan.dotfiles_dir}")
+        print_info(f"🏠 Install Directory: {args.install_dir}")
+        print_info(f"💾 Backup Directory: {backup_dir}")
+        _echo()
+
+        # Status block below the header (5 lines) and the info lines (4)
+        results = apply_plan(plan, line_offset=10, progress=not terminal_ui.UI_SILENT)
+        display_results(results, plan, time.perf_counter() - started)
+    finally:
+        show_cursor()
+    return 1 if results.errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
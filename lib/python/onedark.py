@@ -16,42 +16,313 @@ Usage:
     print(f"{ONEDARK_GREEN}Success!{COLOR_RESET}")
     print(f"{UI_ERROR_COLOR}Error occurred{COLOR_RESET}")
 
+    NOTICE = Style('yellow', bold=True)
+    print(NOTICE("Composed once, applied many times"))
+
 Features:
 - Complete OneDark color palette with true color RGB support
 - Semantic color assignments for consistent UI
 - Fallback ANSI colors for older terminals
 - Terminal formatting and cursor control
+- Color depth detection (truecolor, 256, 16, none) with the palette
+  downsampled once through precomputed nearest-color tables
+- Style objects that compose colors and attributes into a cached SGR prefix
 """
 
+from __future__ import annotations
+
+import colorsys
+import os
+import sys
+
+# Explicit, so `from onedark import *` (terminal_ui, scripts) does not pull in
+# the modules imported above or the private helpers
+__all__ = [
+    # Color depth
+    'COLOR_DEPTH_NONE', 'COLOR_DEPTH_16', 'COLOR_DEPTH_256', 'COLOR_DEPTH_TRUECOLOR',
+    'COLOR_DEPTH', 'is_terminal', 'detect_color_depth',
+    # Downsampling
+    'RGB', 'nearest_256', 'nearest_16',
+    # Formatting
+    'COLOR_RESET', 'COLOR_BOLD', 'COLOR_DIM', 'COLOR_ITALIC', 'COLOR_UNDERLINE',
+    # Palette
+    'ONEDARK_RGB', 'ONEDARK_256', 'ONEDARK_16',
+    'ONEDARK_BG', 'ONEDARK_FG', 'ONEDARK_BLUE', 'ONEDARK_CYAN', 'ONEDARK_GREEN',
+    'ONEDARK_PURPLE', 'ONEDARK_RED', 'ONEDARK_YELLOW', 'ONEDARK_ORANGE', 'ONEDARK_GRAY',
+    'ONEDARK_SELECTION', 'ONEDARK_ACCENT',
+    # Styles
+    'Style', 'STYLE_BOLD', 'STYLE_SUCCESS', 'STYLE_WARNING', 'STYLE_ERROR',
+    'STYLE_INFO', 'STYLE_HEADER',
+    # Semantic colors
+    'UI_SUCCESS_COLOR', 'UI_WARNING_COLOR', 'UI_ERROR_COLOR', 'UI_INFO_COLOR',
+    'UI_HEADER_COLOR', 'UI_ACCENT_COLOR', 'UI_PROGRESS_COLOR',
+    'UI_CURRENT_SELECTION', 'UI_SELECTION_BG',
+    'ITEM_LINK_COLOR', 'ITEM_CONTROL_COLOR', 'ITEM_ACTION_COLOR',
+    'ITEM_LIBRARIAN_COLOR', 'ITEM_QUIT_COLOR',
+    # Cursor and screen control
+    'CURSOR_HIDE', 'CURSOR_SHOW', 'CURSOR_HOME', 'SAVE_CURSOR', 'RESTORE_CURSOR',
+    'CLEAR_SCREEN', 'CLEAR_LINE', 'CLEAR_LINE_TO_END', 'CLEAR_TO_END', 'CLEAR_TO_START',
+    # Sister colors
+    'SISTER_PRIME_COLOR', 'SISTER_NOVA_COLOR', 'SISTER_PROXIMA_COLOR',
+    'THOMAS_COLOR', 'SYSTEM_COLOR',
+    # Basic ANSI fallbacks
+    'ANSI_BLACK', 'ANSI_RED', 'ANSI_GREEN', 'ANSI_YELLOW',
+    'ANSI_BLUE', 'ANSI_MAGENTA', 'ANSI_CYAN', 'ANSI_WHITE',
+    'ANSI_BRIGHT_BLACK', 'ANSI_BRIGHT_RED', 'ANSI_BRIGHT_GREEN', 'ANSI_BRIGHT_YELLOW',
+    'ANSI_BRIGHT_BLUE', 'ANSI_BRIGHT_MAGENTA', 'ANSI_BRIGHT_CYAN', 'ANSI_BRIGHT_WHITE',
+    # Helper functions
+    'colorize', 'bold', 'success', 'warning', 'error', 'info', 'header',
+    # Programmatic access
+    'ONEDARK_PALETTE', 'SISTER_COLORS',
+]
+
+# ============================================================================
+# Terminal Color Depth Detection
+# ============================================================================
+
+COLOR_DEPTH_NONE = 0
+COLOR_DEPTH_16 = 16
+COLOR_DEPTH_256 = 256
+COLOR_DEPTH_TRUECOLOR = 1 << 24
+
+def is_terminal(stream=None) -> bool:
+    """True if stream (default: stdout) is attached to a terminal"""
+    if stream is None:
+        stream = sys.stdout
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        # No isatty() (custom stream) or already closed
+        return False
+
+def detect_color_depth(environ=None, stream=None) -> int:
+    """
+    Detect how many colors the terminal supports from COLORTERM/TERM
+
+    NO_COLOR (https://no-color.org) disables color, and so does output that
+    is not a terminal (pipes, files, CI logs) unless FORCE_COLOR is set.
+
+    Args:
+        environ: Mapping to inspect (default: os.environ)
+        stream: Output stream to check with isatty() (default: stdout)
+
+    Returns:
+        One of COLOR_DEPTH_TRUECOLOR, COLOR_DEPTH_256, COLOR_DEPTH_16,
+        COLOR_DEPTH_NONE
+    """
+    if environ is None:
+        environ = os.environ
+    if environ.get('NO_COLOR'):
+        return COLOR_DEPTH_NONE
+    if not environ.get('FORCE_COLOR') and not is_terminal(stream):
+        return COLOR_DEPTH_NONE
+
+    colorterm = environ.get('COLORTERM', '').lower()
+    term = environ.get('TERM', '').lower()
+
+    if colorterm in ('truecolor', '24bit'):
+        return COLOR_DEPTH_TRUECOLOR
+    if environ.get('TERM_PROGRAM') in ('iTerm.app', 'WezTerm', 'vscode'):
+        return COLOR_DEPTH_TRUECOLOR
+    if not term or term == 'dumb':
+        return COLOR_DEPTH_NONE
+    if term.endswith('-direct') or 'kitty' in term or 'truecolor' in term:
+        return COLOR_DEPTH_TRUECOLOR
+    if '256color' in term:
+        return COLOR_DEPTH_256
+    return COLOR_DEPTH_16
+
+# Detected once at import; everything below is rendered for this depth
+COLOR_DEPTH = detect_color_depth()
+
+# ============================================================================
+# Nearest-Color Lookup
+# ============================================================================
+
+RGB = tuple    # (r, g, b), 0-255 each
+
+# xterm 6x6x6 cube levels and the 24-step grayscale ramp (indices 232-255)
+_CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+_GRAY_LEVELS = tuple(8 + 10 * i for i in range(24))
+
+# Hue ranges (degrees) of the ANSI colors: red, yellow, green, cyan, blue, magenta.
+# Matched by hue rather than RGB distance, which would turn every muted
+# OneDark color into gray on a 16-color terminal
+_ANSI_HUE_BOUNDS = ((20, 1), (75, 3), (165, 2), (200, 6), (265, 4), (330, 5), (360, 1))
+
+def _distance(a: RGB, b: RGB) -> int:
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+def _nearest_level(value: int) -> int:
+    return min(range(6), key=lambda i: abs(_CUBE_LEVELS[i] - value))
+
+def _memoize(func):
+    """Unbounded memo for the color lookups (keeps functools off the import path)"""
+    cache = {}
+
+    def wrapper(*args):
+        try:
+            return cache[args]
+        except KeyError:
+            result = cache[args] = func(*args)
+            return result
+
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    return wrapper
+
+@_memoize
+def nearest_256(rgb: RGB) -> int:
+    """Index of the closest xterm-256 color (cube or grayscale ramp)"""
+    r, g, b = (_nearest_level(c) for c in rgb)
+    cube_rgb = (_CUBE_LEVELS[r], _CUBE_LEVELS[g], _CUBE_LEVELS[b])
+    cube_index = 16 + 36 * r + 6 * g + b
+
+    gray = min(range(24), key=lambda i: abs(_GRAY_LEVELS[i] - sum(rgb) // 3))
+    gray_rgb = (_GRAY_LEVELS[gray],) * 3
+
+    if _distance(rgb, gray_rgb) < _distance(rgb, cube_rgb):
+        return 232 + gray
+    return cube_index
+
+@_memoize
+def nearest_16(rgb: RGB) -> int:
+    """Index (0-15) of the closest standard ANSI color"""
+    hue, saturation, value = colorsys.rgb_to_hsv(*(c / 255 for c in rgb))
+    if saturation < 0.3:
+        # Black, bright black (gray), white, bright white
+        return 0 if value < 0.3 else 8 if value < 0.6 else 7 if value < 0.9 else 15
+    degrees = hue * 360
+    for bound, index in _ANSI_HUE_BOUNDS:
+        if degrees < bound:
+            return index
+    return 1
+
+@_memoize
+def _color_params(rgb: RGB, depth: int, background: bool) -> str:
+    """SGR parameters selecting rgb at the given depth ('' for none)"""
+    if depth >= COLOR_DEPTH_TRUECOLOR:
+        return f"{48 if background else 38};2;{rgb[0]};{rgb[1]};{rgb[2]}"
+    if depth >= COLOR_DEPTH_256:
+        return f"{48 if background else 38};5;{nearest_256(rgb)}"
+    if depth >= COLOR_DEPTH_16:
+        index = nearest_16(rgb)
+        base = (40 if background else 30) if index < 8 else (100 if background else 90)
+        return str(base + index % 8)
+    return ''
+
+def _sgr(params: str) -> str:
+    return f"\033[{params}m" if params and COLOR_DEPTH else ''
+
 # ============================================================================
 # Terminal Text Formatting
 # ============================================================================
 
-COLOR_RESET = '\033[0m'
-COLOR_BOLD = '\033[1m'
-COLOR_DIM = '\033[2m'
-COLOR_ITALIC = '\033[3m'
-COLOR_UNDERLINE = '\033[4m'
+COLOR_RESET = _sgr('0')
+COLOR_BOLD = _sgr('1')
+COLOR_DIM = _sgr('2')
+COLOR_ITALIC = _sgr('3')
+COLOR_UNDERLINE = _sgr('4')
 
 # ============================================================================
 # OneDark Color Palette 🎨
 # ============================================================================
 
-# Core OneDark colors (true color RGB support)
-ONEDARK_BG = '\033[48;2;40;44;52m'          # #282c34 - main background
-ONEDARK_FG = '\033[38;2;171;178;191m'       # #abb2bf - default text
-ONEDARK_BLUE = '\033[38;2;97;175;239m'      # #61afef - bright blue
-ONEDARK_CYAN = '\033[38;2;86;182;194m'      # #56b6c2 - cyan
-ONEDARK_GREEN = '\033[38;2;152;195;121m'    # #98c379 - green
-ONEDARK_PURPLE = '\033[38;2;198;120;221m'   # #c678dd - purple/magenta
-ONEDARK_RED = '\033[38;2;224;108;117m'      # #e06c75 - red
-ONEDARK_YELLOW = '\033[38;2;229;192;123m'   # #e5c07b - yellow
-ONEDARK_ORANGE = '\033[38;2;209;154;102m'   # #d19a66 - orange
-ONEDARK_GRAY = '\033[38;2;92;99;112m'       # #5c6370 - comments/subtle
+# Core OneDark colors as RGB
+ONEDARK_RGB = {
+    'bg': (40, 44, 52),             # #282c34 - main background
+    'fg': (171, 178, 191),          # #abb2bf - default text
+    'blue': (97, 175, 239),         # #61afef - bright blue
+    'cyan': (86, 182, 194),         # #56b6c2 - cyan
+    'green': (152, 195, 121),       # #98c379 - green
+    'purple': (198, 120, 221),      # #c678dd - purple/magenta
+    'red': (224, 108, 117),         # #e06c75 - red
+    'yellow': (229, 192, 123),      # #e5c07b - yellow
+    'orange': (209, 154, 102),      # #d19a66 - orange
+    'gray': (92, 99, 112),          # #5c6370 - comments/subtle
+    'selection': (60, 70, 85),      # #3c4653 - selection highlight
+    'accent': (35, 40, 50),         # #232832 - subtle accent
+}
+
+# Precomputed nearest-color tables for terminals without truecolor
+ONEDARK_256 = {name: nearest_256(rgb) for name, rgb in ONEDARK_RGB.items()}
+ONEDARK_16 = {name: nearest_16(rgb) for name, rgb in ONEDARK_RGB.items()}
+
+def _palette_sgr(name: str, background: bool = False) -> str:
+    return _sgr(_color_params(ONEDARK_RGB[name], COLOR_DEPTH, background))
+
+# Core OneDark colors (rendered for the detected color depth)
+ONEDARK_BG = _palette_sgr('bg', background=True)
+ONEDARK_FG = _palette_sgr('fg')
+ONEDARK_BLUE = _palette_sgr('blue')
+ONEDARK_CYAN = _palette_sgr('cyan')
+ONEDARK_GREEN = _palette_sgr('green')
+ONEDARK_PURPLE = _palette_sgr('purple')
+ONEDARK_RED = _palette_sgr('red')
+ONEDARK_YELLOW = _palette_sgr('yellow')
+ONEDARK_ORANGE = _palette_sgr('orange')
+ONEDARK_GRAY = _palette_sgr('gray')
 
 # Interactive UI backgrounds
-ONEDARK_SELECTION = '\033[48;2;60;70;85m'   # #3c4653 - selection highlight
-ONEDARK_ACCENT = '\033[48;2;35;40;50m'      # #232832 - subtle accent
+ONEDARK_SELECTION = _palette_sgr('selection', background=True)
+ONEDARK_ACCENT = _palette_sgr('accent', background=True)
+
+# ============================================================================
+# Style Objects
+# ============================================================================
+
+def _resolve_rgb(color: str | RGB | None) -> RGB | None:
+    """Accept a palette name ('green'), '#rrggbb' or an (r, g, b) tuple"""
+    if color is None or isinstance(color, tuple):
+        return color
+    if color.startswith('#'):
+        return (int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16))
+    return ONEDARK_RGB[color]
+
+class Style:
+    """
+    Foreground, background and attributes composed once into one SGR prefix
+
+    The escape sequence is built at construction for the detected (or given)
+    color depth, so applying a style is just string concatenation.
+
+    Usage:
+        WARN = Style('yellow', bold=True)
+        print(WARN('careful'))
+        print(f"{WARN}careful{WARN.reset}")
+    """
+
+    __slots__ = ('fg', 'bg', 'prefix', 'reset')
+
+    def __init__(self, fg: str | RGB | None = None, bg: str | RGB | None = None,
+                 bold: bool = False, dim: bool = False, italic: bool = False,
+                 underline: bool = False, depth: int | None = None):
+        if depth is None:
+            depth = COLOR_DEPTH
+        self.fg = _resolve_rgb(fg)
+        self.bg = _resolve_rgb(bg)
+
+        params = [code for code, enabled in (('1', bold), ('2', dim),
+                                             ('3', italic), ('4', underline))
+                  if enabled]
+        if self.fg is not None:
+            params.append(_color_params(self.fg, depth, False))
+        if self.bg is not None:
+            params.append(_color_params(self.bg, depth, True))
+        params = ';'.join(p for p in params if p)
+
+        self.prefix = f"\033[{params}m" if params and depth else ''
+        self.reset = '\033[0m' if self.prefix else ''
+
+    def __call__(self, text: str) -> str:
+        """Wrap text in this style with automatic reset"""
+        return self.prefix + text + self.reset
+
+    def __str__(self) -> str:
+        return self.prefix
+
+    def __repr__(self) -> str:
+        return f"Style({self.prefix!r})"
 
 # ============================================================================
 # Semantic Color Assignments
@@ -91,6 +362,7 @@ RESTORE_CURSOR = '\033[u'
 # Screen control
 CLEAR_SCREEN = '\033[2J'
 CLEAR_LINE = '\033[2K'
+CLEAR_LINE_TO_END = '\033[K'
 CLEAR_TO_END = '\033[0J'
 CLEAR_TO_START = '\033[1J'
 
@@ -132,33 +404,43 @@ ANSI_BRIGHT_WHITE = '\033[97m'
 # Helper Functions
 # ============================================================================
 
-def colorize(text: str, color: str) -> str:
-    """Wrap text in color codes with automatic reset"""
-    return f"{color}{text}{COLOR_RESET}"
+# Precompiled styles behind the helpers below
+STYLE_BOLD = Style(bold=True)
+STYLE_SUCCESS = Style('green')
+STYLE_WARNING = Style('yellow')
+STYLE_ERROR = Style('red')
+STYLE_INFO = Style('gray')
+STYLE_HEADER = Style('green', bold=True)
+
+def colorize(text: str, color: str | Style) -> str:
+    """Wrap text in color codes (or a Style) with automatic reset"""
+    if isinstance(color, Style):
+        return color(text)
+    return color + text + COLOR_RESET if color else text
 
 def bold(text: str) -> str:
     """Make text bold"""
-    return f"{COLOR_BOLD}{text}{COLOR_RESET}"
+    return STYLE_BOLD(text)
 
 def success(text: str) -> str:
     """Format as success message (green)"""
-    return colorize(text, UI_SUCCESS_COLOR)
+    return STYLE_SUCCESS(text)
 
 def warning(text: str) -> str:
     """Format as warning message (yellow)"""
-    return colorize(text, UI_WARNING_COLOR)
+    return STYLE_WARNING(text)
 
 def error(text: str) -> str:
     """Format as error message (red)"""
-    return colorize(text, UI_ERROR_COLOR)
+    return STYLE_ERROR(text)
 
 def info(text: str) -> str:
     """Format as info message (gray)"""
-    return colorize(text, UI_INFO_COLOR)
+    return STYLE_INFO(text)
 
 def header(text: str) -> str:
     """Format as header (green, bold)"""
-    return f"{UI_HEADER_COLOR}{COLOR_BOLD}{text}{COLOR_RESET}"
+    return STYLE_HEADER(text)
 
 
 # ============================================================================
@@ -210,4 +492,8 @@ if __name__ == '__main__':
     print(error("✗ Error message"))
     print(info("ℹ Info message"))
 
+    depth_names = {COLOR_DEPTH_TRUECOLOR: 'truecolor', COLOR_DEPTH_256: '256 colors',
+                   COLOR_DEPTH_16: '16 colors', COLOR_DEPTH_NONE: 'no color'}
+    print(f"\n{info('Detected color depth: ' + depth_names[COLOR_DEPTH])}")
+
     print()
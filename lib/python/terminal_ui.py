@@ -24,13 +24,31 @@ Features:
 - Terminal control and cursor management
 - Message printing with automatic color handling
 - Optimized rendering with caching for zero flicker
+- Frame-buffered output (one write per frame) for SSH/tmux
+- Pluggable output sink: any text stream, a raw fd, or an in-memory buffer
+- Headless frame recorder with render-cost metrics (python3 terminal_ui.py --record)
 """
 
+from __future__ import annotations
+
+import functools
+import os
 import sys
+import threading
 import time
-import unicodedata
-from typing import Optional, Tuple
-from onedark import *
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
+from contextlib import ContextDecorator, contextmanager
+from itertools import islice
+
+# Works both as part of the lib/python package and as a flat module
+# (lib/python itself on sys.path)
+if __package__:
+    from .onedark import *
+    from ._unicode_width import WIDTH_RUN_STARTS, WIDTH_RUN_WIDTHS
+else:
+    from onedark import *
+    from _unicode_width import WIDTH_RUN_STARTS, WIDTH_RUN_WIDTHS
 
 # ============================================================================
 # Module State
@@ -39,21 +57,339 @@ from onedark import *
 # Silent mode flag (can be set by scripts)
 UI_SILENT = False
 
-# Global progress tracking variables
-PROGRESS_TOTAL = 100
-PROGRESS_CURRENT = 0
+# Plain mode: stdout is not a terminal (pipe, file, CI log). Cursor control
+# becomes a no-op, spinners don't animate, and progress is logged as one
+# summary line every PROGRESS_PLAIN_STEP percent or PROGRESS_PLAIN_INTERVAL
+# seconds instead of being redrawn in place. Detected once; scripts may
+# override it. (Color is decided separately by onedark, which also honours
+# NO_COLOR.)
+PLAIN_MODE = not is_terminal(sys.stdout)
+PROGRESS_PLAIN_STEP = 10             # percent between plain progress lines
+PROGRESS_PLAIN_INTERVAL = 10.0       # max seconds between plain progress lines
+
+# Defaults for new progress bars (the module-level progress functions use a
+# default ProgressBar instance, see default_progress_bar())
+PROGRESS_MAX_REFRESH_RATE = 20.0    # max redraws per second, 0 disables throttling
+PROGRESS_RATE_SMOOTHING = 0.3       # EWMA factor for the items/sec estimate
+_PROGRESS_RATE_MIN_INTERVAL = 0.05
+
+_monotonic = time.monotonic
+
+# Shadow copy of the last drawn status display (for diff-based repaint)
+_STATUS_LAST_OFFSET = -1
+_STATUS_LAST_ROWS = []
+
+# (phase, percentage, time) of the last plain status line
+_STATUS_PLAIN_LAST = None
+
+# Per-thread frame state (buffer is None outside of a frame), so a render
+# thread's frame never swallows output written by another thread
+class _FrameState(threading.local):
+    # Class-level defaults: reading an unset attribute on a fresh thread finds
+    # these instead of raising (getattr() with a default would pay for an
+    # AttributeError on every write outside a frame)
+    buffer = None
+    depth = 0
+
+_FRAME_STATE = _FrameState()
+
+# ============================================================================
+# Output Sinks
+# ============================================================================
+
+def _encode(text: str, encoding: str) -> bytes:
+    try:
+        return text.encode(encoding)
+    except UnicodeEncodeError:
+        # Never let a stray surrogate or unencodable char crash the UI
+        return text.encode(encoding, 'replace')
+
+class TextSink:
+    """
+    Output to a text stream (default: whatever sys.stdout is at write time,
+    so contextlib.redirect_stdout keeps working)
+    """
+
+    __slots__ = ('stream',)
+
+    def __init__(self, stream=None):
+        self.stream = stream
 
-# Cache for last drawn state (avoid redundant redraws)
-_PROGRESS_LAST_PERCENTAGE = -1
-_PROGRESS_LAST_FILLED = -1
-_PROGRESS_LAST_CURRENT = -1
-_PROGRESS_LAST_TOTAL = -1
-_PROGRESS_LAST_RENDERED = ""
+    def write(self, text: str):
+        (self.stream or sys.stdout).write(text)
 
-# Pre-built character strings for performance
-_PROGRESS_FILLED_CACHE = ""
-_PROGRESS_EMPTY_CACHE = ""
-_PROGRESS_CACHE_WIDTH = 0
+    def flush(self):
+        (self.stream or sys.stdout).flush()
+
+class FdSink:
+    """Output to a raw file descriptor: encoded once, sent with os.write()"""
+
+    __slots__ = ('fd', 'encoding')
+
+    def __init__(self, fd: int, encoding: str = 'utf-8'):
+        self.fd = fd
+        self.encoding = encoding
+
+    def write(self, text: str):
+        data = _encode(text, self.encoding)
+        written = os.write(self.fd, data)
+        if written < len(data):
+            # Short write (pipe or pty buffer full): send the rest
+            view = memoryview(data)
+            while written < len(data):
+                written += os.write(self.fd, view[written:])
+
+    def flush(self):
+        pass
+
+class BufferSink:
+    """
+    Output into a preallocated in-memory buffer (capture for tests/benchmarks)
+
+    A bytearray grows when full; a fixed memoryview raises BufferError.
+
+    Usage:
+        with capture_output() as sink:
+            update_progress(50, 100)
+        assert b"50%" in sink.getvalue()
+    """
+
+    __slots__ = ('_buffer', '_view', '_capacity', 'length', 'writes', 'encoding')
+
+    def __init__(self, buffer: bytearray | memoryview = None, size: int = 65536,
+                 encoding: str = 'utf-8'):
+        self._buffer = bytearray(size) if buffer is None else buffer
+        self._view = memoryview(self._buffer).cast('B')
+        self._capacity = len(self._view)
+        self.length = 0
+        self.writes = 0
+        self.encoding = encoding
+
+    def write(self, text: str):
+        data = _encode(text, self.encoding)
+        start = self.length
+        end = start + len(data)
+        if end > self._capacity:
+            self._grow(end)
+        self._view[start:end] = data
+        self.length = end
+        self.writes += 1
+
+    def _grow(self, needed: int):
+        if not isinstance(self._buffer, bytearray):
+            raise BufferError(f"output buffer full ({self._capacity} bytes)")
+        self._view.release()
+        self._buffer.extend(bytes(max(needed, 2 * self._capacity) - self._capacity))
+        self._view = memoryview(self._buffer)
+        self._capacity = len(self._buffer)
+
+    def flush(self):
+        pass
+
+    def getvalue(self) -> bytes:
+        """Everything written since the last clear()"""
+        return bytes(self._view[:self.length])
+
+    def clear(self):
+        """Discard the captured output (keeps the allocation)"""
+        self.length = 0
+        self.writes = 0
+
+# Where all UI output goes (see set_output())
+_SINK = TextSink()
+
+def set_output(target):
+    """
+    Send all terminal_ui output to target; returns the previous sink
+
+    Args:
+        target: A sink (TextSink/FdSink/BufferSink or any object with
+                write(str) and flush()), a text stream, a file descriptor,
+                a bytearray/memoryview buffer, or None for sys.stdout
+
+    PLAIN_MODE is not re-detected; set it explicitly if needed.
+    """
+    global _SINK
+
+    if target is None:
+        sink = TextSink()
+    elif isinstance(target, int):
+        sink = FdSink(target)
+    elif isinstance(target, (bytearray, memoryview)):
+        sink = BufferSink(target)
+    elif isinstance(target, (TextSink, FdSink, BufferSink)):
+        sink = target
+    else:
+        sink = TextSink(target)
+
+    previous = _SINK
+    _SINK = sink
+    return previous
+
+def get_output():
+    """The sink currently receiving terminal_ui output"""
+    return _SINK
+
+@contextmanager
+def capture_output(size: int = 65536):
+    """Temporarily capture all UI output in a BufferSink (yields the sink)"""
+    sink = BufferSink(size=size)
+    previous = set_output(sink)
+    try:
+        yield sink
+    finally:
+        set_output(previous)
+
+class FrameRecorder:
+    """
+    Sink that records every write (one per frame) with a timestamp
+
+    Measures what a UI sequence costs without looking at a terminal: bytes
+    and writes, writes per second, redundant frames (repaints identical to
+    the write before, e.g. from a defeated progress cache) and the effective repaint rate
+    (frames that changed something, per second). Output is passed on to
+    `sink` if given, otherwise discarded.
+
+    Usage:
+        with FrameRecorder() as recorder:
+            for i in range(101):
+                update_progress(i, 100)
+        print(recorder.summary())
+    """
+
+    def __init__(self, sink=None, encoding: str = 'utf-8'):
+        self.sink = sink
+        self.encoding = encoding
+        self.frames = []                     # (seconds since start, bytes, text)
+        self.redundant = 0
+        self._start = _monotonic()
+        self._stop = None
+        self._previous = None
+        self._last_text = None
+
+    def write(self, text: str):
+        self.frames.append((_monotonic() - self._start,
+                            len(_encode(text, self.encoding)), text))
+        # A repaint (\r or escape sequence) identical to the previous write
+        # changed nothing on screen
+        if text == self._last_text and ('\r' in text or '\x1b' in text):
+            self.redundant += 1
+        self._last_text = text
+        if self.sink is not None:
+            self.sink.write(text)
+
+    def flush(self):
+        if self.sink is not None:
+            self.sink.flush()
+
+    def start(self):
+        """Install as the output sink and start the clock"""
+        self.frames = []
+        self.redundant = 0
+        self._last_text = None
+        self._start = _monotonic()
+        self._stop = None
+        self._previous = set_output(self)
+
+    def stop(self):
+        """Stop recording and restore the previous sink"""
+        self._stop = _monotonic()
+        if self._previous is not None:
+            set_output(self._previous)
+            self._previous = None
+
+    def summary(self) -> dict:
+        """Machine-readable render-cost metrics (JSON-serializable)"""
+        end = self._stop if self._stop is not None else _monotonic()
+        duration = end - self._start
+        count = len(self.frames)
+        total_bytes = sum(size for _, size, _ in self.frames)
+        gaps = [later[0] - earlier[0] for earlier, later in zip(self.frames, self.frames[1:])]
+        return {
+            'duration_s': round(duration, 4),
+            'writes': count,
+            'bytes': total_bytes,
+            'bytes_per_write': round(total_bytes / count, 1) if count else 0,
+            'max_write_bytes': max((size for _, size, _ in self.frames), default=0),
+            'writes_per_second': round(count / duration, 1) if duration > 0 else 0,
+            'redundant_frames': self.redundant,
+            'effective_repaint_rate': (round((count - self.redundant) / duration, 1)
+                                       if duration > 0 else 0),
+            'min_frame_interval_ms': round(min(gaps) * 1000, 3) if gaps else None,
+        }
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+# ============================================================================
+# Output and Frame Buffering
+# ============================================================================
+
+def _write(text: str, flush: bool = False):
+    """Write text to the output sink, or append it to the active frame buffer"""
+    buffer = _FRAME_STATE.buffer
+    if buffer is not None:
+        buffer.append(text)
+        return
+    _SINK.write(text)
+    if flush:
+        _SINK.flush()
+
+def begin_frame():
+    """
+    Start collecting all UI output into a single frame buffer
+
+    Every escape sequence and text fragment written by this library until
+    the matching end_frame() is joined and sent with one write, which avoids
+    tearing over SSH/tmux. Frames nest; only the outermost end_frame()
+    writes to the terminal. Frames are tracked per thread.
+    """
+    depth = _FRAME_STATE.depth
+    if depth == 0:
+        _FRAME_STATE.buffer = []
+    _FRAME_STATE.depth = depth + 1
+
+def end_frame():
+    """Finish the current frame and flush it to the output sink in a single write"""
+    depth = _FRAME_STATE.depth
+    if depth == 0:
+        return
+    _FRAME_STATE.depth = depth - 1
+    if depth > 1:
+        return
+
+    payload = ''.join(_FRAME_STATE.buffer)
+    _FRAME_STATE.buffer = None
+    if payload:
+        _SINK.write(payload)
+        _SINK.flush()
+
+class Frame(ContextDecorator):
+    """
+    Context manager (and decorator) for frame-buffered output
+
+    Usage:
+        with Frame():
+            move_cursor_to(5, 1)
+            clear_line()
+            print_success("Done")
+
+        @Frame()
+        def redraw(): ...
+    """
+
+    def __enter__(self):
+        begin_frame()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        end_frame()
+        return False
 
 # ============================================================================
 # Terminal Control Functions
@@ -61,35 +397,52 @@ _PROGRESS_CACHE_WIDTH = 0
 
 def hide_cursor():
     """Hide terminal cursor"""
-    print(CURSOR_HIDE, end='', flush=True)
+    if PLAIN_MODE:
+        return
+    _write(CURSOR_HIDE, flush=True)
 
 def show_cursor():
     """Show terminal cursor"""
-    print(CURSOR_SHOW, end='', flush=True)
+    if PLAIN_MODE:
+        return
+    _write(CURSOR_SHOW, flush=True)
 
 def clear_screen():
     """Clear entire screen and move to home"""
-    print(f"{CLEAR_SCREEN}{CURSOR_HOME}", end='', flush=True)
+    reset_status_display()
+    if PLAIN_MODE:
+        return
+    _write(f"{CLEAR_SCREEN}{CURSOR_HOME}", flush=True)
 
 def clear_line():
     """Clear current line"""
-    print(CLEAR_LINE, end='', flush=True)
+    if PLAIN_MODE:
+        return
+    _write(CLEAR_LINE, flush=True)
 
 def move_cursor_to_line(line: int):
     """Move cursor to specific line"""
-    print(f"\033[{line};1H", end='', flush=True)
+    if PLAIN_MODE:
+        return
+    _write(f"\033[{line};1H", flush=True)
 
 def move_cursor_to(line: int, column: int):
     """Move cursor to specific position"""
-    print(f"\033[{line};{column}H", end='', flush=True)
+    if PLAIN_MODE:
+        return
+    _write(f"\033[{line};{column}H", flush=True)
 
 def save_cursor():
     """Save current cursor position"""
-    print(SAVE_CURSOR, end='', flush=True)
+    if PLAIN_MODE:
+        return
+    _write(SAVE_CURSOR, flush=True)
 
 def restore_cursor():
     """Restore saved cursor position"""
-    print(RESTORE_CURSOR, end='', flush=True)
+    if PLAIN_MODE:
+        return
+    _write(RESTORE_CURSOR, flush=True)
 
 # ============================================================================
 # Message Display Functions
@@ -97,7 +450,7 @@ def restore_cursor():
 
 def print_colored_message(color: str, message: str):
     """Display a colored message with automatic color reset"""
-    print(f"{color}{message}{COLOR_RESET}", end='')
+    _write(f"{color}{message}{COLOR_RESET}")
 
 def print_status_message(color: str, emoji: str, message: str):
     """Display a status message with emoji and color"""
@@ -131,30 +484,115 @@ def print_info(message: str):
 # Text Width Calculation Functions
 # ============================================================================
 
-def get_display_width(text: str) -> int:
-    """
-    Calculate the display width of text (handles emojis and Unicode)
+# ANSI CSI sequences (colors, cursor movement) and OSC sequences (titles, links)
+_ANSI_ESCAPE_PATTERN = r'\x1b\[[0-?]*[ -/]*[@-~]|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)'
+_ANSI_ESCAPE_RE = None      # compiled on first use; `re` is costly to import
+
+# Code points with special meaning inside grapheme clusters
+_ZERO_WIDTH_JOINER = 0x200D
+_EMOJI_PRESENTATION = 0xFE0F           # VS16: render the preceding char as emoji
+_SKIN_TONE_FIRST, _SKIN_TONE_LAST = 0x1F3FB, 0x1F3FF
+_REGIONAL_FIRST, _REGIONAL_LAST = 0x1F1E6, 0x1F1FF
+
+# Width per character seen so far, or one of the negative kinds below for
+# the grapheme specials: a text uses few distinct code points, so strings
+# missing the LRU below cost one dict lookup per character, not a bisect
+_CHAR_WIDTHS: dict[str, int] = {}
+_JOINER, _PRESENTATION, _REGIONAL, _SKIN_TONE = -1, -2, -3, -4
+
+def _char_width(char: str) -> int:
+    """Width (or special kind) of one character, memoized in _CHAR_WIDTHS"""
+    code_point = ord(char)
+    if code_point == _ZERO_WIDTH_JOINER:
+        width = _JOINER
+    elif code_point == _EMOJI_PRESENTATION:
+        width = _PRESENTATION
+    elif _REGIONAL_FIRST <= code_point <= _REGIONAL_LAST:
+        width = _REGIONAL
+    elif _SKIN_TONE_FIRST <= code_point <= _SKIN_TONE_LAST:
+        width = _SKIN_TONE
+    else:
+        width = WIDTH_RUN_WIDTHS[bisect_right(WIDTH_RUN_STARTS, code_point) - 1]
+    _CHAR_WIDTHS[char] = width
+    return width
 
-    This function accounts for emoji characters that may display as 2 columns.
-    Uses unicodedata to detect wide characters.
-    """
+@functools.lru_cache(maxsize=2048)
+def _unicode_display_width(text: str) -> int:
+    """Grapheme-aware width of non-ASCII text (memoized)"""
+    char_widths = _CHAR_WIDTHS
     width = 0
+    previous = 0            # width of the last visible character
+    pending = 0             # 1 after a zero width joiner, 2 after an unpaired flag half
+
     for char in text:
-        # Get the East Asian Width property
-        ea_width = unicodedata.east_asian_width(char)
-
-        # Wide (W) and Fullwidth (F) characters take 2 columns
-        # Emoji modifier sequences and flags also take 2 columns
-        if ea_width in ('W', 'F'):
-            width += 2
-        # Check if it's an emoji (simplified heuristic)
-        elif ord(char) >= 0x1F300:  # Most emojis start here
-            width += 2
-        else:
+        # Everything below the combining marks block is a plain narrow char
+        if char < '\u0300':
             width += 1
+            previous = 1
+            pending = 0
+            continue
+
+        # ZWJ sequences (👩‍💻) render as the first emoji only
+        if pending == 1:
+            pending = 0
+            continue
+
+        char_width = char_widths.get(char)
+        if char_width is None:
+            char_width = _char_width(char)
+        if char_width >= 0:
+            pending = 0
+            if char_width:
+                width += char_width
+                previous = char_width
+            continue
+
+        if char_width == _JOINER:
+            pending = 1
+        elif char_width == _PRESENTATION:
+            # VS16 turns a narrow symbol (⚠, ℹ) into a 2-column emoji
+            if previous == 1:
+                width += 1
+                previous = 2
+        elif char_width == _REGIONAL:
+            # Flags are pairs of regional indicators sharing 2 columns
+            if pending != 2:
+                width += 2
+                previous = 2
+            pending = 0 if pending == 2 else 2
+        else:
+            # Skin tone modifiers merge into the emoji before them
+            pending = 0
+            if previous != 2:
+                width += 2
+                previous = 2
 
     return width
 
+def get_display_width(text: str) -> int:
+    """
+    Calculate the display width of text (handles emojis and Unicode)
+
+    ASCII text is measured with len(). Anything else is looked up in a
+    precomputed width table (see _unicode_width.py) with grapheme cluster
+    handling for VS16 emoji (⚠️), ZWJ sequences, skin tones and flags,
+    and the result is memoized for repeated strings.
+    """
+    if text.isascii():
+        return len(text)
+    return _unicode_display_width(text)
+
+def get_visible_width(text: str) -> int:
+    """Display width of text that may contain ANSI escape sequences"""
+    global _ANSI_ESCAPE_RE
+
+    if '\x1b' in text:
+        if _ANSI_ESCAPE_RE is None:
+            import re
+            _ANSI_ESCAPE_RE = re.compile(_ANSI_ESCAPE_PATTERN)
+        text = _ANSI_ESCAPE_RE.sub('', text)
+    return get_display_width(text)
+
 def get_safe_display_width(text: str) -> int:
     """Safe display width calculation with fallback"""
     try:
@@ -167,6 +605,7 @@ def get_safe_display_width(text: str) -> int:
 # Header and Box Drawing Functions
 # ============================================================================
 
+@Frame()
 def draw_header(title: str, subtitle: str = "", width: int = 78):
     """
     Draw a beautiful header with box drawing characters
@@ -176,32 +615,32 @@ def draw_header(title: str, subtitle: str = "", width: int = 78):
         subtitle: Optional subtitle text
         width: Total width of the box (default 78)
     """
-    print(f"{COLOR_BOLD}{UI_HEADER_COLOR}", end='')
+    _write(f"{COLOR_BOLD}{UI_HEADER_COLOR}")
 
     # Top border
-    print(f"╔{'═' * (width - 2)}╗")
+    _write(f"╔{'═' * (width - 2)}╗\n")
 
     # Title line (centered with proper emoji alignment)
     title_display_width = get_safe_display_width(title)
     title_left_padding = (width - title_display_width - 2) // 2
     title_right_padding = width - title_display_width - 2 - title_left_padding
-    print(f"║{' ' * title_left_padding}{title}{' ' * title_right_padding}║")
+    _write(f"║{' ' * title_left_padding}{title}{' ' * title_right_padding}║\n")
 
     # Subtitle line (if provided)
     if subtitle:
         subtitle_display_width = get_safe_display_width(subtitle)
         subtitle_left_padding = (width - subtitle_display_width - 2) // 2
         subtitle_right_padding = width - subtitle_display_width - 2 - subtitle_left_padding
-        print(f"║{' ' * subtitle_left_padding}{subtitle}{' ' * subtitle_right_padding}║")
+        _write(f"║{' ' * subtitle_left_padding}{subtitle}{' ' * subtitle_right_padding}║\n")
 
     # Bottom border
-    print(f"╚{'═' * (width - 2)}╝")
+    _write(f"╚{'═' * (width - 2)}╝\n")
 
-    print(f"{COLOR_RESET}\n", end='')
+    _write(f"{COLOR_RESET}\n")
 
 def draw_separator(width: int = 78, char: str = '─'):
     """Draw a simple separator line"""
-    print(f"{UI_INFO_COLOR}{'─' * width}{COLOR_RESET}")
+    _write(f"{UI_INFO_COLOR}{'─' * width}{COLOR_RESET}\n")
 
 def draw_section_header(title: str, color: str = None):
     """
@@ -210,45 +649,15 @@ def draw_section_header(title: str, color: str = None):
     """
     if color is None:
         color = UI_ACCENT_COLOR
-    print(f"\n{color}{COLOR_BOLD}═══ {title} ═══{COLOR_RESET}")
+    _write(f"\n{color}{COLOR_BOLD}═══ {title} ═══{COLOR_RESET}\n")
 
 # ============================================================================
 # Progress Bar System (Optimized for minimal repaints and zero flicker)
 # ============================================================================
 
-def _build_progress_chars(width: int, filled_char: str = '█', empty_char: str = '░'):
-    """Build filled/empty character strings (called once per width)"""
-    global _PROGRESS_FILLED_CACHE, _PROGRESS_EMPTY_CACHE, _PROGRESS_CACHE_WIDTH
-
-    # Only rebuild if width changed
-    if width != _PROGRESS_CACHE_WIDTH:
-        _PROGRESS_FILLED_CACHE = filled_char * width
-        _PROGRESS_EMPTY_CACHE = empty_char * width
-        _PROGRESS_CACHE_WIDTH = width
-
-def draw_progress_bar(current: int = None, total: int = None,
-                      width: int = 50, filled_char: str = '█',
-                      empty_char: str = '░') -> str:
-    """
-    Draw a beautiful progress bar (optimized version)
-
-    Args:
-        current: Current progress value (default: PROGRESS_CURRENT)
-        total: Total value (default: PROGRESS_TOTAL)
-        width: Width of the progress bar in characters
-        filled_char: Character for filled portion
-        empty_char: Character for empty portion
-
-    Returns:
-        Formatted progress bar string
-    """
-    global PROGRESS_CURRENT, PROGRESS_TOTAL
-
-    if current is None:
-        current = PROGRESS_CURRENT
-    if total is None:
-        total = PROGRESS_TOTAL
-
+def _format_progress_text(current: int, total: int, width: int,
+                          filled_cache: str, empty_cache: str) -> str:
+    """Build the uncolored progress bar text, e.g. '[███░░]  60% (3/5)'"""
     # Safety checks
     current = max(0, current)
     total = max(1, total)
@@ -266,87 +675,522 @@ def draw_progress_bar(current: int = None, total: int = None,
         filled = 0
         empty = width
 
-    # Build character cache if needed
-    _build_progress_chars(width, filled_char, empty_char)
-
-    # Use substring operations (no subprocess overhead)
-    filled_str = _PROGRESS_FILLED_CACHE[:filled]
-    empty_str = _PROGRESS_EMPTY_CACHE[:empty]
+    # Use substring operations on the prebuilt strings (no per-call building)
+    return f"[{filled_cache[:filled]}{empty_cache[:empty]}] {percentage:3d}% ({current}/{total})"
 
-    # Single formatted string for entire bar
-    return f"{UI_PROGRESS_COLOR}[{filled_str}{empty_str}] {percentage:3d}% ({current}/{total}){COLOR_RESET}"
+def _format_duration(seconds: float) -> str:
+    """Format seconds as M:SS (or H:MM:SS for long durations)"""
+    seconds = int(seconds)
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
 
-def update_progress(current: int, total: int = None, width: int = 50):
+class ProgressBar:
     """
-    Update progress bar with current values (optimized repaint, zero flicker)
-
-    Args:
-        current: Current progress value
-        total: Total value (default: PROGRESS_TOTAL)
-        width: Width of the progress bar
+    A single-line progress bar with its own state and caches
+
+    Holds the width, bar characters, prebuilt character strings,
+    last-rendered state (to skip redundant redraws), the time-based redraw
+    throttle and the EWMA throughput estimate. Independent bars (for nested
+    progress, or one per job) are cheap; the module-level update_progress()
+    family drives a default instance.
+
+    Usage:
+        bar = ProgressBar(total=len(files), label="Linking: ")
+        for path in files:
+            link(path)
+            bar.increment()
+        bar.flush()
     """
-    global PROGRESS_CURRENT, PROGRESS_TOTAL
-    global _PROGRESS_LAST_PERCENTAGE, _PROGRESS_LAST_FILLED
-    global _PROGRESS_LAST_CURRENT, _PROGRESS_LAST_TOTAL, _PROGRESS_LAST_RENDERED
 
-    if total is None:
-        total = PROGRESS_TOTAL
+    __slots__ = (
+        'current', 'total', 'width', 'label', 'filled_char', 'empty_char',
+        'rate_smoothing', '_min_interval',
+        '_filled_cache', '_empty_cache', '_cache_key',
+        '_last_percentage', '_last_filled', '_last_current', '_last_total',
+        '_last_rendered', '_last_draw_time', '_pending',
+        '_rate', '_rate_time', '_rate_current', '_start_time', '_start_current',
+    )
+
+    def __init__(self, total: int = 100, width: int = 50, label: str = "Progress: ",
+                 filled_char: str = '█', empty_char: str = '░',
+                 max_refresh_rate: float = None, rate_smoothing: float = None):
+        self.current = 0
+        self.total = total
+        self.width = width
+        self.label = label
+        self.filled_char = filled_char
+        self.empty_char = empty_char
+        self.max_refresh_rate = (PROGRESS_MAX_REFRESH_RATE if max_refresh_rate is None
+                                 else max_refresh_rate)
+        self.rate_smoothing = (PROGRESS_RATE_SMOOTHING if rate_smoothing is None
+                               else rate_smoothing)
+        self._filled_cache = ""
+        self._empty_cache = ""
+        self._cache_key = None
+        self.reset()
+
+    @property
+    def max_refresh_rate(self) -> float:
+        """Maximum redraws per second (0 disables throttling)"""
+        return 1.0 / self._min_interval if self._min_interval else 0.0
+
+    @max_refresh_rate.setter
+    def max_refresh_rate(self, rate: float):
+        self._min_interval = 1.0 / rate if rate > 0 else 0.0
+
+    def reset(self):
+        """Forget the last drawn state, throttle and rate (new progress sequence)"""
+        self._last_percentage = -1
+        self._last_filled = -1
+        self._last_current = -1
+        self._last_total = -1
+        self._last_rendered = ""
+        self._last_draw_time = 0.0
+        self._pending = False
+        self._rate = 0.0
+        self._rate_time = 0.0
+        self._rate_current = 0
+        self._start_time = 0.0
+        self._start_current = 0
+
+    def bar_text(self, current: int, total: int, width: int = None,
+                 filled_char: str = None, empty_char: str = None) -> str:
+        """Uncolored bar text, built from this bar's prebuilt character strings"""
+        if width is None:
+            width = self.width
+        if filled_char is None:
+            filled_char = self.filled_char
+        if empty_char is None:
+            empty_char = self.empty_char
+
+        # Only rebuild the character strings if width or characters changed
+        key = (width, filled_char, empty_char)
+        if key != self._cache_key:
+            self._filled_cache = filled_char * width
+            self._empty_cache = empty_char * width
+            self._cache_key = key
+
+        return _format_progress_text(current, total, width,
+                                     self._filled_cache, self._empty_cache)
+
+    def draw(self, current: int = None, total: int = None, width: int = None,
+             filled_char: str = None, empty_char: str = None) -> str:
+        """Colored bar string (see draw_progress_bar())"""
+        if current is None:
+            current = self.current
+        if total is None:
+            total = self.total
+        bar_text = self.bar_text(current, total, width, filled_char, empty_char)
+        return f"{UI_PROGRESS_COLOR}{bar_text}{COLOR_RESET}"
+
+    def update(self, current: int, total: int = None, width: int = None,
+               show_rate: bool = True, force: bool = False):
+        """Set progress and redraw the bar line if needed (see update_progress())"""
+        self.current = current
+        if total is None:
+            total = self.total
+        else:
+            self.total = total
+        if width is None:
+            width = self.width
+        else:
+            self.width = width
+
+        if PLAIN_MODE:
+            self._log_plain(current, total, show_rate, force)
+            return
+
+        # Skip redraw if the last one was too recent (never for the final state).
+        # Checked first: in tight loops this is the path almost every call takes
+        now = _monotonic()
+        if (not force and current < total and
+                now - self._last_draw_time < self._min_interval):
+            self._pending = True
+            return
+
+        # Calculate what changed
+        percentage = (current * 100) // total
+        filled = (current * width) // total
+
+        # Skip redraw if nothing visually changed
+        if (percentage == self._last_percentage and
+            filled == self._last_filled and
+            current == self._last_current and
+            total == self._last_total):
+            return
+        self._pending = False
+        self._last_draw_time = now
+
+        # Build the complete rendered string
+        self._sample_rate(current, now)
+        rendered_bar = self.draw(current, total, width)
+        if show_rate:
+            rendered_bar += self._rate_text(current, total, now)
+
+        # Skip redraw if rendered output is identical (ultimate flicker prevention)
+        if rendered_bar == self._last_rendered:
+            return
+
+        # Update cache
+        self._last_percentage = percentage
+        self._last_filled = filled
+        self._last_current = current
+        self._last_total = total
+        self._last_rendered = rendered_bar
+
+        # Anti-flicker redraw technique:
+        # 1. Move to start of line
+        # 2. Clear entire line completely
+        # 3. Redraw on clean slate
+        _write(f"\r\033[2K{self.label}{rendered_bar}", flush=True)
+
+    def _log_plain(self, current: int, total: int, show_rate: bool, force: bool):
+        """Plain mode: log a summary line per PROGRESS_PLAIN_STEP / _INTERVAL"""
+        now = _monotonic()
+        percentage = (current * 100) // total
+        if (not force and current < total and
+                percentage < self._last_percentage + PROGRESS_PLAIN_STEP and
+                now - self._last_draw_time < PROGRESS_PLAIN_INTERVAL):
+            self._pending = True
+            return
+        if current == self._last_current and total == self._last_total:
+            return
+        self._pending = False
+        self._last_draw_time = now
+        self._last_percentage = percentage
+        self._last_current = current
+        self._last_total = total
+
+        self._sample_rate(current, now)
+        line = f"{self.label}{percentage:3d}% ({current}/{total})"
+        if show_rate:
+            line += self._rate_text(current, total, now)
+        _write(line + "\n", flush=True)
+
+    def increment(self, increment: int = 1):
+        """Advance by increment steps and redraw if needed"""
+        self.update(self.current + increment)
+
+    def flush(self):
+        """Draw the latest state if the throttle held it back"""
+        if self._pending:
+            self.update(self.current, force=True)
+
+    def _sample_rate(self, current: int, now: float):
+        """Fold the progress made since the last sample into the EWMA rate"""
+        # First sample of a sequence: just remember where we started
+        if self._start_time == 0.0:
+            self._start_time = self._rate_time = now
+            self._start_current = self._rate_current = current
+            return
+
+        elapsed = now - self._rate_time
+        if elapsed < _PROGRESS_RATE_MIN_INTERVAL:
+            return
+
+        instant_rate = (current - self._rate_current) / elapsed
+        if self._rate == 0.0:
+            self._rate = instant_rate
+        else:
+            self._rate += self.rate_smoothing * (instant_rate - self._rate)
+        self._rate_time = now
+        self._rate_current = current
+
+    def _rate_text(self, current: int, total: int, now: float) -> str:
+        """Build the ' 12.3/s ETA 0:42' suffix (empty until a rate is known)"""
+        if current >= total and self._start_time:
+            elapsed = now - self._start_time
+            if elapsed <= 0:
+                return ""
+            average = (current - self._start_current) / elapsed
+            return f" {UI_INFO_COLOR}{average:.1f}/s in {_format_duration(elapsed)}{COLOR_RESET}"
+
+        if self._rate <= 0:
+            return ""
+        eta = (total - current) / self._rate
+        return f" {UI_INFO_COLOR}{self._rate:.1f}/s ETA {_format_duration(eta)}{COLOR_RESET}"
+
+# Default bar driven by the module-level progress functions below
+_DEFAULT_PROGRESS = ProgressBar()
+
+def default_progress_bar() -> ProgressBar:
+    """The ProgressBar behind update_progress() and friends"""
+    return _DEFAULT_PROGRESS
+
+def __getattr__(name: str):
+    # PROGRESS_CURRENT / PROGRESS_TOTAL used to be module globals; they are
+    # now read from the default bar (use update_progress() to change them)
+    if name == 'PROGRESS_CURRENT':
+        return _DEFAULT_PROGRESS.current
+    if name == 'PROGRESS_TOTAL':
+        return _DEFAULT_PROGRESS.total
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    PROGRESS_CURRENT = current
-    PROGRESS_TOTAL = total
+def draw_progress_bar(current: int = None, total: int = None,
+                      width: int = 50, filled_char: str = '█',
+                      empty_char: str = '░') -> str:
+    """
+    Draw a beautiful progress bar (optimized version)
 
-    # Calculate what changed
-    percentage = (current * 100) // total
-    filled = (current * width) // total
+    Args:
+        current: Current progress value (default: current value of the default bar)
+        total: Total value (default: total of the default bar)
+        width: Width of the progress bar in characters
+        filled_char: Character for filled portion
+        empty_char: Character for empty portion
 
-    # Skip redraw if nothing visually changed
-    if (percentage == _PROGRESS_LAST_PERCENTAGE and
-        filled == _PROGRESS_LAST_FILLED and
-        current == _PROGRESS_LAST_CURRENT and
-        total == _PROGRESS_LAST_TOTAL):
-        return
+    Returns:
+        Formatted progress bar string
+    """
+    return _DEFAULT_PROGRESS.draw(current, total, width, filled_char, empty_char)
 
-    # Build the complete rendered string
-    rendered_bar = draw_progress_bar(current, total, width)
+def update_progress(current: int, total: int = None, width: int = 50,
+                    show_rate: bool = True, force: bool = False):
+    """
+    Update progress bar with current values (optimized repaint, zero flicker)
 
-    # Skip redraw if rendered output is identical (ultimate flicker prevention)
-    if rendered_bar == _PROGRESS_LAST_RENDERED:
-        return
+    Redraws are throttled to PROGRESS_MAX_REFRESH_RATE per second; the final
+    state (current >= total) is always drawn, and flush_progress() draws any
+    update the throttle held back. In PLAIN_MODE a summary line is logged
+    every PROGRESS_PLAIN_STEP percent or PROGRESS_PLAIN_INTERVAL seconds.
 
-    # Update cache
-    _PROGRESS_LAST_PERCENTAGE = percentage
-    _PROGRESS_LAST_FILLED = filled
-    _PROGRESS_LAST_CURRENT = current
-    _PROGRESS_LAST_TOTAL = total
-    _PROGRESS_LAST_RENDERED = rendered_bar
+    Args:
+        current: Current progress value
+        total: Total value (default: total of the default bar)
+        width: Width of the progress bar
+        show_rate: Append smoothed items/sec and ETA
+        force: Draw even if the throttle interval has not elapsed
+    """
+    _DEFAULT_PROGRESS.update(current, total, width, show_rate, force)
 
-    # Anti-flicker redraw technique:
-    # 1. Move to start of line
-    # 2. Clear entire line completely
-    # 3. Redraw on clean slate
-    print(f"\r\033[2KProgress: {rendered_bar}", end='', flush=True)
+def flush_progress():
+    """Draw the latest progress state if the throttle held it back"""
+    _DEFAULT_PROGRESS.flush()
 
 def increment_progress(increment: int = 1):
     """Increment progress by one step (optimized)"""
-    global PROGRESS_CURRENT, PROGRESS_TOTAL
-    PROGRESS_CURRENT += increment
-    update_progress(PROGRESS_CURRENT, PROGRESS_TOTAL)
+    _DEFAULT_PROGRESS.increment(increment)
 
 def reset_progress_cache():
     """Reset progress bar cache (call when starting new progress sequence)"""
-    global _PROGRESS_LAST_PERCENTAGE, _PROGRESS_LAST_FILLED
-    global _PROGRESS_LAST_CURRENT, _PROGRESS_LAST_TOTAL, _PROGRESS_LAST_RENDERED
+    _DEFAULT_PROGRESS.reset()
+
+# ============================================================================
+# Multi-Bar Progress Groups (thread-safe, for concurrent jobs)
+# ============================================================================
+
+class ProgressGroup:
+    """
+    A group of named progress bars, one per parallel job
+
+    Worker threads update their own bar through update()/advance(), which
+    only touch the bar state under a short lock. A single render thread
+    repaints the whole group at most `fps` times per second, and only when
+    something changed, rewriting just the lines that differ in one frame.
+    In PLAIN_MODE, changed bars are logged as one line each every
+    PROGRESS_PLAIN_INTERVAL seconds, and as soon as they complete.
+
+    Usage:
+        with ProgressGroup(["npm", "cargo", "gem", "pipx"]) as group:
+            group.update("npm", 0, total=42)
+            ...                              # in a worker thread
+            group.advance("npm", message="eslint")
+    """
 
-    _PROGRESS_LAST_PERCENTAGE = -1
-    _PROGRESS_LAST_FILLED = -1
-    _PROGRESS_LAST_CURRENT = -1
-    _PROGRESS_LAST_TOTAL = -1
-    _PROGRESS_LAST_RENDERED = ""
+    def __init__(self, names=(), total: int = 100, width: int = 30, fps: float = 10.0):
+        self._lock = threading.Lock()
+        self._bars = {}                      # name -> [ProgressBar, message]
+        self._width = width
+        self._interval = 1.0 / fps if fps > 0 else 0.1
+        self._version = 0
+        self._drawn_version = -1
+        self._drawn_lines = []
+        self._logged_lines = {}              # name -> last plain line
+        self._logged_time = 0.0
+        self._stop_event = threading.Event()
+        self._thread = None
+
+        for name in names:
+            self.add(name, total)
+
+    def add(self, name: str, total: int = 100):
+        """Add a bar to the group (no-op if it already exists)"""
+        with self._lock:
+            if name not in self._bars:
+                self._bars[name] = [ProgressBar(total, self._width), ""]
+                self._version += 1
+
+    def update(self, name: str, current: int, total: int = None, message: str = None):
+        """Set a bar's progress (safe to call from any thread)"""
+        with self._lock:
+            bar, _ = entry = self._bars[name]
+            bar.current = current
+            if total is not None:
+                bar.total = total
+            if message is not None:
+                entry[1] = message
+            self._version += 1
+
+    def advance(self, name: str, increment: int = 1, message: str = None):
+        """Advance a bar by increment steps (safe to call from any thread)"""
+        with self._lock:
+            bar, _ = entry = self._bars[name]
+            bar.current += increment
+            if message is not None:
+                entry[1] = message
+            self._version += 1
+
+    def start(self):
+        """Start the background render thread"""
+        if self._thread is not None:
+            return
+        hide_cursor()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._render_loop,
+                                        name="ProgressGroup", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the render thread and paint the final state"""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+        self.refresh(force=True)
+        show_cursor()
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Repaint the group now if anything changed; returns True if painted
+
+        In PLAIN_MODE, force logs every changed bar without waiting for
+        PROGRESS_PLAIN_INTERVAL (used for the final state).
+        """
+        with self._lock:
+            if self._version == self._drawn_version:
+                return False
+            version = self._version
+            snapshot = [(name, bar, bar.current, bar.total, message)
+                         for name, (bar, message) in self._bars.items()]
+
+        # Format outside the lock so workers never wait on rendering
+        if PLAIN_MODE:
+            # Bars held back until the next interval keep the version stale
+            if not self._log_plain(snapshot, force):
+                return True
+        else:
+            self._paint(self._render_lines(snapshot))
+        self._drawn_version = version
+        return True
+
+    def _render_loop(self):
+        while not self._stop_event.wait(self._interval):
+            self.refresh()
+
+    def _render_lines(self, snapshot: list) -> list:
+        name_width = max((len(entry[0]) for entry in snapshot), default=0)
+        lines = []
+        for name, bar, current, total, message in snapshot:
+            # Bars are only ever rendered here, so their caches stay on this thread
+            bar_text = bar.bar_text(current, total)
+            line = f"{name:<{name_width}} {UI_PROGRESS_COLOR}{bar_text}{COLOR_RESET}"
+            if message:
+                line += f" {UI_INFO_COLOR}{message}{COLOR_RESET}"
+            lines.append(line)
+        return lines
+
+    def _log_plain(self, snapshot: list, force: bool) -> bool:
+        """Log changed bars as plain lines; returns False if some were held back"""
+        now = _monotonic()
+        due = force or now - self._logged_time >= PROGRESS_PLAIN_INTERVAL
+        complete = True
+        with Frame():
+            for name, bar, current, total, message in snapshot:
+                percentage = (current * 100) // total if total else 0
+                line = f"{name}: {percentage}% ({current}/{total})"
+                if message:
+                    line += f" {message}"
+                if self._logged_lines.get(name) == line:
+                    continue
+                if due or current >= total:
+                    _write(line + "\n")
+                    self._logged_lines[name] = line
+                else:
+                    complete = False
+        if due:
+            self._logged_time = now
+        return complete
+
+    def _paint(self, lines: list):
+        previous = self._drawn_lines
+        with Frame():
+            # Move back up to the first line of the group
+            if previous:
+                _write(f"\033[{len(previous)}A")
+            for index, line in enumerate(lines):
+                if index >= len(previous) or line != previous[index]:
+                    _write(f"\r{CLEAR_LINE}{line}")
+                _write("\n")
+        self._drawn_lines = lines
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
 
 # ============================================================================
 # Advanced Status Display System
 # ============================================================================
 
+# Rows of the status block, relative to line_offset (blank rows are empty)
+_STATUS_ROW_COUNT = 7
+
+def _build_status_rows(phase_name: str, operation_name: str, current: int,
+                       total: int, success_count: int, error_count: int) -> list:
+    """Build the status block as rows of (style, text) segments"""
+    rows = [()] * _STATUS_ROW_COUNT
+    rows[0] = ((f"{COLOR_BOLD}{UI_ACCENT_COLOR}", f"Phase: {phase_name:<20}"),)
+    rows[1] = ((UI_INFO_COLOR, f"Current: {operation_name:<40}"),)
+    rows[3] = ((UI_PROGRESS_COLOR, f"Progress: {_DEFAULT_PROGRESS.bar_text(current, total, 50)}"),)
+    rows[6] = ((UI_SUCCESS_COLOR, f"✅ Success: {success_count}"),
+               ("", "  "),
+               (UI_ERROR_COLOR, f"❌ Errors: {error_count}"))
+    return rows
+
+def _diff_status_row(old: tuple, new: tuple) -> tuple[int, int, int]:
+    """
+    Find where two status rows start to differ
+
+    Returns:
+        (segment index, character offset within that segment, display column)
+        of the first changed cell, or (-1, 0, 0) if the rows are identical
+    """
+    column = 0
+    for index, (style, text) in enumerate(new):
+        if index >= len(old):
+            return index, 0, column
+        old_style, old_text = old[index]
+        if style != old_style:
+            return index, 0, column
+        if text != old_text:
+            offset = 0
+            limit = min(len(text), len(old_text))
+            while offset < limit and text[offset] == old_text[offset]:
+                offset += 1
+            return index, offset, column + get_safe_display_width(text[:offset])
+        column += get_safe_display_width(text)
+
+    if len(old) > len(new):
+        return len(new), 0, column
+    return -1, 0, 0
+
+@Frame()
 def update_status_display(phase_name: str, operation_name: str,
                          current: int = None, total: int = None,
                          success_count: int = 0, error_count: int = 0,
@@ -354,41 +1198,86 @@ def update_status_display(phase_name: str, operation_name: str,
     """
     Display comprehensive status with phase tracking
 
+    Only the cells that changed since the previous call are repainted; the
+    first call (or a call with a different line_offset) draws the whole block.
+
     Args:
         phase_name: Name of current phase
         operation_name: Name of current operation
-        current: Current progress (default: PROGRESS_CURRENT)
-        total: Total progress (default: PROGRESS_TOTAL)
+        current: Current progress (default: current value of the default bar)
+        total: Total progress (default: total of the default bar)
         success_count: Number of successful operations
         error_count: Number of errors
         line_offset: Line number to start drawing at
     """
-    global PROGRESS_CURRENT, PROGRESS_TOTAL
+    global _STATUS_LAST_OFFSET, _STATUS_LAST_ROWS
 
     if current is None:
-        current = PROGRESS_CURRENT
+        current = _DEFAULT_PROGRESS.current
     if total is None:
-        total = PROGRESS_TOTAL
-
-    # Clear the status area and redraw
-    move_cursor_to_line(line_offset)
-
-    # Phase line
-    print(f"{' ' * 80}\r{COLOR_BOLD}{UI_ACCENT_COLOR}Phase: {phase_name:<20}{COLOR_RESET}")
+        total = _DEFAULT_PROGRESS.total
 
-    # Current operation line
-    print(f"{' ' * 80}\r{UI_INFO_COLOR}Current: {operation_name:<40}{COLOR_RESET}\n")
+    if PLAIN_MODE:
+        _log_status_plain(phase_name, operation_name, current, total,
+                          success_count, error_count)
+        return
 
-    # Progress bar
-    print(f"{' ' * 80}\r", end='')
-    print_colored_message(UI_PROGRESS_COLOR, "Progress: ")
-    print(draw_progress_bar(current, total))
-    print("\n")
+    rows = _build_status_rows(phase_name, operation_name, current, total,
+                              success_count, error_count)
+    full_repaint = line_offset != _STATUS_LAST_OFFSET or not _STATUS_LAST_ROWS
+    changed = False
 
-    # Statistics
-    print(f"{' ' * 80}\r", end='')
-    print(f"{UI_SUCCESS_COLOR}✅ Success: {success_count}{COLOR_RESET}  "
-          f"{UI_ERROR_COLOR}❌ Errors: {error_count}{COLOR_RESET}")
+    for row_index, row in enumerate(rows):
+        if full_repaint:
+            segment_index, offset, column = 0, 0, 0
+        else:
+            segment_index, offset, column = _diff_status_row(_STATUS_LAST_ROWS[row_index], row)
+            if segment_index < 0:
+                continue
+
+        # Repaint from the first changed cell to the end of the row
+        move_cursor_to(line_offset + row_index, column + 1)
+        for style, text in row[segment_index:]:
+            if offset:
+                text = text[offset:]
+                offset = 0
+            _write(f"{style}{text}{COLOR_RESET}" if style else text)
+        _write(CLEAR_LINE_TO_END)
+        changed = True
+
+    _STATUS_LAST_OFFSET = line_offset
+    _STATUS_LAST_ROWS = rows
+
+    # Leave the cursor below the status block, as a full redraw would
+    if changed:
+        move_cursor_to_line(line_offset + _STATUS_ROW_COUNT)
+
+def _log_status_plain(phase_name: str, operation_name: str, current: int,
+                      total: int, success_count: int, error_count: int):
+    """Plain mode: log a status line on phase change, progress step or interval"""
+    global _STATUS_PLAIN_LAST
+
+    now = _monotonic()
+    percentage = (current * 100) // total if total else 0
+    if _STATUS_PLAIN_LAST is not None:
+        last_phase, last_percentage, last_time = _STATUS_PLAIN_LAST
+        if (phase_name == last_phase and
+                percentage < last_percentage + PROGRESS_PLAIN_STEP and
+                not (current >= total and last_percentage < 100) and
+                now - last_time < PROGRESS_PLAIN_INTERVAL):
+            return
+    _STATUS_PLAIN_LAST = (phase_name, percentage, now)
+
+    _write(f"[{phase_name}] {percentage:3d}% ({current}/{total}) {operation_name}"
+           f" - success: {success_count}, errors: {error_count}\n", flush=True)
+
+def reset_status_display():
+    """Forget the last drawn status display (next update repaints fully)"""
+    global _STATUS_LAST_OFFSET, _STATUS_LAST_ROWS, _STATUS_PLAIN_LAST
+
+    _STATUS_LAST_OFFSET = -1
+    _STATUS_LAST_ROWS = []
+    _STATUS_PLAIN_LAST = None
 
 def show_status(message: str, status_type: str = "info"):
     """
@@ -411,6 +1300,8 @@ def show_status(message: str, status_type: str = "info"):
 # Loading and Spinner Functions
 # ============================================================================
 
+_SPINNER_FRAMES = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
+
 def show_spinner(message: str, duration: int = 3):
     """
     Simple spinner animation
@@ -419,18 +1310,113 @@ def show_spinner(message: str, duration: int = 3):
         message: Message to display with spinner
         duration: Duration in seconds
     """
-    frames = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
+    if PLAIN_MODE:
+        time.sleep(duration)
+        draw_spinner_result(message, failed=False)
+        return
+
+    frames = _SPINNER_FRAMES
 
     hide_cursor()
 
     for i in range(duration * 10):
         frame = frames[i % len(frames)]
-        print(f"\r{UI_ACCENT_COLOR}{frame}{COLOR_RESET} {message}", end='', flush=True)
+        _write(f"\r{UI_ACCENT_COLOR}{frame}{COLOR_RESET} {message}", flush=True)
         time.sleep(0.1)
 
-    print(f"\r{UI_SUCCESS_COLOR}✓{COLOR_RESET} {message}")
+    _write(f"\r{UI_SUCCESS_COLOR}✓{COLOR_RESET} {message}\n")
     show_cursor()
 
+def draw_spinner_frame(index: int, message: str):
+    """Draw spinner animation frame number index (shared with AsyncSpinner)"""
+    frame = _SPINNER_FRAMES[index % len(_SPINNER_FRAMES)]
+    _write(f"\r{UI_ACCENT_COLOR}{frame}{COLOR_RESET} {message}", flush=True)
+
+def draw_spinner_result(message: str, failed: bool):
+    """Replace the spinner line with its final ✓/✗ state"""
+    if PLAIN_MODE:
+        mark = f"{UI_ERROR_COLOR}✗" if failed else f"{UI_SUCCESS_COLOR}✓"
+        _write(f"{mark}{COLOR_RESET} {message}\n", flush=True)
+    elif failed:
+        _write(f"\r{CLEAR_LINE}{UI_ERROR_COLOR}✗{COLOR_RESET} {message}\n", flush=True)
+    else:
+        _write(f"\r{CLEAR_LINE}{UI_SUCCESS_COLOR}✓{COLOR_RESET} {message}\n", flush=True)
+
+class Spinner:
+    """
+    Spinner that animates on a background thread while real work runs
+
+    The spinner stops as soon as the wrapped block or call finishes and
+    shows ✓ on success or ✗ on failure. A block fails if it raises or if
+    fail() is called. A decorated function fails if it raises, returns
+    False, or returns an object with a non-zero returncode (such as
+    subprocess.CompletedProcess).
+
+    Usage:
+        with Spinner("Installing npm packages") as spinner:
+            result = subprocess.run(["npm", "install", "-g", "eslint"])
+            if result.returncode:
+                spinner.fail()
+
+        @Spinner("Downloading fonts")
+        def download_fonts():
+            return subprocess.run(["./fonts.zsh"])
+    """
+
+    def __init__(self, message: str, interval: float = 0.1):
+        self.message = message
+        self.interval = interval
+        self.failed = False
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def fail(self, message: str = None):
+        """Mark the spinner as failed (optionally replacing its message)"""
+        self.failed = True
+        if message is not None:
+            self.message = message
+
+    def __enter__(self):
+        self.failed = False
+        if PLAIN_MODE:
+            # Nothing to animate in a log; only the result line is written
+            return self
+        self._stop_event.clear()
+        hide_cursor()
+        self._thread = threading.Thread(target=self._animate, name="Spinner", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+
+        draw_spinner_result(self.message, exc_type is not None or self.failed)
+        show_cursor()
+        return False
+
+    def __call__(self, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Fresh instance per call so concurrent calls don't share a thread
+            with Spinner(self.message, self.interval) as spinner:
+                result = func(*args, **kwargs)
+                if result is False or getattr(result, 'returncode', 0):
+                    spinner.fail()
+                return result
+        return wrapper
+
+    def _animate(self):
+        index = 0
+        while True:
+            draw_spinner_frame(index, self.message)
+            index += 1
+            # Returns immediately once __exit__ signals completion
+            if self._stop_event.wait(self.interval):
+                return
+
 # ============================================================================
 # Input and Confirmation Functions
 # ============================================================================
@@ -448,7 +1434,7 @@ def ask_confirmation(message: str, default: str = "n") -> bool:
     """
     default_display = "y/N" if default == "n" else "Y/n"
 
-    print(f"{UI_ACCENT_COLOR}{message} [{default_display}]: {COLOR_RESET}", end='', flush=True)
+    _write(f"{UI_ACCENT_COLOR}{message} [{default_display}]: {COLOR_RESET}", flush=True)
     response = input().strip().lower()
 
     answer = response if response else default
@@ -476,8 +1462,9 @@ def print_centered(text: str, width: int = 80, color: str = None):
         color = UI_INFO_COLOR
 
     padding = (width - len(text)) // 2
-    print(f"{color}{' ' * padding}{text}{' ' * padding}{COLOR_RESET}")
+    _write(f"{color}{' ' * padding}{text}{' ' * padding}{COLOR_RESET}\n")
 
+@Frame()
 def print_box(text: str, padding: int = 2, color: str = None):
     """
     Print text in a box
@@ -493,20 +1480,158 @@ def print_box(text: str, padding: int = 2, color: str = None):
     text_width = len(text)
     box_width = text_width + padding * 2 + 2
 
-    print(f"{color}", end='')
-    print(f"┌{'─' * (box_width - 2)}┐")
-    print(f"│{' ' * padding}{text}{' ' * padding}│")
-    print(f"└{'─' * (box_width - 2)}┘")
-    print(f"{COLOR_RESET}", end='')
+    _write(f"{color}")
+    _write(f"┌{'─' * (box_width - 2)}┐\n")
+    _write(f"│{' ' * padding}{text}{' ' * padding}│\n")
+    _write(f"└{'─' * (box_width - 2)}┘\n")
+    _write(f"{COLOR_RESET}")
+
+# ============================================================================
+# Table Rendering (bulk column layout for large reports)
+# ============================================================================
+
+def _truncate_to_width(text: str, width: int) -> str:
+    """Cut text to at most width display columns, ending with '…'"""
+    if width <= 0:
+        return ""
+    if text.isascii():
+        return text[:width - 1] + '…'
+    used = 0
+    for index, char in enumerate(text):
+        used += get_display_width(char)
+        if used > width - 1:
+            return text[:index] + '…'
+    return text
+
+class Table:
+    """
+    Column-layout table renderer for large reports
+
+    Column widths are measured in one batched pass over the first
+    sample_size rows, then fitted to the terminal width by capping the
+    widest columns. Rows are streamed out in chunks of chunk_size lines
+    (one write per chunk), so memory stays bounded however many rows the
+    iterable yields. Cells of later rows that exceed their column are
+    truncated with '…'.
+
+    Usage:
+        table = Table(["Package", "Manager", "Version"])
+        table.render(inventory_rows)       # any iterable of row sequences
+    """
+
+    def __init__(self, headers: Sequence[str], max_width: int = None,
+                 sample_size: int = 1000, chunk_size: int = 500,
+                 separator: str = "  ", header_color: str = None):
+        self.headers = [str(header) for header in headers]
+        self.max_width = max_width
+        self.sample_size = sample_size
+        self.chunk_size = chunk_size
+        self.separator = separator
+        self.header_color = header_color
+        self.widths = []
+
+    def render(self, rows: Iterable[Sequence]) -> int:
+        """Render header and rows; returns the number of rows written"""
+        rows = iter(rows)
+        sample = list(islice(rows, self.sample_size))
+        self.widths = self._fit(self._measure(sample))
+
+        header_color = self.header_color or f"{COLOR_BOLD}{UI_HEADER_COLOR}"
+        header = self._format_lines([self.headers])[0]
+        rule = self.separator.join('─' * width for width in self.widths)
+        _write(f"{header_color}{header}{COLOR_RESET}\n{UI_INFO_COLOR}{rule}{COLOR_RESET}\n")
+
+        count = self._write_rows(sample)
+        while True:
+            chunk = list(islice(rows, self.chunk_size))
+            if not chunk:
+                break
+            count += self._write_rows(chunk)
+        _write("", flush=True)
+        return count
+
+    @staticmethod
+    def _column(rows: list, index: int) -> list:
+        """Extract column index of a chunk as strings (short rows give '')"""
+        try:
+            column = [row[index] for row in rows]
+        except IndexError:
+            column = [row[index] if index < len(row) else "" for row in rows]
+        if set(map(type, column)) - {str}:
+            column = ["" if cell is None else str(cell) for cell in column]
+        return column
+
+    def _measure(self, sample: list) -> list:
+        """Widest cell per column (headers included), one pass per column"""
+        widths = []
+        for index, header in enumerate(self.headers):
+            column = self._column(sample, index)
+            column.append(header)
+            if ''.join(column).isascii():
+                widths.append(max(map(len, column)))
+            else:
+                widths.append(max(map(get_display_width, column)))
+        return widths
+
+    def _fit(self, widths: list) -> list:
+        """Cap the widest columns so the table fits into max_width"""
+        max_width = self.max_width
+        if not max_width:
+            import shutil      # only needed here, keeps it off the import path
+            max_width = shutil.get_terminal_size().columns
+        available = max_width - len(self.separator) * (len(widths) - 1)
+        if sum(widths) <= available or not widths:
+            return widths
+
+        # Binary search the largest cap that makes all columns fit
+        low, high = 1, max(widths)
+        while low < high:
+            cap = (low + high + 1) // 2
+            if sum(min(width, cap) for width in widths) <= available:
+                low = cap
+            else:
+                high = cap - 1
+        return [min(width, low) for width in widths]
+
+    def _format_column(self, column: list, width: int, pad: bool) -> list:
+        """Truncate/pad one column of a chunk (C-level ljust for ASCII)"""
+        if ''.join(column).isascii():
+            if max(map(len, column)) > width:
+                column = [cell if len(cell) <= width else cell[:width - 1] + '…'
+                          for cell in column]
+            return [cell.ljust(width) for cell in column] if pad else column
+
+        cells = []
+        for cell in column:
+            cell_width = get_display_width(cell)
+            if cell_width > width:
+                cell = _truncate_to_width(cell, width)
+                cell_width = get_display_width(cell)
+            cells.append(cell + ' ' * (width - cell_width) if pad else cell)
+        return cells
+
+    def _format_lines(self, rows: list) -> list:
+        """Format a chunk of rows column by column"""
+        last = len(self.widths) - 1
+        columns = [self._format_column(self._column(rows, index), width, index != last)
+                   for index, width in enumerate(self.widths)]
+        return list(map(self.separator.join, zip(*columns)))
+
+    def _write_rows(self, rows: list) -> int:
+        """Format a chunk and write it in one go"""
+        if rows:
+            _write('\n'.join(self._format_lines(rows)) + '\n')
+        return len(rows)
 
 # ============================================================================
 # Cleanup and Safety Functions
 # ============================================================================
 
+@Frame()
 def cleanup_ui():
     """Ensure cursor is shown and screen state is clean on exit"""
     show_cursor()
-    print(f"\n{COLOR_RESET}", end='', flush=True)
+    _write(f"\n{COLOR_RESET}", flush=True)
 
 def setup_ui_cleanup():
     """Set up proper cleanup on script exit"""
@@ -529,35 +1654,49 @@ def setup_ui_cleanup():
 # Demo and Testing
 # ============================================================================
 
-if __name__ == '__main__':
-    # Demo the UI library
-    print()
+def _demo():
+    """Walk through the main components"""
+    _write("\n")
     draw_header("Terminal UI Library Demo", "Python Port of ui.zsh")
 
-    print()
+    _write("\n")
     draw_section_header("Message Types")
     print_success("Operation completed successfully")
     print_warning("This is a warning message")
     print_error("An error occurred")
     print_info("This is an informational message")
 
-    print()
+    _write("\n")
     draw_section_header("Progress Bar")
     reset_progress_cache()
     for i in range(0, 101, 10):
         update_progress(i, 100)
         time.sleep(0.1)
-    print()
+    _write("\n")
 
-    print()
+    _write("\n")
     draw_section_header("Box Drawing")
     print_box("This text is in a box!")
 
-    print()
+    _write("\n")
     draw_section_header("Centered Text")
     print_centered("This text is centered", 78, UI_ACCENT_COLOR)
 
-    print()
+    _write("\n")
     draw_separator()
 
-    print(f"\n{UI_SUCCESS_COLOR}✓ Demo complete!{COLOR_RESET}\n")
+    print_colored_message(UI_SUCCESS_COLOR, "\n✓ Demo complete!")
+    _write("\n\n", flush=True)
+
+
+if __name__ == '__main__':
+    # --record: run the demo headless and print render-cost metrics as JSON
+    if '--record' in sys.argv[1:]:
+        import json
+
+        PLAIN_MODE = False          # measure the interactive rendering path
+        with FrameRecorder() as recorder:
+            _demo()
+        print(json.dumps(recorder.summary(), indent=2))
+    else:
+        _demo()
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Async Terminal UI Components for Python Scripts
+================================================
+
+An asyncio-native companion to terminal_ui: awaitable progress updates,
+an async spinner, non-blocking prompts, and a helper that runs many
+subprocesses concurrently on one event loop, each bound to its own line
+of a ProgressGroup.
+
+Author: Aria Prime
+Date: 2025-11-24
+
+Usage:
+    import asyncio
+    from terminal_ui_async import *
+
+    async def main():
+        results = await run_subprocesses({
+            "npm": ["npm", "update", "-g"],
+            "cargo": ["cargo", "install-update", "-a"],
+            "pipx": ["pipx", "upgrade-all"],
+        })
+        return all(r.returncode == 0 for r in results.values())
+
+    asyncio.run(main())
+
+Features:
+- Awaitable progress updates that yield to the event loop
+- Async spinner driven by an asyncio task (no extra threads)
+- Prompts that wait for input in an executor, keeping the loop responsive
+- Concurrent subprocess runner with one live UI slot per job
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+import time
+from collections.abc import Sequence
+from typing import NamedTuple
+
+# Works both as part of the lib/python package and as a flat module
+if __package__:
+    from . import terminal_ui
+    from .terminal_ui import (
+        ProgressGroup, ask_confirmation, draw_spinner_frame, draw_spinner_result,
+        hide_cursor, show_cursor, update_progress, wait_for_keypress,
+    )
+else:
+    import terminal_ui
+    from terminal_ui import (
+        ProgressGroup, ask_confirmation, draw_spinner_frame, draw_spinner_result,
+        hide_cursor, show_cursor, update_progress, wait_for_keypress,
+    )
+
+# ============================================================================
+# Progress
+# ============================================================================
+
+async def update_progress_async(current: int, total: int = None, width: int = 50):
+    """Awaitable update_progress(): draws (throttled) and yields to the loop"""
+    update_progress(current, total, width)
+    await asyncio.sleep(0)
+
+# ============================================================================
+# Spinner
+# ============================================================================
+
+class AsyncSpinner:
+    """
+    Spinner animated by an asyncio task while the awaited work runs
+
+    Stops as soon as the block exits and shows ✓, or ✗ if the block raised
+    or fail() was called.
+
+    Usage:
+        async with AsyncSpinner("Updating Homebrew") as spinner:
+            process = await asyncio.create_subprocess_exec("brew", "update")
+            if await process.wait():
+                spinner.fail()
+    """
+
+    def __init__(self, message: str, interval: float = 0.1):
+        self.message = message
+        self.interval = interval
+        self.failed = False
+        self._task = None
+
+    def fail(self, message: str = None):
+        """Mark the spinner as failed (optionally replacing its message)"""
+        self.failed = True
+        if message is not None:
+            self.message = message
+
+    async def __aenter__(self):
+        self.failed = False
+        if terminal_ui.PLAIN_MODE:
+            return self
+        hide_cursor()
+        self._task = asyncio.create_task(self._animate())
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        draw_spinner_result(self.message, exc_type is not None or self.failed)
+        show_cursor()
+        return False
+
+    async def _animate(self):
+        index = 0
+        while True:
+            draw_spinner_frame(index, self.message)
+            index += 1
+            await asyncio.sleep(self.interval)
+
+# ============================================================================
+# Input
+# ============================================================================
+
+async def ask_confirmation_async(message: str, default: str = "n") -> bool:
+    """
+    ask_confirmation() that waits for input without blocking the event loop
+
+    The blocking read runs in the default executor; other tasks (spinners,
+    subprocess jobs) keep running while the user answers.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, ask_confirmation, message, default)
+
+async def wait_for_keypress_async():
+    """wait_for_keypress() that does not block the event loop"""
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, wait_for_keypress)
+
+# ============================================================================
+# Concurrent Subprocess Orchestration
+# ============================================================================
+
+class JobResult(NamedTuple):
+    """Outcome of one job run by run_subprocesses()"""
+    name: str
+    returncode: int    # -1 if reading the job itself failed
+    output: str        # last output lines (stdout and stderr combined)
+    duration: float    # seconds
+
+def _job_message(text: str, limit: int = 50) -> str:
+    """Shorten a status message so a group line never wraps"""
+    return text if len(text) <= limit else text[:limit - 1] + '…'
+
+async def _run_job(group: ProgressGroup, semaphore: asyncio.Semaphore,
+                   name: str, argv: Sequence[str], tail_lines: int) -> JobResult:
+    async with semaphore:
+        group.update(name, 0, message="running")
+        start = time.monotonic()
+
+        try:
+            if not argv:
+                raise ValueError("empty command")
+            process = await asyncio.create_subprocess_exec(
+                *argv,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+            )
+        except (OSError, ValueError) as exc:
+            # Could not start (missing program, empty argv, NUL in an argument)
+            reason = getattr(exc, 'strerror', None) or str(exc)
+            group.update(name, 1, message=_job_message(f"✗ {reason}"))
+            return JobResult(name, 127, str(exc), time.monotonic() - start)
+
+        tail = collections.deque(maxlen=tail_lines)
+        try:
+            await _stream_output(process.stdout, tail, lambda line: group.update(
+                name, 0, message=_job_message(line)))
+            returncode = await process.wait()
+        except Exception as exc:
+            tail.append(f"{type(exc).__name__}: {exc}")
+            returncode = -1
+        finally:
+            # Never leave a child behind (failed read, cancellation)
+            if process.returncode is None:
+                with contextlib.suppress(ProcessLookupError):
+                    process.kill()
+                await process.wait()
+
+        status = "✓ done" if returncode == 0 else f"✗ exit {returncode}"
+        group.update(name, 1, message=status)
+        return JobResult(name, returncode, "\n".join(tail), time.monotonic() - start)
+
+async def _stream_output(stream: asyncio.StreamReader, tail: collections.deque,
+                         on_line, chunk_size: int = 65536):
+    """
+    Feed output lines into tail, calling on_line for each non-empty one
+
+    Reads fixed-size chunks and splits lines itself, so a long line without
+    a newline cannot overrun the StreamReader limit; such a line is kept
+    only up to chunk_size characters.
+    """
+    pending = b''
+    while True:
+        chunk = await stream.read(chunk_size)
+        if not chunk:
+            break
+        lines = (pending + chunk).split(b'\n')
+        pending = lines.pop()[-chunk_size:]
+        for raw_line in lines:
+            line = raw_line.decode(errors='replace').strip()
+            if line:
+                tail.append(line)
+                on_line(line)
+    line = pending.decode(errors='replace').strip()
+    if line:
+        tail.append(line)
+        on_line(line)
+
+async def _repaint_group(group: ProgressGroup, fps: float):
+    interval = 1.0 / fps if fps > 0 else 0.1
+    while True:
+        group.refresh()
+        await asyncio.sleep(interval)
+
+async def run_subprocesses(jobs: dict[str, Sequence[str]], max_concurrency: int = 8,
+                           fps: float = 10.0, tail_lines: int = 20) -> dict[str, JobResult]:
+    """
+    Run many commands concurrently, each bound to its own UI slot
+
+    Every job gets a line in a ProgressGroup showing its latest output line
+    and, once finished, ✓ or its exit status. The group is repainted from
+    the event loop at most fps times per second.
+
+    Args:
+        jobs: Mapping of job name to argv (e.g. {"npm": ["npm", "update", "-g"]})
+        max_concurrency: Maximum number of processes running at once
+        fps: Maximum repaint rate of the job display
+        tail_lines: Number of trailing output lines kept per job
+
+    Returns:
+        Mapping of job name to JobResult, in the order jobs were given
+    """
+    group = ProgressGroup(jobs.keys(), total=1, fps=fps)
+    for name in jobs:
+        group.update(name, 0, message="queued")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    hide_cursor()
+    painter = asyncio.create_task(_repaint_group(group, fps))
+    try:
+        outcomes = await asyncio.gather(
+            *(_run_job(group, semaphore, name, argv, tail_lines) for name, argv in jobs.items()),
+            return_exceptions=True,
+        )
+    finally:
+        painter.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await painter
+        group.refresh(force=True)
+        show_cursor()
+
+    # A job that raised anyway still gets a (failed) result; siblings keep theirs
+    results = {}
+    for name, outcome in zip(jobs, outcomes):
+        if isinstance(outcome, BaseException):
+            if isinstance(outcome, asyncio.CancelledError):
+                raise outcome
+            outcome = JobResult(name, -1, f"{type(outcome).__name__}: {outcome}", 0.0)
+        results[name] = outcome
+    return results
+
+
+# ============================================================================
+# Demo and Testing
+# ============================================================================
+
+if __name__ == '__main__':
+    async def _demo():
+        async with AsyncSpinner("Warming up the event loop"):
+            await asyncio.sleep(1)
+
+        results = await run_subprocesses({
+            "fast": ["sh", "-c", "for i in 1 2 3; do echo step $i; sleep 0.2; done"],
+            "slow": ["sh", "-c", "for i in 1 2 3 4 5; do echo step $i; sleep 0.3; done"],
+            "broken": ["sh", "-c", "echo failing; sleep 0.5; exit 3"],
+        })
+        for result in results.values():
+            print(f"{result.name}: exit {result.returncode} in {result.duration:.2f}s")
+
+    asyncio.run(_demo())
@@ -1,4 +1,24 @@
+import os
 import sys
+
+# Startup profiling: set to True (or run `IPYTHON_PROFILE_STARTUP=1 ipython`)
+# to print where startup time goes before the first prompt.
+profile_startup = os.environ.get('IPYTHON_PROFILE_STARTUP', '') not in ('', '0')
+startup_budget_ms = 300
+
+if profile_startup:
+    import importlib.util
+
+    _spec = importlib.util.spec_from_file_location(
+        'startup_profiler',
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'startup_profiler.py'))
+    startup_profiler = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(startup_profiler)
+    sys.modules['startup_profiler'] = startup_profiler
+
+    profiler = startup_profiler.profiler = startup_profiler.StartupProfiler(startup_budget_ms)
+    profiler.install()
+
 from prompt_toolkit.key_binding.vi_state import InputMode, ViState
 
 
@@ -21,3 +41,11 @@ def set_input_mode(self, mode):
 ViState._input_mode = InputMode.INSERT
 ViState.input_mode = property(get_input_mode, set_input_mode)
 c.TerminalInteractiveShell.editing_mode = 'vi'
+
+if profile_startup:
+    import time
+
+    profiler.records.append(('config', os.path.basename(__file__),
+                             time.perf_counter() - profiler.started))
+    # exec_lines run after extensions and startup files, right before the prompt
+    c.InteractiveShellApp.exec_lines.append("__import__('startup_profiler').profiler.report()")
@@ -0,0 +1,62 @@
+# Lazy aliases for heavy modules: np, pd, plt, ... cost nothing until used.
+#
+# Each alias is bound to a proxy that imports the real module on first
+# attribute access (including tab completion and `np?`) and then replaces
+# itself in the namespace. Aliases are only bound for installed modules and
+# never shadow a name that is already defined. (Comments rather than a
+# docstring: startup files run in the user namespace.)
+
+
+def _install_lazy_imports(namespace):
+    import importlib
+    import importlib.util
+
+    modules = {
+        'np': 'numpy',
+        'pd': 'pandas',
+        'pl': 'polars',
+        'plt': 'matplotlib.pyplot',
+        'sns': 'seaborn',
+        'sp': 'scipy',
+        'sympy': 'sympy',
+    }
+
+    class LazyModule:
+        __slots__ = ('_alias', '_name')
+
+        def __init__(self, alias, name):
+            object.__setattr__(self, '_alias', alias)
+            object.__setattr__(self, '_name', name)
+
+        def _load(self):
+            alias = object.__getattribute__(self, '_alias')
+            module = importlib.import_module(object.__getattribute__(self, '_name'))
+            if namespace.get(alias) is self:
+                namespace[alias] = module
+            return module
+
+        def __getattribute__(self, attr):
+            return getattr(LazyModule._load(self), attr)
+
+        def __setattr__(self, attr, value):
+            setattr(LazyModule._load(self), attr, value)
+
+        def __dir__(self):
+            return dir(LazyModule._load(self))
+
+        def __repr__(self):
+            return f"<lazy module '{object.__getattribute__(self, '_name')}'>"
+
+    for alias, name in modules.items():
+        if alias in namespace:
+            continue
+        try:
+            installed = importlib.util.find_spec(name.partition('.')[0]) is not None
+        except (ImportError, ValueError):
+            installed = False
+        if installed:
+            namespace[alias] = LazyModule(alias, name)
+
+
+_install_lazy_imports(globals())
+del _install_lazy_imports
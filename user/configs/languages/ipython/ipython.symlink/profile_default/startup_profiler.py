@@ -0,0 +1,109 @@
+"""Startup profiler for this IPython profile.
+
+Enabled from ipython_config.py (``profile_startup = True``, or
+``IPYTHON_PROFILE_STARTUP=1 ipython``). It times the config file, each
+extension, each startup file and every top-level import made after the
+config starts loading, then prints a report against the startup budget
+just before the first prompt.
+"""
+import builtins
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+
+def _process_age():
+    """Seconds since this process started (Linux only, 10 ms resolution)"""
+    try:
+        with open('/proc/self/stat') as f:
+            start_ticks = int(f.read().rpartition(')')[2].split()[19])
+        with open('/proc/uptime') as f:
+            uptime = float(f.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+    return uptime - start_ticks / os.sysconf('SC_CLK_TCK')
+
+
+class StartupProfiler:
+    def __init__(self, budget_ms=300.0):
+        self.budget_ms = budget_ms
+        self.started = time.perf_counter()
+        self.before_config = _process_age()
+        self.records = []                       # (category, name, seconds)
+        self._import_depth = 0
+        self._original_import = None
+        self._patches = []
+
+    @contextmanager
+    def measure(self, category, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.records.append((category, name, time.perf_counter() - start))
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # Only imports that actually load something, at the outermost level
+        if level or self._import_depth or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+        self._import_depth += 1
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            self._import_depth -= 1
+            self.records.append(('import', name, time.perf_counter() - start))
+
+    def _wrap(self, owner, attr, category, describe):
+        original = getattr(owner, attr)
+        profiler = self
+
+        def timed(*args, **kwargs):
+            with profiler.measure(category, describe(*args, **kwargs)):
+                return original(*args, **kwargs)
+
+        setattr(owner, attr, timed)
+        self._patches.append((owner, attr, original))
+
+    def install(self):
+        """Start timing imports, extensions and startup files"""
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._import
+
+        # Both are imported by IPython before it reads the config
+        extensions = sys.modules.get('IPython.core.extensions')
+        if extensions is not None:
+            self._wrap(extensions.ExtensionManager, 'load_extension', 'extension',
+                       lambda manager, module_str: module_str)
+        shellapp = sys.modules.get('IPython.core.shellapp')
+        if shellapp is not None:
+            self._wrap(shellapp.InteractiveShellApp, '_exec_file', 'startup file',
+                       lambda app, fname, *args, **kwargs: os.path.basename(fname))
+
+    def uninstall(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+        for owner, attr, original in reversed(self._patches):
+            setattr(owner, attr, original)
+        self._patches.clear()
+
+    def report(self, file=None):
+        """Print where startup time went; call once, just before the prompt"""
+        self.uninstall()
+        file = file or sys.stdout
+        total_ms = (time.perf_counter() - self.started) * 1000
+
+        print('Startup profile', file=file)
+        if self.before_config is not None:
+            before_ms = self.before_config * 1000
+            print(f'  {"before config (python + IPython)":<44} {before_ms:8.1f} ms', file=file)
+            total_ms += before_ms
+        for category, name, seconds in sorted(self.records, key=lambda r: -r[2]):
+            if seconds * 1000 >= 1.0 or category != 'import':
+                print(f'  {category + ": " + name:<44} {seconds * 1000:8.1f} ms', file=file)
+
+        verdict = 'within' if total_ms <= self.budget_ms else 'OVER'
+        print(f'  {"total":<44} {total_ms:8.1f} ms  ({verdict} the {self.budget_ms:.0f} ms budget)',
+              file=file)
@@ -1,11 +1,16 @@
 # pyright: reportMissingImports=false
 import datetime
+import os
 import re
 import shlex
-from subprocess import Popen, PIPE
+import threading
+import time
+from subprocess import Popen, PIPE, TimeoutExpired
+from typing import Callable, Dict, Iterable, NamedTuple, Optional, Tuple
 
 
-from kitty.fast_data_types import Screen
+# wcswidth is kitty's own width function, so layout agrees with what it renders
+from kitty.fast_data_types import Screen, wcswidth
 
 # from kitty.rgb import Color
 from kitty.tab_bar import DrawData, ExtraData, TabBarData, as_rgb, draw_title
@@ -17,18 +22,56 @@ def calc_draw_spaces(*args) -> int:
     for i in args:
         if not isinstance(i, str):
             i = str(i)
-        length += len(i)
+        length += wcswidth(i)
     return length
 
 
-def get_battery_status() -> str:
+BATTERY_ICON = "󰂑"
+POWER_SUPPLY_DIR = "/sys/class/power_supply"
+
+
+def read_sysfs_battery(root: str = POWER_SUPPLY_DIR) -> Optional[str]:
+    """Battery status from sysfs (Linux); None if there is no power_supply class.
+
+    A power_supply class without a battery (desktops, UPS-only supplies) gives
+    "", which hides the segment.
+    """
+    try:
+        supplies = os.listdir(root)
+    except OSError:
+        return None
+
+    capacities = []
+    for name in supplies:
+        supply = os.path.join(root, name)
+        try:
+            with open(os.path.join(supply, "type")) as f:
+                if f.read().strip() != "Battery":
+                    continue
+            with open(os.path.join(supply, "capacity")) as f:
+                capacities.append(int(f.read()))
+        except (OSError, ValueError):
+            continue
+
+    if not capacities:
+        return ""
+    return f"{BATTERY_ICON} {round(sum(capacities) / len(capacities))}%"
+
+
+def run_battery_command(timeout: float = 10.0) -> str:
+    """The `battery --kitty` helper via a login shell (slow: forks zsh -l)."""
     try:
         session = Popen(
             shlex.split("/bin/zsh -l -c 'battery --kitty'"),
             stdout=PIPE,
             stderr=PIPE,
         )
-        stdout, _ = session.communicate()
+        try:
+            stdout, _ = session.communicate(timeout=timeout)
+        except TimeoutExpired:
+            session.kill()
+            session.communicate()
+            return "N/A"
 
         if session.returncode == 0:
             return re.sub(r"^\s*(.*)\s*$", r"\1", stdout.decode("utf8"))
@@ -37,6 +80,396 @@ def get_battery_status() -> str:
     return "N/A"
 
 
+class BatteryProvider:
+    """Battery status with a TTL cache, refreshed on a background thread.
+
+    get() never blocks: it returns the last known status and, once that is
+    older than its TTL, starts a refresh thread. sysfs is read directly on
+    Linux; only where it doesn't exist is the `battery --kitty` command used,
+    with a much longer TTL since every call forks a login shell. The status
+    is empty (segment hidden) until the first read and on machines without
+    a battery.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 30.0,
+        command_ttl: float = 120.0,
+        sysfs_root: str = POWER_SUPPLY_DIR,
+    ) -> None:
+        self.ttl = ttl
+        self.command_ttl = command_ttl
+        self.sysfs_root = sysfs_root
+        self._status = ""
+        self._next_refresh = 0.0
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+    def get(self) -> str:
+        if time.monotonic() >= self._next_refresh:
+            self.refresh_async()
+        return self._status
+
+    def refresh_async(self) -> None:
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self.refresh, name="battery", daemon=True).start()
+
+    def refresh(self) -> str:
+        ttl = self.ttl
+        try:
+            status = read_sysfs_battery(self.sysfs_root)
+            if status is None:
+                status = run_battery_command()
+                ttl = self.command_ttl
+            self._status = status
+        finally:
+            self._next_refresh = time.monotonic() + ttl
+            self._refreshing = False
+        return self._status
+
+
+battery_provider = BatteryProvider()
+# Start reading right away so the segment shows up on the first draws
+battery_provider.refresh_async()
+
+
+def get_battery_status() -> str:
+    return battery_provider.get()
+
+
+class Segment:
+    """A right-status cell: a render function and how often to call it."""
+
+    def __init__(self, name: str, render: Callable[[], str], interval: float) -> None:
+        self.name = name
+        self.render = render
+        self.interval = interval
+        self.value = ""
+        self.next_due = 0.0
+        self.refreshes = 0
+        self.errors = 0
+        self.last_cost = 0.0
+        self.total_cost = 0.0
+        self.max_cost = 0.0
+
+
+class SegmentRegistry:
+    """Right-status segments, refreshed by a worker into an immutable snapshot.
+
+    The worker renders each enabled segment once its interval has elapsed and
+    publishes the non-empty values as a new tuple. Drawing only reads
+    snapshot(), so a slow segment never adds latency to a tab bar repaint.
+    """
+
+    def __init__(self) -> None:
+        self._segments: Dict[str, Segment] = {}
+        self._enabled: Tuple[Segment, ...] = ()
+        self._snapshot: Tuple[str, ...] = ()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, name: str, render: Callable[[], str], interval: float) -> None:
+        self._segments[name] = Segment(name, render, interval)
+
+    def enable(self, names: Iterable[str]) -> None:
+        """Choose which registered segments are shown, left to right."""
+        self._enabled = tuple(self._segments[name] for name in names)
+        self._snapshot = tuple(s.value for s in self._enabled if s.value)
+
+    def snapshot(self) -> Tuple[str, ...]:
+        return self._snapshot
+
+    def stats(self) -> Dict[str, dict]:
+        """Refresh cost of each enabled segment, in milliseconds."""
+        return {
+            s.name: {
+                "interval": s.interval,
+                "refreshes": s.refreshes,
+                "errors": s.errors,
+                "last_ms": s.last_cost * 1000,
+                "avg_ms": s.total_cost * 1000 / s.refreshes if s.refreshes else 0.0,
+                "max_ms": s.max_cost * 1000,
+            }
+            for s in self._enabled
+        }
+
+    def refresh_due(self) -> float:
+        """Render the segments that are due; returns seconds until the next one."""
+        now = time.monotonic()
+        changed = False
+        for segment in self._enabled:
+            if now < segment.next_due:
+                continue
+            start = time.perf_counter()
+            try:
+                value = segment.render()
+            except Exception:
+                value = ""
+                segment.errors += 1
+            cost = time.perf_counter() - start
+            segment.refreshes += 1
+            segment.last_cost = cost
+            segment.total_cost += cost
+            segment.max_cost = max(segment.max_cost, cost)
+            segment.next_due = now + segment.interval
+            if value != segment.value:
+                segment.value = value
+                changed = True
+
+        if changed:
+            self._snapshot = tuple(s.value for s in self._enabled if s.value)
+        if not self._enabled:
+            return 1.0
+        return max(0.0, min(s.next_due for s in self._enabled) - time.monotonic())
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self.refresh_due()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="tab-bar-segments", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(max(0.05, self.refresh_due())):
+            pass
+
+
+def clock_segment() -> str:
+    return " " + datetime.datetime.now().strftime("%H:%M")
+
+
+def load_segment() -> str:
+    return f"󰊚 {os.getloadavg()[0]:.2f}"
+
+
+def memory_segment() -> str:
+    """Used memory from /proc/meminfo (Linux); empty (hidden) elsewhere."""
+    fields = {}
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                fields[key] = int(value.split()[0])
+    except (OSError, ValueError, IndexError):
+        return ""
+    total, available = fields.get("MemTotal"), fields.get("MemAvailable")
+    if not total or available is None:
+        return ""
+    return f"󰍛 {round((total - available) * 100 / total)}%"
+
+
+# kitty's Boss and Window objects may only be used on the main thread, so
+# draw_tab records the active window's cwd here and the segment worker
+# only reads the string
+GIT_SEGMENT_INTERVAL = 3.0
+_active_cwd: Optional[str] = None
+_active_window_id: Optional[int] = None
+_next_cwd_capture = 0.0
+
+
+def capture_active_cwd() -> None:
+    """Record the active window's cwd; main thread only (called by draw_tab).
+
+    cwd_of_child reads /proc, so it is only re-read when the active window
+    changes or once per git segment interval, not on every draw.
+    """
+    global _active_cwd, _active_window_id, _next_cwd_capture
+    try:
+        from kitty.boss import get_boss
+
+        window = get_boss().active_window
+        window_id = window.id if window else None
+        now = time.monotonic()
+        if window_id == _active_window_id and now < _next_cwd_capture:
+            return
+        _active_window_id = window_id
+        _next_cwd_capture = now + GIT_SEGMENT_INTERVAL
+        _active_cwd = window.cwd_of_child if window else None
+    except Exception:
+        _active_cwd = None
+
+
+def active_window_cwd() -> Optional[str]:
+    return _active_cwd
+
+
+def git_branch_segment() -> str:
+    """Branch of the repository around the active window's cwd (reads .git/HEAD)."""
+    path = active_window_cwd()
+    while path:
+        try:
+            with open(os.path.join(path, ".git", "HEAD")) as f:
+                ref = f.read().strip()
+        except OSError:
+            parent = os.path.dirname(path)
+            path = None if parent == path else parent
+            continue
+        if ref.startswith("ref:"):
+            return " " + ref.rpartition("refs/heads/")[2]
+        return " " + ref[:7]
+    return ""
+
+
+segment_registry = SegmentRegistry()
+segment_registry.register("clock", clock_segment, interval=1.0)
+segment_registry.register("battery", get_battery_status, interval=5.0)
+segment_registry.register("load", load_segment, interval=5.0)
+segment_registry.register("memory", memory_segment, interval=5.0)
+segment_registry.register("git", git_branch_segment, interval=GIT_SEGMENT_INTERVAL)
+
+# Shown left to right; add "load", "memory" or "git" to show more
+RIGHT_STATUS_SEGMENTS = ("clock", "battery")
+
+segment_registry.enable(RIGHT_STATUS_SEGMENTS)
+segment_registry.start()
+
+
+class TabColors(NamedTuple):
+    active_fg: int
+    active_bg: int
+    inactive_fg: int
+    inactive_bg: int
+
+
+class TabLayout(NamedTuple):
+    """What _draw_left_status draws around a tab title, resolved once."""
+
+    leading: str
+    start_fg: int
+    start: str
+    title_fg: int
+    title_bg: int
+    title_styled: bool
+    title_length: int
+    overflow: str
+    overflow_width: int
+    trailing: str
+    end_fg: int
+    end: str
+    sep_fg: int
+    sep: str
+
+
+class DrawCache:
+    """Colors and layouts resolved against one DrawData.
+
+    kitty keeps the same DrawData until its options change, so the
+    as_rgb(color_as_int(...)) calls and the width math are done once and an
+    unchanged tab only replays its cached layout on each repaint.
+    """
+
+    def __init__(self, draw_data: DrawData) -> None:
+        self.draw_data = draw_data
+        self.colors = TabColors(
+            as_rgb(color_as_int(draw_data.active_fg)),
+            as_rgb(color_as_int(draw_data.active_bg)),
+            as_rgb(color_as_int(draw_data.inactive_fg)),
+            as_rgb(color_as_int(draw_data.inactive_bg)),
+        )
+        self.tabs: Dict[Tuple[bool, bool, int], TabLayout] = {}
+        self._right_snapshot: Optional[Tuple[str, ...]] = None
+        self._right_status: Tuple[str, int] = ("", 0)
+
+    def tab_layout(
+        self, is_active: bool, is_last: bool, max_title_length: int
+    ) -> TabLayout:
+        key = (is_active, is_last, max_title_length)
+        layout = self.tabs.get(key)
+        if layout is None:
+            layout = self.tabs[key] = self._build_tab_layout(*key)
+        return layout
+
+    def _build_tab_layout(
+        self, is_active: bool, is_last: bool, max_title_length: int
+    ) -> TabLayout:
+        bar_terminator_l = "█"
+        bar_terminator_l_active = "█"
+        bar_terminator_r = "█"
+        bar_terminator_r_active = "█"
+        bar_terminator_r_last = ""
+        overlength_indicator = " …"
+        right_padding = " "
+
+        draw_data, colors = self.draw_data, self.colors
+        trailing_spaces = min(max_title_length - 1, draw_data.trailing_spaces)
+
+        if is_active:
+            start_fg, start = colors.active_bg, bar_terminator_l_active
+            title_fg, title_bg = colors.active_fg, colors.active_bg
+            end_fg, end = colors.active_bg, bar_terminator_r_active
+        else:
+            start_fg, start = colors.inactive_bg, bar_terminator_l
+            title_fg, title_bg = colors.inactive_fg, colors.inactive_bg
+            end_fg, end = colors.inactive_bg, bar_terminator_r
+
+        if is_last:
+            sep_fg, sep = colors.inactive_bg, bar_terminator_r_last + right_padding
+        else:
+            sep_fg, sep = colors.inactive_fg, draw_data.sep
+
+        return TabLayout(
+            leading=" " * draw_data.leading_spaces,
+            start_fg=start_fg,
+            start=start,
+            title_fg=title_fg,
+            title_bg=title_bg,
+            title_styled=is_active,
+            title_length=max_title_length - trailing_spaces,
+            overflow=overlength_indicator,
+            overflow_width=calc_draw_spaces(overlength_indicator),
+            trailing=" " * trailing_spaces,
+            end_fg=end_fg,
+            end=end,
+            sep_fg=sep_fg,
+            sep=sep,
+        )
+
+    def right_status(self, snapshot: Tuple[str, ...]) -> Tuple[str, int]:
+        """The right-status text for a segment snapshot and its width in cells."""
+        if snapshot is self._right_snapshot:
+            return self._right_status
+
+        separator = " ︙ "
+        padding = "  "
+
+        cells = [padding]
+        for position, value in enumerate(snapshot):
+            if position:
+                cells.append(separator)
+            cells.append(value)
+        cells.append(padding)
+
+        text = "".join(cells)
+        self._right_snapshot = snapshot
+        self._right_status = (text, calc_draw_spaces(text))
+        return self._right_status
+
+
+_draw_cache: Optional[DrawCache] = None
+
+
+def get_draw_cache(draw_data: DrawData) -> DrawCache:
+    global _draw_cache
+    cache = _draw_cache
+    if cache is None or (
+        cache.draw_data is not draw_data and cache.draw_data != draw_data
+    ):
+        cache = _draw_cache = DrawCache(draw_data)
+    return cache
+
+
 def _draw_icon(
     draw_data: DrawData, screen: Screen, index: int, template: str = "  󰄛  "
 ) -> int:
@@ -49,6 +482,8 @@ def _draw_icon(
     left_padding = "  "
     right_padding = ""
 
+    colors = get_draw_cache(draw_data).colors
+
     saved_crs_fg, saved_crs_bg, saved_crs_bd, saved_crs_it = (
         screen.cursor.fg,
         screen.cursor.bg,
@@ -58,14 +493,14 @@ def _draw_icon(
 
     screen.cursor.bold = screen.cursor.italic = True
 
-    screen.cursor.fg = as_rgb(color_as_int(draw_data.active_fg))
-    screen.cursor.bg = as_rgb(color_as_int(draw_data.inactive_bg))
+    screen.cursor.fg = colors.active_fg
+    screen.cursor.bg = colors.inactive_bg
 
     screen.draw(left_padding)
     screen.draw(template)
     screen.draw(right_padding)
 
-    screen.cursor.fg = as_rgb(color_as_int(draw_data.inactive_bg))
+    screen.cursor.fg = colors.inactive_bg
     screen.cursor.bg = 0
     screen.draw(bar_terminator)
     screen.draw(draw_data.sep)
@@ -96,13 +531,9 @@ def _draw_left_status(
     is_last: bool,
     ExtraData: ExtraData,
 ) -> int:
-    bar_terminator_l = "█"
-    bar_terminator_l_active = "█"
-    bar_terminator_r = "█"
-    bar_terminator_r_active = "█"
-    bar_terminator_r_last = ""
-    overlength_indicator = " …"
-    right_padding = " "
+    layout = get_draw_cache(draw_data).tab_layout(
+        tab.is_active, is_last, max_title_length
+    )
 
     saved_crs_fg, saved_crs_bg, saved_crs_bd, saved_crs_it = (
         screen.cursor.fg,
@@ -111,60 +542,40 @@ def _draw_left_status(
         screen.cursor.italic,
     )
 
-    if draw_data.leading_spaces:
+    if layout.leading:
         screen.cursor.bg = 0
-        screen.draw(" " * draw_data.leading_spaces)
+        screen.draw(layout.leading)
 
-    if tab.is_active:
-        screen.cursor.fg = as_rgb(color_as_int(draw_data.active_bg))
-        screen.cursor.bg = 0
-        screen.draw(bar_terminator_l_active)
+    screen.cursor.fg = layout.start_fg
+    screen.cursor.bg = 0
+    screen.draw(layout.start)
 
-        screen.cursor.fg = as_rgb(color_as_int(draw_data.active_fg))
-        screen.cursor.bg = as_rgb(color_as_int(draw_data.active_bg))
+    screen.cursor.fg = layout.title_fg
+    screen.cursor.bg = layout.title_bg
+    if layout.title_styled:
         screen.cursor.bold = screen.cursor.italic = True
-    else:
-        screen.cursor.fg = as_rgb(color_as_int(draw_data.inactive_bg))
-        screen.cursor.bg = 0
-        screen.draw(bar_terminator_l)
-
-        screen.cursor.fg = as_rgb(color_as_int(draw_data.inactive_fg))
-        screen.cursor.bg = as_rgb(color_as_int(draw_data.inactive_bg))
 
+    # The title goes through kitty so title templates keep working
     draw_title(draw_data, screen, tab, index)
 
-    trailing_spaces = min(max_title_length - 1, draw_data.trailing_spaces)
-    max_title_length -= trailing_spaces
-    extra = screen.cursor.x - before - max_title_length
+    extra = screen.cursor.x - before - layout.title_length
 
     if extra > 0:
-        screen.cursor.x -= extra + len(overlength_indicator)
-        screen.draw(overlength_indicator)
+        screen.cursor.x -= extra + layout.overflow_width
+        screen.draw(layout.overflow)
 
-    if trailing_spaces:
+    if layout.trailing:
         screen.cursor.bg = 0
-        screen.draw(" " * trailing_spaces)
+        screen.draw(layout.trailing)
 
     screen.cursor.bold = screen.cursor.italic = False
 
-    if tab.is_active:
-        screen.cursor.fg = as_rgb(color_as_int(draw_data.active_bg))
-        screen.cursor.bg = 0
-        screen.draw(bar_terminator_r_active)
-    else:
-        screen.cursor.fg = as_rgb(color_as_int(draw_data.inactive_bg))
-        screen.cursor.bg = 0
-        screen.draw(bar_terminator_r)
+    screen.cursor.fg = layout.end_fg
+    screen.cursor.bg = 0
+    screen.draw(layout.end)
 
-    if is_last:
-        screen.cursor.fg = as_rgb(color_as_int(draw_data.inactive_bg))
-        screen.cursor.bg = 0
-        screen.draw(bar_terminator_r_last)
-        screen.draw(right_padding)
-    else:
-        screen.cursor.fg = as_rgb(color_as_int(draw_data.inactive_fg))
-        screen.cursor.bg = 0
-        screen.draw(draw_data.sep)
+    screen.cursor.fg = layout.sep_fg
+    screen.draw(layout.sep)
     (
         screen.cursor.fg,
         screen.cursor.bg,
@@ -187,6 +598,9 @@ def _draw_right_status(
     if not is_last:
         return 0
 
+    cache = get_draw_cache(draw_data)
+    colors = cache.colors
+
     saved_crs_fg, saved_crs_bg, saved_crs_bd, saved_crs_it = (
         screen.cursor.fg,
         screen.cursor.bg,
@@ -194,34 +608,20 @@ def _draw_right_status(
         screen.cursor.italic,
     )
 
-    right_status_length = 1
-
     # "█",
     # "█",
     bar_terminator = ""
-    right_status_length += len(bar_terminator)
-
-    clock_icon = " "
-    time = datetime.datetime.now().strftime("%H:%M")
-    separator = " ︙ "
-    # battery_icon = "󰂑"
-    battery_status = get_battery_status()
-    padding = "  "
-
-    cells = [
-        padding,
-        clock_icon,
-        time,
-        separator,
-        battery_status,
-        padding,
-    ]
-
-    for cell in cells:
-        right_status_length += calc_draw_spaces(cell)
+
+    # Latest values published by the segment worker; nothing is computed here
+    text, text_length = cache.right_status(segment_registry.snapshot())
+    right_status_length = 1 + calc_draw_spaces(bar_terminator) + text_length
 
     draw_spaces = screen.columns - screen.cursor.x - right_status_length
 
+    # Too many tabs to fit it: keep the titles rather than clip both
+    if draw_spaces < 0:
+        return screen.cursor.x
+
     if draw_spaces > 0:
         bg = screen.cursor.bg
         screen.cursor.bg = 0
@@ -231,18 +631,17 @@ def _draw_right_status(
     if screen.columns - screen.cursor.x > right_status_length:
         screen.cursor.x = screen.columns - right_status_length
 
-    screen.cursor.fg = as_rgb(color_as_int(draw_data.inactive_bg))
+    screen.cursor.fg = colors.inactive_bg
     screen.cursor.bg = 0
 
     screen.draw(bar_terminator)
 
-    screen.cursor.fg = as_rgb(color_as_int(draw_data.active_fg))
-    screen.cursor.bg = as_rgb(color_as_int(draw_data.inactive_bg))
+    screen.cursor.fg = colors.active_fg
+    screen.cursor.bg = colors.inactive_bg
 
     screen.cursor.bold = screen.cursor.italic = True
 
-    for cell in cells:
-        screen.draw(cell)
+    screen.draw(text)
 
     (
         screen.cursor.fg,
@@ -268,6 +667,8 @@ def draw_tab(
     is_last: bool,
     extra_data: ExtraData,
 ) -> int:
+    if tab.is_active and "git" in RIGHT_STATUS_SEGMENTS:
+        capture_active_cwd()
     _draw_icon(draw_data, screen, index, template="󰘧 ")
     _draw_left_status(
         draw_data,
@@ -1,6 +1,8 @@
 import ranger.api
 from ranger.core.linemode import LinemodeBase
 from .devicons import *
+from .gitstatus import git_status
+from .sniff import content_devicon
 
 @ranger.api.register_linemode
 class DevIconsLinemode(LinemodeBase):
@@ -10,3 +12,19 @@ class DevIconsLinemode(LinemodeBase):
 
   def filetitle(self, file, metadata):
     return devicon(file) + ' ' + file.relative_path
+
+@ranger.api.register_linemode
+class DevIconsContentLinemode(DevIconsLinemode):
+  """Like devicons, but a recognized magic number or shebang picks the icon"""
+  name = "devicons_content"
+
+  def filetitle(self, file, metadata):
+    return content_devicon(file) + ' ' + file.relative_path
+
+@ranger.api.register_linemode
+class DevIconsGitLinemode(DevIconsLinemode):
+  """Like devicons, with the file's git status (M, A, ?, !, ...) beside the icon"""
+  name = "devicons_git"
+
+  def filetitle(self, file, metadata):
+    return devicon(file) + (git_status(file) or ' ') + ' ' + file.relative_path
@@ -3,361 +3,161 @@
 # These glyphs, and the mapping of file extensions to glyphs
 # has been copied from the vimscript code that is present in
 # https://github.com/ryanoasis/vim-devicons
-import re;
-import os;
+#
+# The tables live in icon_table.py. Importing this module doesn't load
+# them: the first devicon() call imports icon_table (from its bytecode
+# cache, like any module), so ranger only pays for the icons once the
+# devicons linemode renders.
+import os
+import time
 
-# all those glyphs will show as weird squares if you don't have the correct patched font
-# My advice is to use NerdFonts which can be found here:
-# https://github.com/ryanoasis/nerd-fonts
-file_node_extensions = {
-    '7z'       : '',
-    'a'        : '',
-    'ai'       : '',
-    'apk'      : '',
-    'asm'      : '',
-    'asp'      : '',
-    'aup'      : '',
-    'avi'      : '',
-    'awk'      : '',
-    'bash'     : '',
-    'bat'      : '',
-    'bmp'      : '',
-    'bz2'      : '',
-    'c'        : '',
-    'c++'      : '',
-    'cab'      : '',
-    'cbr'      : '',
-    'cbz'      : '',
-    'cc'       : '',
-    'class'    : '',
-    'clj'      : '',
-    'cljc'     : '',
-    'cljs'     : '',
-    'cmake'    : '',
-    'coffee'   : '',
-    'conf'     : '',
-    'cp'       : '',
-    'cpio'     : '',
-    'cpp'      : '',
-    'cs'       : '',
-    'csh'      : '',
-    'css'      : '',
-    'cue'      : '',
-    'cvs'      : '',
-    'cxx'      : '',
-    'd'        : '',
-    'dart'     : '',
-    'db'       : '',
-    'deb'      : '',
-    'diff'     : '',
-    'dll'      : '',
-    'doc'      : '',
-    'docx'     : '',
-    'dump'     : '',
-    'edn'      : '',
-    'eex'      : '',
-    'efi'      : '',
-    'ejs'      : '',
-    'elf'      : '',
-    'elm'      : '',
-    'epub'     : '',
-    'erl'      : '',
-    'ex'       : '',
-    'exe'      : '',
-    'exs'      : '',
-    'f#'       : '',
-    'fifo'     : 'ﳣ',
-    'fish'     : '',
-    'flac'     : '',
-    'flv'      : '',
-    'fs'       : '',
-    'fsi'      : '',
-    'fsscript' : '',
-    'fsx'      : '',
-    'gem'      : '',
-    'gemspec'  : '',
-    'gif'      : '',
-    'go'       : '',
-    'gz'       : '',
-    'gzip'     : '',
-    'h'        : '',
-    'haml'     : '',
-    'hbs'      : '',
-    'hh'       : '',
-    'hpp'      : '',
-    'hrl'      : '',
-    'hs'       : '',
-    'htaccess' : '',
-    'htm'      : '',
-    'html'     : '',
-    'htpasswd' : '',
-    'hxx'      : '',
-    'ico'      : '',
-    'img'      : '',
-    'ini'      : '',
-    'iso'      : '',
-    'jar'      : '',
-    'java'     : '',
-    'jl'       : '',
-    'jpeg'     : '',
-    'jpg'      : '',
-    'js'       : '',
-    'json'     : '',
-    'jsx'      : '',
-    'key'      : '',
-    'ksh'      : '',
-    'leex'     : '',
-    'less'     : '',
-    'lha'      : '',
-    'lhs'      : '',
-    'log'      : '',
-    'lua'      : '',
-    'lzh'      : '',
-    'lzma'     : '',
-    'm4a'      : '',
-    'm4v'      : '',
-    'markdown' : '',
-    'md'       : '',
-    'mdx'      : '',
-    'mjs'      : '',
-    'mkv'      : '',
-    'ml'       : 'λ',
-    'mli'      : 'λ',
-    'mov'      : '',
-    'mp3'      : '',
-    'mp4'      : '',
-    'mpeg'     : '',
-    'mpg'      : '',
-    'msi'      : '',
-    'mustache' : '',
-    'nix'      : '',
-    'o'        : '',
-    'ogg'      : '',
-    'pdf'      : '',
-    'php'      : '',
-    'pl'       : '',
-    'pm'       : '',
-    'png'      : '',
-    'pp'       : '',
-    'ppt'      : '',
-    'pptx'     : '',
-    'ps1'      : '',
-    'psb'      : '',
-    'psd'      : '',
-    'pub'      : '',
-    'py'       : '',
-    'pyc'      : '',
-    'pyd'      : '',
-    'pyo'      : '',
-    'r'        : 'ﳒ',
-    'rake'     : '',
-    'rar'      : '',
-    'rb'       : '',
-    'rc'       : '',
-    'rlib'     : '',
-    'rmd'      : '',
-    'rom'      : '',
-    'rpm'      : '',
-    'rproj'    : '鉶',
-    'rs'       : '',
-    'rss'      : '',
-    'rtf'      : '',
-    's'        : '',
-    'sass'     : '',
-    'scala'    : '',
-    'scss'     : '',
-    'sh'       : '',
-    'slim'     : '',
-    'sln'      : '',
-    'so'       : '',
-    'sql'      : '',
-    'styl'     : '',
-    'suo'      : '',
-    'swift'    : '',
-    't'        : '',
-    'tar'      : '',
-    'tex'      : 'ﭨ',
-    'tgz'      : '',
-    'toml'     : '',
-    'ts'       : '',
-    'tsx'      : '',
-    'twig'     : '',
-    'vim'      : '',
-    'vimrc'    : '',
-    'vue'      : '﵂',
-    'wav'      : '',
-    'webm'     : '',
-    'webmanifest' : '',
-    'webp'     : '',
-    'xbps'     : '',
-    'xcplayground' : '',
-    'xhtml'    : '',
-    'xls'      : '',
-    'xlsx'     : '',
-    'xml'      : '',
-    'xul'      : '',
-    'xz'       : '',
-    'yaml'     : '',
-    'yml'      : '',
-    'zip'      : '',
-    'zsh'      : '',
-}
+__all__ = ['devicon', 'IconResolver', 'load_tables']
 
-dir_node_exact_matches = {
-# English
-    '.git'                             : '',
-    'Desktop'                          : '',
-    'Documents'                        : '',
-    'Downloads'                        : '',
-    'Dotfiles'                         : '',
-    'Dropbox'                          : '',
-    'Music'                            : '',
-    'Pictures'                         : '',
-    'Public'                           : '',
-    'Templates'                        : '',
-    'Videos'                           : '',
-# Spanish
-    'Escritorio'                       : '',
-    'Documentos'                       : '',
-    'Descargas'                        : '',
-    'Música'                           : '',
-    'Imágenes'                         : '',
-    'Público'                          : '',
-    'Plantillas'                       : '',
-    'Vídeos'                           : '',
-# French
-    'Bureau'                           : '',
-    'Documents'                        : '',
-    'Images'                           : '',
-    'Musique'                          : '',
-    'Publique'                         : '',
-    'Téléchargements'                  : '',
-    'Vidéos'                           : '',
-# Portuguese
-    'Documentos'                       : '',
-    'Imagens'                          : '',
-    'Modelos'                          : '',
-    'Música'                           : '',
-    'Público'                          : '',
-    'Vídeos'                           : '',
-    'Área de trabalho'                 : '',
-# Italian
-    'Documenti'                        : '',
-    'Immagini'                         : '',
-    'Modelli'                          : '',
-    'Musica'                           : '',
-    'Pubblici'                         : '',
-    'Scaricati'                        : '',
-    'Scrivania'                        : '',
-    'Video'                            : '',
-# German
-    'Bilder'                           : '',
-    'Dokumente'                        : '',
-    'Musik'                            : '',
-    'Schreibtisch'                     : '',
-    'Vorlagen'                         : '',
-    'Öffentlich'                       : '',
-# Hungarian
-    'Dokumentumok'                     : '',
-    'Képek'                            : '',
-    'Modelli'                          : '',
-    'Zene'                             : '',
-    'Letöltések'                       : '',
-    'Számítógép'                       : '',
-    'Videók'                           : '',
-}
+TABLE_NAMES = ('file_node_extensions', 'file_node_exact_matches', 'dir_node_exact_matches')
+# Used by sniff.py for its persistent cache
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+                         'ranger_devicons')
 
-file_node_exact_matches = {
-    '.bash_aliases'                    : '',
-    '.bash_history'                    : '',
-    '.bash_logout'                     : '',
-    '.bash_profile'                    : '',
-    '.bashprofile'                     : '',
-    '.bashrc'                          : '',
-    '.dmrc'                            : '',
-    '.DS_Store'                        : '',
-    '.fasd'                            : '',
-    '.fehbg'                           : '',
-    '.gitattributes'                   : '',
-    '.gitconfig'                       : '',
-    '.gitignore'                       : '',
-    '.gitlab-ci.yml'                   : '',
-    '.gvimrc'                          : '',
-    '.inputrc'                         : '',
-    '.jack-settings'                   : '',
-    '.mime.types'                      : '',
-    '.ncmpcpp'                         : '',
-    '.nvidia-settings-rc'              : '',
-    '.pam_environment'                 : '',
-    '.profile'                         : '',
-    '.recently-used'                   : '',
-    '.selected_editor'                 : '',
-    '.vim'                             : '',
-    '.viminfo'                         : '',
-    '.vimrc'                           : '',
-    '.Xauthority'                      : '',
-    '.Xdefaults'                       : '',
-    '.xinitrc'                         : '',
-    '.xinputrc'                        : '',
-    '.Xresources'                      : '',
-    '.zshrc'                           : '',
-    '_gvimrc'                          : '',
-    '_vimrc'                           : '',
-    'a.out'                            : '',
-    'authorized_keys'                  : '',
-    'bspwmrc'                          : '',
-    'cmakelists.txt'                   : '',
-    'config'                           : '',
-    'config.ac'                        : '',
-    'config.m4'                        : '',
-    'config.mk'                        : '',
-    'config.ru'                        : '',
-    'configure'                        : '',
-    'docker-compose.yml'               : '',
-    'dockerfile'                       : '',
-    'Dockerfile'                       : '',
-    'dropbox'                          : '',
-    'exact-match-case-sensitive-1.txt' : 'X1',
-    'exact-match-case-sensitive-2'     : 'X2',
-    'favicon.ico'                      : '',
-    'gemfile'                          : '',
-    'gruntfile.coffee'                 : '',
-    'gruntfile.js'                     : '',
-    'gruntfile.ls'                     : '',
-    'gulpfile.coffee'                  : '',
-    'gulpfile.js'                      : '',
-    'gulpfile.ls'                      : '',
-    'ini'                              : '',
-    'known_hosts'                      : '',
-    'ledger'                           : '',
-    'license'                          : '',
-    'LICENSE'                          : '',
-    'LICENSE.md'                       : '',
-    'LICENSE.txt'                      : '',
-    'Makefile'                         : '',
-    'makefile'                         : '',
-    'Makefile.ac'                      : '',
-    'Makefile.in'                      : '',
-    'mimeapps.list'                    : '',
-    'mix.lock'                         : '',
-    'node_modules'                     : '',
-    'package-lock.json'                : '',
-    'package.json'                     : '',
-    'playlists'                        : '',
-    'procfile'                         : '',
-    'Rakefile'                         : '',
-    'rakefile'                         : '',
-    'react.jsx'                        : '',
-    'README'                           : '',
-    'README.markdown'                  : '',
-    'README.md'                        : '',
-    'README.rst'                       : '',
-    'README.txt'                       : '',
-    'sxhkdrc'                          : '',
-    'user-dirs.dirs'                   : '',
-    'webpack.config.js'                : '',
-}
+def load_tables():
+  """(file_node_extensions, file_node_exact_matches, dir_node_exact_matches)"""
+  # Relative inside ranger's plugin package, flat with the plugin directory on sys.path
+  if __package__: from . import icon_table
+  else: import icon_table
+  return tuple(getattr(icon_table, name) for name in TABLE_NAMES)
+
+class IconResolver(object):
+  """Resolves file and directory names to glyphs.
+
+  The tables are normalized once: exact names match case-sensitively first,
+  then case-insensitively (so 'makefile' finds 'Makefile'), and extensions
+  are lowercased and may be compound ('tar.gz'), the longest suffix winning.
+
+  Most files take the fast path, memoized per extension: their lowercased
+  last extension ('py', 'rs') maps straight to the glyph, and that cache stays
+  as small as the set of extensions in use. The rest, names without an
+  extension and extensions that could also end a compound extension or a
+  case-folded exact name ('.gz', '.json'), are memoized per name in a
+  bounded cache in front of the full path, whose suffix search is cached
+  too. Either way a redraw costs a few dict lookups per file.
+  """
+
+  def __init__(self, extensions, file_exact_matches, dir_exact_matches,
+               file_default='', dir_default='', maxsize=1 << 16):
+    self.tables = (extensions, file_exact_matches, dir_exact_matches)
+    self.extensions = {ext.lower(): icon for ext, icon in extensions.items()}
+    self.suffix_parts = max(ext.count('.') for ext in self.extensions) + 1
+    self.file_exact, self.file_folded = self._fold(file_exact_matches)
+    self.dir_exact, self.dir_folded = self._fold(dir_exact_matches)
+    self.file_default = file_default
+    self.dir_default = dir_default
+    self.maxsize = maxsize
+    # Last extensions the fast path must not answer for
+    self.ambiguous = frozenset(
+      name.rpartition('.')[2] for name in list(self.extensions) + list(self.file_folded)
+      if '.' in name)
+    self._extension_cache = {}                   # 'py' -> glyph (fast path)
+    self._name_cache = {}                        # 'x.tar.gz' -> glyph (the rest)
+    self._suffix_cache = {}                      # 'tar.gz' -> glyph (full path)
+
+  @staticmethod
+  def _fold(exact_matches):
+    folded = {}
+    for name, icon in exact_matches.items():
+      folded.setdefault(name.lower(), icon)
+    return dict(exact_matches), folded
+
+  @staticmethod
+  def _remember(cache, key, icon, maxsize):
+    # Extensions are few; for names the clear bounds memory on huge listings
+    if len(cache) >= maxsize: cache.clear()
+    cache[key] = icon
+
+  def file_icon(self, path):
+    name = path.rpartition(os.sep)[2]
+    dot = name.rfind('.')
+    return self.basename_icon(name, name[dot + 1:].lower() if dot >= 0 else None)
+
+  def basename_icon(self, name, extension):
+    """file_icon() for a basename and its lowercased last extension, without
+    the dot (None if it has none), as ranger precomputes in file.extension"""
+    icon = self.file_exact.get(name)
+    if icon is not None: return icon
+    icon = self._extension_cache.get(extension)
+    if icon is not None: return icon
+    icon = self._name_cache.get(name)
+    if icon is None:
+      icon = self._resolve(name)
+      self._remember(self._name_cache, name, icon, self.maxsize)
+    return icon
+
+  def _resolve(self, name):
+    lower = name.lower()
+    icon = self.file_folded.get(lower)
+    if icon is not None: return icon
+
+    # Names without an extension ('script', '.zshrc') have no suffix to cache
+    dot = name.rfind('.')
+    if dot < 0: return self.file_default
+    if dot == 0: return self.extensions.get(lower[1:], self.file_default)
+
+    # Everything after the first of the last suffix_parts dots
+    suffix = lower[len(lower.rsplit('.', self.suffix_parts)[0]) + 1:]
+    icon = self._suffix_cache.get(suffix)
+    if icon is not None: return icon
+    icon = self.file_default
+    parts = suffix.split('.')
+    for start in range(len(parts)):
+      match = self.extensions.get('.'.join(parts[start:]))
+      if match is not None:
+        icon = match
+        break
+    self._remember(self._suffix_cache, suffix, icon, self.maxsize)
+    if lower[dot + 1:] not in self.ambiguous:
+      self._remember(self._extension_cache, lower[dot + 1:], icon, self.maxsize)
+    return icon
+
+  def dir_icon(self, path):
+    icon = self.dir_exact.get(path)
+    if icon is None: icon = self.dir_folded.get(path.lower(), self.dir_default)
+    return icon
+
+
+resolver = None
+
+def load_resolver():
+  global resolver
+  if resolver is None:
+    resolver = IconResolver(*load_tables())
+  return resolver
+
+def __getattr__(name):
+  # The tables used to be module globals; keep them reachable, loaded on demand
+  if name in TABLE_NAMES:
+    return load_resolver().tables[TABLE_NAMES.index(name)]
+  raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+def refresh_files(fm, files):
+  """Make ranger redraw files whose linemode text changed after they were drawn.
+
+  Safe to call from any thread. ranger keeps each drawn line in
+  file.display_data until the file is reloaded; dropping it and bumping the
+  directory's last_update_time makes the columns showing that directory
+  redraw on the UI thread's next pass through its loop (within idle_delay).
+  """
+  now = time.time()
+  for file in files:
+    file.display_data = {}
+    directory = fm.directories.get(file.dirname)
+    if directory is not None: directory.last_update_time = now
+
+def refresh_tree(fm, root):
+  """refresh_files() for every loaded directory at or below root"""
+  prefix = os.path.join(root, '')
+  for directory in list(fm.directories.values()):
+    if directory.files_all and (directory.path == root or directory.path.startswith(prefix)):
+      refresh_files(fm, directory.files_all)
 
 def devicon(file):
-  if file.is_directory: return dir_node_exact_matches.get(file.relative_path, '')
-  return file_node_exact_matches.get(os.path.basename(file.relative_path), file_node_extensions.get(file.extension, ''))
+  icons = resolver or load_resolver()
+  if file.is_directory: return icons.dir_icon(file.relative_path)
+  return icons.basename_icon(file.basename, file.extension)
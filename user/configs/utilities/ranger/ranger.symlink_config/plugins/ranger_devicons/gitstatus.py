@@ -0,0 +1,233 @@
+# coding=UTF-8
+# Git status for the devicons_git linemode.
+#
+# One `git status --porcelain -z` per repository answers every file in it:
+# the output is parsed into a dict of path -> status, and each lookup is a
+# dict access. A repository is only re-scanned when a directory in it is
+# visited again and its index or HEAD has changed (or the last scan is older
+# than the TTL, to pick up edits that don't touch the index). Scans run on a
+# background thread; a visit waits at most WAIT seconds for one, so large
+# repositories never stall a redraw. Lines drawn before a slower scan
+# finishes are redrawn when it changes the statuses.
+import functools
+import os
+import subprocess
+import threading
+import time
+
+from .devicons import refresh_tree
+
+__all__ = ['GitStatusCache', 'parse_porcelain', 'git_status']
+
+WAIT = 0.05
+TTL = 10.0
+
+# Marker shown beside the icon, by porcelain XY code
+UNTRACKED = '?'
+IGNORED = '!'
+CONFLICT = 'U'
+CONFLICT_CODES = frozenset(('DD', 'AU', 'UD', 'UA', 'DU', 'AA', 'UU'))
+
+# Directories show the most important status among their contents
+PRECEDENCE = {CONFLICT: 4, 'D': 3, 'M': 3, 'R': 3, 'C': 3, 'A': 2, 'T': 3, UNTRACKED: 1}
+
+def status_marker(code):
+  if code == '??': return UNTRACKED
+  if code == '!!': return IGNORED
+  if code in CONFLICT_CODES: return CONFLICT
+  # The worktree column wins: it is what differs on disk right now
+  return code[1] if code[1] != ' ' else code[0]
+
+def parse_porcelain(output):
+  """{relative path: marker} for `git status --porcelain -z` output (bytes)
+
+  Parent directories get the highest-precedence marker of their contents.
+  Untracked and ignored directories are listed as 'dir/' by git; they are
+  stored without the slash so files below them can inherit the marker.
+  """
+  statuses = {}
+  records = output.split(b'\0')
+  i = 0
+  while i < len(records):
+    record = records[i]
+    i += 1
+    if len(record) < 4: continue
+    code = record[:2].decode('ascii', 'replace')
+    path = os.fsdecode(record[3:]).rstrip('/')
+    if 'R' in code or 'C' in code: i += 1        # followed by the original path
+    marker = status_marker(code)
+    statuses[path] = marker
+
+    rank = PRECEDENCE.get(marker)
+    if rank is None: continue
+    parent = os.path.dirname(path)
+    while parent:
+      current = statuses.get(parent)
+      if current is not None and PRECEDENCE.get(current, 0) >= rank: break
+      statuses[parent] = marker
+      parent = os.path.dirname(parent)
+  return statuses
+
+def _git_dir(root):
+  dotgit = os.path.join(root, '.git')
+  if os.path.isdir(dotgit): return dotgit
+  # Worktrees and submodules: .git is a file pointing at the real directory
+  with open(dotgit) as f:
+    line = f.readline().strip()
+  if not line.startswith('gitdir:'): raise OSError('not a git directory: %s' % dotgit)
+  return os.path.normpath(os.path.join(root, line[len('gitdir:'):].strip()))
+
+def _common_dir(git_dir):
+  """Where refs live: a linked worktree's git_dir names it in 'commondir'"""
+  try:
+    with open(os.path.join(git_dir, 'commondir')) as f:
+      return os.path.normpath(os.path.join(git_dir, f.read().strip()))
+  except OSError:
+    return git_dir
+
+def _repo_key(git_dir, common_dir=None):
+  """Changes whenever the index is written or HEAD moves"""
+  try: index = os.stat(os.path.join(git_dir, 'index'))
+  except OSError: index = None                   # fresh repository
+  with open(os.path.join(git_dir, 'HEAD')) as f:
+    head = f.read().strip()
+  ref_mtime = None
+  if head.startswith('ref:'):
+    try: ref_mtime = os.stat(os.path.join(common_dir or git_dir, head[4:].strip())).st_mtime_ns
+    except OSError: pass
+  return (index and index.st_mtime_ns, index and index.st_size, head, ref_mtime)
+
+class _Repo(object):
+  __slots__ = ('root', 'git_dir', 'common_dir', 'key', 'statuses', 'inherited',
+               'scanned_at', 'scanning')
+
+  def __init__(self, root, git_dir):
+    self.root = root
+    self.git_dir = git_dir
+    self.common_dir = _common_dir(git_dir)
+    self.key = None
+    self.statuses = {}
+    self.inherited = {}
+    self.scanned_at = 0.0
+    self.scanning = None
+
+class GitStatusCache(object):
+  """Per-repository git status, refreshed at most once per directory visit.
+
+  on_scan(root), if set, is called from the scan thread whenever a scan
+  changes a repository's statuses.
+  """
+
+  def __init__(self, ttl=TTL, wait=WAIT, git='git', on_scan=None):
+    self.ttl = ttl
+    self.wait = wait
+    self.git = git
+    self.on_scan = on_scan
+    self.scans = 0
+    self._roots = {}
+    self._repos = {}
+    self._visited = None
+    self._lock = threading.Lock()
+
+  def find_root(self, directory):
+    """Work tree root containing directory, or None (cached per directory)"""
+    try: return self._roots[directory]
+    except KeyError: pass
+    path = directory
+    root = None
+    while True:
+      if os.path.exists(os.path.join(path, '.git')):
+        root = path
+        break
+      parent = os.path.dirname(path)
+      if parent == path: break
+      path = parent
+    self._roots[directory] = root
+    return root
+
+  def _repo(self, root):
+    repo = self._repos.get(root)
+    if repo is None:
+      try: repo = self._repos[root] = _Repo(root, _git_dir(root))
+      except OSError: return None
+    return repo
+
+  def visit(self, directory):
+    """Called for each drawn file; only a change of directory starts a check"""
+    if directory == self._visited: return
+    self._visited = directory
+    root = self.find_root(directory)
+    repo = root and self._repo(root)
+    if repo is None: return
+
+    try: key = _repo_key(repo.git_dir, repo.common_dir)
+    except OSError: return
+    if key == repo.key and time.monotonic() - repo.scanned_at < self.ttl: return
+    self._scan(repo)
+
+  def _scan(self, repo):
+    with self._lock:
+      if repo.scanning is not None: return
+      done = repo.scanning = threading.Event()
+    thread = threading.Thread(target=self._run_scan, args=(repo, done),
+                              name='devicons-git-status', daemon=True)
+    thread.start()
+    done.wait(self.wait)
+
+  def _run_scan(self, repo, done):
+    previous = repo.statuses
+    try:
+      output = subprocess.run(
+        [self.git, '-C', repo.root, 'status', '--porcelain=v1', '-z',
+         '--untracked-files=normal', '--ignored=matching'],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True).stdout
+      repo.statuses, repo.inherited = parse_porcelain(output), {}
+      # Taken afterwards: git status may itself rewrite a stale index
+      repo.key = _repo_key(repo.git_dir, repo.common_dir)
+      self.scans += 1
+    except (OSError, subprocess.CalledProcessError):
+      repo.statuses, repo.inherited = {}, {}
+    finally:
+      repo.scanned_at = time.monotonic()
+      repo.scanning = None
+      done.set()
+    if self.on_scan is not None and repo.statuses != previous:
+      self.on_scan(repo.root)
+
+  def status(self, path, directory=None):
+    """Marker for an absolute path ('' if clean, unknown or not in a repo)"""
+    if directory is None: directory = os.path.dirname(path)
+    root = self.find_root(directory)
+    repo = root and self._repos.get(root)
+    if repo is None or not repo.statuses: return ''
+
+    start = len(root) + 1 if root != os.sep else 1
+    marker = repo.statuses.get(path[start:])
+    if marker is not None: return marker
+    return self._inherited(repo, directory[start:])
+
+  def _inherited(self, repo, rel_dir):
+    """Untracked/ignored marker of the nearest such ancestor directory"""
+    inherited = repo.inherited
+    try: return inherited[rel_dir]
+    except KeyError: pass
+    marker = ''
+    parent = rel_dir
+    while parent and parent != os.curdir:
+      current = repo.statuses.get(parent)
+      if current in (UNTRACKED, IGNORED):
+        marker = current
+        break
+      parent = os.path.dirname(parent)
+    inherited[rel_dir] = marker
+    return marker
+
+statuses = GitStatusCache()
+
+def git_status(file):
+  # Lines are drawn with whatever is known; a scan that changes it redraws them
+  if statuses.on_scan is None: statuses.on_scan = functools.partial(refresh_tree, file.fm)
+  path = file.path
+  directory = os.path.dirname(path)
+  statuses.visit(directory)
+  return statuses.status(path, directory)
@@ -0,0 +1,184 @@
+# coding=UTF-8
+# Content-aware icons: the devicons_content linemode falls back to the first
+# bytes of a file (magic numbers, shebangs) so extensionless scripts,
+# dotfiles and misnamed files get a real icon.
+#
+# Files are sniffed on a small thread pool, never while drawing: the first
+# draw shows the name-based icon and queues the file; once it is sniffed,
+# ranger's cached line for it is dropped and the next pass of ranger's loop
+# redraws it with the new icon. Results are kept in
+# $XDG_CACHE_HOME/ranger_devicons, keyed by (device, inode, mtime, size), so
+# a file is read at most once across ranger sessions until it changes.
+import atexit
+import marshal
+import os
+import stat
+import threading
+
+from .devicons import CACHE_DIR, devicon, load_resolver, refresh_files
+
+__all__ = ['ContentSniffer', 'sniff', 'content_devicon']
+
+HEAD_SIZE = 512
+
+# Kinds are keys of the extension table, so they resolve to its glyphs
+MAGIC_NUMBERS = (
+  (b'\x89PNG\r\n\x1a\n', 'png'),
+  (b'GIF87a', 'gif'),
+  (b'GIF89a', 'gif'),
+  (b'\xff\xd8\xff', 'jpg'),
+  (b'%PDF-', 'pdf'),
+  (b'PK\x03\x04', 'zip'),
+  (b'\x1f\x8b', 'gz'),
+  (b'BZh', 'bz2'),
+  (b'\xfd7zXZ\x00', 'xz'),
+  (b"7z\xbc\xaf'\x1c", '7z'),
+  (b'\x28\xb5\x2f\xfd', 'zst'),
+  (b'SQLite format 3\x00', 'db'),
+  (b'\x7fELF', 'elf'),
+)
+
+# 'MZ' alone is too weak (any text can start with it): a PE executable's
+# DOS header points at a 'PE\0\0' signature through e_lfanew at 0x3C
+PE_SIGNATURE = b'PE\0\0'
+PE_MAX_OFFSET = 1 << 16
+
+INTERPRETERS = {
+  'python'  : 'py',
+  'sh'      : 'sh',
+  'bash'    : 'bash',
+  'dash'    : 'sh',
+  'ksh'     : 'sh',
+  'zsh'     : 'zsh',
+  'fish'    : 'fish',
+  'awk'     : 'awk',
+  'gawk'    : 'awk',
+  'node'    : 'js',
+  'deno'    : 'ts',
+  'ruby'    : 'rb',
+  'perl'    : 'pl',
+  'php'     : 'php',
+  'lua'     : 'lua',
+  'Rscript' : 'r',
+  'julia'   : 'jl',
+}
+
+def shebang_kind(head):
+  """Kind for a '#!' line: the interpreter, looking through /usr/bin/env"""
+  line = head[2:].split(b'\n', 1)[0].decode('utf-8', 'replace')
+  words = line.split()
+  if words and os.path.basename(words[0]) == 'env':
+    words = [w for w in words[1:] if not w.startswith('-') and '=' not in w]
+  if not words: return ''
+  interpreter = os.path.basename(words[0]).rstrip('0123456789.')
+  return INTERPRETERS.get(interpreter, '')
+
+def is_pe(f, head):
+  """Whether an 'MZ' file has the PE signature its DOS header points at"""
+  if len(head) < 0x40: return False
+  offset = int.from_bytes(head[0x3C:0x40], 'little')
+  if offset + len(PE_SIGNATURE) <= len(head):
+    return head[offset:offset + len(PE_SIGNATURE)] == PE_SIGNATURE
+  if offset > PE_MAX_OFFSET: return False
+  f.seek(offset)
+  return f.read(len(PE_SIGNATURE)) == PE_SIGNATURE
+
+def sniff(path, head_size=HEAD_SIZE):
+  """Kind of a file from its first bytes ('' if nothing is recognized)"""
+  with open(path, 'rb') as f:
+    head = f.read(head_size)
+    if head.startswith(b'#!'): return shebang_kind(head)
+    for magic, kind in MAGIC_NUMBERS:
+      if head.startswith(magic): return kind
+    if head.startswith(b'MZ') and is_pe(f, head): return 'exe'
+  return ''
+
+class ContentSniffer(object):
+  """Sniffed kinds keyed by (st_dev, st_ino, st_mtime_ns, st_size).
+
+  lookup() never touches the file: it answers from memory (loading the
+  persistent cache on first use) and queues unknown files for the pool.
+  The cache is written back at exit, merged with what other ranger
+  sessions saved, and trimmed to the newest max_entries.
+  """
+
+  def __init__(self, cache_path=os.path.join(CACHE_DIR, 'sniff.marshal'),
+               workers=4, head_size=HEAD_SIZE, max_entries=200000):
+    self.cache_path = cache_path
+    self.workers = workers
+    self.head_size = head_size
+    self.max_entries = max_entries
+    self.results = None
+    self.dirty = False
+    self._pending = set()
+    self._lock = threading.Lock()
+    self._executor = None
+
+  def _read_cache(self):
+    try:
+      with open(self.cache_path, 'rb') as blob:
+        results = marshal.loads(blob.read())
+      if isinstance(results, dict): return results
+    except (OSError, EOFError, ValueError, TypeError):
+      pass
+    return {}
+
+  def lookup(self, file):
+    """Sniffed kind of a ranger file, '' if unknown, None if not sniffed yet"""
+    st = getattr(file, 'stat', None)
+    if st is None or not stat.S_ISREG(st.st_mode): return ''
+    if self.results is None: self.results = self._read_cache()
+
+    key = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+    kind = self.results.get(key)
+    if kind is None: self._submit(key, file)
+    return kind
+
+  def _submit(self, key, file):
+    with self._lock:
+      if key in self._pending: return
+      self._pending.add(key)
+      if self._executor is None:
+        # Imported on first use: concurrent.futures alone adds ~10 ms to ranger startup
+        from concurrent.futures import ThreadPoolExecutor
+        self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix='devicons-sniff')
+        atexit.register(self.save)
+    self._executor.submit(self._sniff, key, file)
+
+  def _sniff(self, key, file):
+    try:
+      kind = sniff(file.path, self.head_size)
+    except OSError:
+      kind = ''
+    self.results[key] = kind
+    self.dirty = True
+    with self._lock:
+      self._pending.discard(key)
+    # It was drawn with the name-based icon; nothing else would redraw it
+    fm = getattr(file, 'fm', None)
+    if kind and fm is not None: refresh_files(fm, (file,))
+
+  def save(self):
+    if not self.dirty: return
+    results = self._read_cache()
+    results.update(self.results)
+    if len(results) > self.max_entries:
+      results = dict(list(results.items())[-self.max_entries:])
+    try:
+      os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+      tmp = '%s.%d.tmp' % (self.cache_path, os.getpid())
+      with open(tmp, 'wb') as blob:
+        marshal.dump(results, blob)
+      os.replace(tmp, self.cache_path)
+      self.dirty = False
+    except OSError:
+      pass
+
+sniffer = ContentSniffer()
+
+def content_devicon(file):
+  icon = devicon(file)
+  if file.is_directory: return icon
+  kind = sniffer.lookup(file)
+  if not kind: return icon
+  return load_resolver().extensions.get(kind, icon)